@@ -37,6 +37,7 @@ class TradingConfig:
     pm_start_pct_no_dca: float = 5.0
     pm_start_pct_with_dca: float = 2.5
     trailing_gap_pct: float = 0.5
+    quote_ttl_seconds: float = 1.0
     default_timeframe: str = "1hour"
     timeframes: List[str] = None
     candles_limit: int = 120
@@ -288,6 +289,9 @@ class ConfigValidator:
         if not 0.1 <= config.trailing_gap_pct <= 5.0:
             errors.append("trailing_gap_pct must be between 0.1% and 5.0")
 
+        if not 0.0 <= config.quote_ttl_seconds <= 60.0:
+            errors.append("quote_ttl_seconds must be between 0 and 60")
+
         if config.default_timeframe not in config.timeframes:
             errors.append(f"default_timeframe must be one of {config.timeframes}")
 
@@ -11,12 +11,308 @@ License: Apache 2.0
 """
 
 import sqlite3
+import threading
+import time
+from contextlib import closing
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, nogil=True, parallel=True, fastmath=True)
+    def _correlation_kernel(returns: np.ndarray) -> np.ndarray:
+        """
+        Pearson correlation of every column pair of a (T, N) returns array.
+
+        Compiled with nogil=True so concurrent callers (threads, or
+        ``loop.run_in_executor(None, _correlation, returns)`` from async code)
+        do not serialize on the GIL; the pair loop is spread across cores.
+        """
+        n_obs, n = returns.shape
+        means = np.empty(n)
+        norms = np.empty(n)
+        for c in prange(n):
+            total = 0.0
+            for t in range(n_obs):
+                total += returns[t, c]
+            mean = total / n_obs
+            sq = 0.0
+            for t in range(n_obs):
+                d = returns[t, c] - mean
+                sq += d * d
+            means[c] = mean
+            norms[c] = np.sqrt(sq)
+
+        n_pairs = n * (n - 1) // 2
+        pair_i = np.empty(n_pairs, np.int64)
+        pair_j = np.empty(n_pairs, np.int64)
+        k = 0
+        for i in range(n):
+            for j in range(i + 1, n):
+                pair_i[k] = i
+                pair_j[k] = j
+                k += 1
+
+        out = np.eye(n)
+        for k in prange(n_pairs):
+            i = pair_i[k]
+            j = pair_j[k]
+            denom = norms[i] * norms[j]
+            r = 0.0
+            if denom > 0.0:
+                cov = 0.0
+                for t in range(n_obs):
+                    cov += (returns[t, i] - means[i]) * (returns[t, j] - means[j])
+                r = cov / denom
+            out[i, j] = r
+            out[j, i] = r
+        return out
+
+
+# Largest portfolio width that gets a fully unrolled, specialized kernel.
+# Unrolled kernels are exec'd, so numba cannot cache them on disk and every
+# process compiles its own; compile time grows with the pair count (about 1 s
+# at 8 columns, 7 s at 16), so wider portfolios stay on the cached kernel.
+_MAX_UNROLLED_N = 8
+_specialized_kernels: Dict[int, object] = {}
+_compiling: set = set()
+_compiling_lock = threading.Lock()
+
+
+def _make_correlation_kernel(n: int):
+    """
+    Generate and JIT-compile a correlation kernel unrolled for ``n`` columns.
+
+    Every mean and pair accumulator becomes a named local, so the compiler
+    can keep them in registers and the observation loop has no inner loops.
+    """
+    cols = range(n)
+    pairs = [(i, j) for i in cols for j in cols if i <= j]
+    lines = [f"def _correlation_n{n}(r):", "    n_obs = r.shape[0]"]
+    lines += [f"    m{i} = 0.0" for i in cols]
+    lines.append("    for t in range(n_obs):")
+    lines += [f"        m{i} += r[t, {i}]" for i in cols]
+    lines += [f"    m{i} /= n_obs" for i in cols]
+    lines += [f"    s{i}_{j} = 0.0" for i, j in pairs]
+    lines.append("    for t in range(n_obs):")
+    lines += [f"        d{i} = r[t, {i}] - m{i}" for i in cols]
+    lines += [f"        s{i}_{j} += d{i} * d{j}" for i, j in pairs]
+    lines.append(f"    out = np.eye({n})")
+    lines += [f"    n{i} = np.sqrt(s{i}_{i})" for i in cols]
+    for i, j in pairs:
+        if i == j:
+            continue
+        lines.append(f"    if n{i} * n{j} > 0.0:")
+        lines.append(f"        out[{i}, {j}] = s{i}_{j} / (n{i} * n{j})")
+        lines.append(f"        out[{j}, {i}] = out[{i}, {j}]")
+    lines.append("    return out")
+
+    namespace = {"np": np}
+    exec("\n".join(lines), namespace)
+    # Explicit signature: compiled here rather than on the first call
+    return njit("f8[:, ::1](f8[:, ::1])", nogil=True, fastmath=True)(
+        namespace[f"_correlation_n{n}"]
+    )
+
+
+def _compile_kernel(n: int) -> None:
+    """
+    Build the unrolled kernel for ``n`` columns and publish it when ready.
+    If compiling fails, ``n`` stays marked and keeps using the generic kernel.
+    """
+    _specialized_kernels[n] = _make_correlation_kernel(n)
+    with _compiling_lock:
+        _compiling.discard(n)
+
+
+def _start_compile(n: int) -> None:
+    """Compile the unrolled kernel for ``n`` columns on a background thread, once."""
+    with _compiling_lock:
+        if n in _compiling or n in _specialized_kernels:
+            return
+        _compiling.add(n)
+    threading.Thread(
+        target=_compile_kernel, args=(n,), name=f"corr-jit-{n}", daemon=True
+    ).start()
+
+
+def _correlation_numpy(returns: np.ndarray) -> np.ndarray:
+    """Vectorized NumPy fallback for ``_correlation_kernel``."""
+    centered = returns - returns.mean(axis=0)
+    norms = np.sqrt((centered * centered).sum(axis=0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = (centered.T @ centered) / np.outer(norms, norms)
+    out[~np.isfinite(out)] = 0.0
+    np.fill_diagonal(out, 1.0)
+    return out
+
+
+def _correlation(returns: np.ndarray) -> np.ndarray:
+    """Correlation matrix of a (T, N) returns array, JIT-compiled when available."""
+    if not NUMBA_AVAILABLE:
+        return _correlation_numpy(returns)
+
+    returns = np.ascontiguousarray(returns, dtype=np.float64)
+    n = returns.shape[1]
+    if not 2 <= n <= _MAX_UNROLLED_N:
+        return _correlation_kernel(returns)
+    kernel = _specialized_kernels.get(n)
+    if kernel is not None:
+        return kernel(returns)
+    # Served by the cached kernel; the unrolled one is compiled afterwards
+    out = _correlation_kernel(returns)
+    _start_compile(n)
+    return out
+
+
+def _cutoff(days: int) -> str:
+    """
+    Return the UTC timestamp ``days`` ago as a bindable SQL parameter.
+
+    trade_exits.timestamp is stored as ISO-8601 text ("YYYY-MM-DD HH:MM:SS",
+    the same format as SQLite's datetime('now')), so lexical comparison
+    against this string matches temporal order and the timestamp index can
+    be range-scanned.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    return cutoff.replace(tzinfo=None).isoformat(sep=" ", timespec="seconds")
+
+
+# Rows pulled per fetchmany() call when streaming price data
+_FETCH_BATCH = 1024
+
+# Seconds a diversification check may reuse the portfolio returns fetched
+# by the last correlation call instead of refetching them
+_RETURNS_CACHE_TTL = 10.0
+
+
+def _fetch_price_rows(
+    cursor: sqlite3.Cursor,
+    where: str,
+    params: Tuple,
+    order: str = "timestamp",
+    limit: Optional[int] = None,
+    min_rows: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Stream (timestamp, symbol, close_price) rows from trade_exits into arrays.
+
+    A COUNT(*) preflight sizes the buffers up front and rows are copied in
+    ``fetchmany`` batches, so no full list of row tuples is materialized.
+    The buffers grow geometrically if rows arrive after the count.
+
+    When ``min_rows`` is given, symbols with fewer matching rows are
+    filtered out in SQL and never transferred.
+
+    Returns:
+        Tuple of (timestamps, symbols, close prices) arrays
+    """
+    if min_rows is None:
+        cursor.execute(f"SELECT COUNT(*) FROM trade_exits WHERE {where}", params)
+        sql = f"SELECT timestamp, symbol, close_price FROM trade_exits WHERE {where}"
+    else:
+        counts = f"""
+            WITH counts AS (
+                SELECT symbol, COUNT(*) AS c
+                FROM trade_exits
+                WHERE {where}
+                GROUP BY symbol
+                HAVING COUNT(*) >= ?
+            )"""
+        cursor.execute(f"{counts} SELECT COALESCE(SUM(c), 0) FROM counts", (*params, min_rows))
+        sql = f"""{counts}
+            SELECT timestamp, symbol, close_price
+            FROM trade_exits JOIN counts USING (symbol)
+            WHERE {where}"""
+        params = (*params, min_rows, *params)
+    expected = cursor.fetchone()[0]
+    sql += f" ORDER BY {order}"
+    if limit is not None:
+        expected = min(expected, limit)
+        sql += f" LIMIT {int(limit)}"
+
+    timestamps = np.empty(expected, dtype=object)
+    symbols = np.empty(expected, dtype=object)
+    prices = np.empty(expected, dtype=np.float64)
+
+    cursor.arraysize = _FETCH_BATCH
+    cursor.execute(sql, params)
+    n = 0
+    while True:
+        rows = cursor.fetchmany()
+        if not rows:
+            break
+        end = n + len(rows)
+        if end > len(prices):
+            size = max(end, 2 * len(prices))
+            timestamps = np.resize(timestamps, size)
+            symbols = np.resize(symbols, size)
+            prices = np.resize(prices, size)
+        batch_ts, batch_symbols, batch_prices = zip(*rows)
+        timestamps[n:end] = batch_ts
+        symbols[n:end] = batch_symbols
+        prices[n:end] = batch_prices
+        n = end
+
+    return timestamps[:n], symbols[:n], prices[:n]
+
+
+def _aligned_returns(
+    timestamps: np.ndarray,
+    row_symbols: np.ndarray,
+    close_prices: np.ndarray,
+    symbols: List[str],
+    min_data_points: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pivot (timestamp, symbol, price) rows into a returns array.
+
+    Only symbols with at least ``min_data_points`` prices are kept, and only
+    timestamps where all kept symbols have a price are used.
+
+    Returns:
+        Tuple of ((T, k) returns array, indices of the k kept columns in
+        symbols, sorted price timestamps the returns were computed from)
+    """
+    position = {symbol: i for i, symbol in enumerate(symbols)}
+    ts_values, ts_index = np.unique(timestamps, return_inverse=True)
+    col_index = np.fromiter(
+        (position[symbol] for symbol in row_symbols), np.int64, len(row_symbols)
+    )
+
+    prices = np.full((len(ts_values), len(symbols)), np.nan)
+    prices[ts_index, col_index] = np.asarray(close_prices, dtype=np.float64)
+
+    columns = np.flatnonzero((~np.isnan(prices)).sum(axis=0) >= min_data_points)
+    prices = prices[:, columns]
+    complete = ~np.isnan(prices).any(axis=1)
+    prices = prices[complete]
+    ts_values = ts_values[complete]
+    if len(prices) < 2:
+        return np.empty((0, len(columns))), columns, ts_values
+    return prices[1:] / prices[:-1] - 1.0, columns, ts_values
+
+
+def _matrix_to_dict(matrix: np.ndarray, index: List[str]) -> Dict[str, Dict[str, float]]:
+    """Convert a correlation array to the legacy symbol_a -> {symbol_b: value} form."""
+    result = {}
+    for i, symbol in enumerate(index):
+        row = dict(zip(index, matrix[i].tolist()))
+        row.pop(symbol, None)
+        result[symbol] = row
+    return result
+
 
 @dataclass
 class CorrelationMetrics:
@@ -40,6 +336,7 @@ class CorrelationAlert:
     threshold: float
     timestamp: datetime
     alert_type: str  # HIGH_CORRELATION, DIVERSIFICATION_ALERT
+    timeframe: str = ""
 
 
 class CorrelationAnalyzer:
@@ -54,98 +351,123 @@ class CorrelationAnalyzer:
         """
         self.db_path = db_path
         self.conn = None
-        self.cursor = None
+        self._returns_cache: Dict[Tuple, Tuple[float, Tuple]] = {}
 
         # Connect to database
         self._connect()
 
-    def _connect(self) -> None:
-        """Connect to SQLite database."""
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Connect to SQLite database, reusing the open connection if any."""
+        if self.conn is not None:
+            return self.conn
         try:
             self.conn = sqlite3.connect(self.db_path)
-            self.cursor = self.conn.cursor()
         except Exception as e:
             print(f"[CorrelationAnalyzer] Error connecting to database: {e}")
             self.conn = None
-            self.cursor = None
+        return self.conn
 
-    def calculate_correlation_matrix(
-        self, symbols: List[str], timeframe_days: int = 30, min_data_points: int = 20
-    ) -> Dict[str, Dict[str, float]]:
+    def _cursor(self) -> sqlite3.Cursor:
+        """Return a fresh cursor on the shared connection."""
+        return self._connect().cursor()
+
+    def calculate_correlation_array(
+        self,
+        symbols: List[str],
+        timeframe_days: int = 30,
+        min_data_points: int = 20,
+        dtype=np.float64,
+    ) -> Tuple[np.ndarray, List[str]]:
         """
-        Calculate correlation matrix between all symbol pairs.
+        Calculate the correlation matrix as a NumPy array.
+
+        Prices for every symbol are fetched in one query, aligned on timestamp
+        and converted to returns; the pairwise correlations are then computed
+        by a single kernel call over the (observations x symbols) array.
+        Symbols without enough history keep a correlation of 0.0.
 
         Args:
             symbols: List of trading symbols (e.g., ['BTC', 'ETH', 'SOL'])
             timeframe_days: Number of days of data to analyze
             min_data_points: Minimum data points required
+            dtype: Element type of the returned array (e.g. np.float32 for display)
 
         Returns:
-            Dictionary of symbol_a -> {symbol_b: correlation}
+            Tuple of (N x N correlation array, symbol order of its rows/columns)
         """
-        if not self.cursor:
-            self._connect()
+        symbols = list(symbols)
+        matrix = np.eye(len(symbols), dtype=dtype)
+        if len(symbols) < 2:
+            return matrix, symbols
 
-        correlation_matrix = {}
+        try:
+            returns, columns, _ = self._portfolio_returns(
+                symbols, timeframe_days, min_data_points, use_cache=False
+            )
+            if len(columns) >= 2 and len(returns) >= min_data_points:
+                matrix[np.ix_(columns, columns)] = _correlation(returns)
 
-        for i, symbol_a in enumerate(symbols):
-            correlation_matrix[symbol_a] = {}
-            for j, symbol_b in enumerate(symbols):
-                if i == j:
-                    continue
+        except Exception as e:
+            print(f"[CorrelationAnalyzer] Error calculating correlation matrix: {e}")
 
-                try:
-                    # Query historical price data
-                    query = f"""
-                        SELECT timestamp, close_price
-                        FROM trade_exits
-                        WHERE symbol = '{symbol_a}'
-                           AND timestamp >= datetime('now', '-{timeframe_days} days')
-                        ORDER BY timestamp DESC
-                        LIMIT {min_data_points}
-                    """
-
-                    self.cursor.execute(query, (timeframe_days,))
-
-                    # Query for symbol_b
-                    self.cursor.execute(query, (timeframe_days,))
-
-                    # Merge data and calculate correlation
-                    df_a = pd.DataFrame(
-                        self.cursor.fetchall(), columns=["timestamp", "close_price"]
-                    )
-                    df_b = pd.DataFrame(
-                        self.cursor.fetchall(), columns=["timestamp", "close_price"]
-                    )
+        return matrix, symbols
 
-                    # Merge on timestamps
-                    df_merged = pd.merge(df_a, df_b, on="timestamp", how="inner")
-                    df_merged = df_merged.dropna()
-
-                    # Calculate correlation if enough data
-                    if len(df_merged) >= min_data_points:
-                        # Calculate returns
-                        df_a_pct = df_a["close_price"].pct_change().dropna()
-                        df_b_pct = df_b["close_price"].pct_change().dropna()
-
-                        # Calculate correlation
-                        correlation = df_a_pct["close_price"].corr(
-                            df_b_pct["close_price"]
-                        )
-
-                        correlation_matrix[symbol_a][symbol_b] = (
-                            correlation if not pd.isna(correlation) else 0.0
-                        )
-                    else:
-                        correlation_matrix[symbol_a][symbol_b] = 0.0
-
-                except Exception as e:
-                    print(
-                        f"[CorrelationAnalyzer] Error calculating correlation between {symbol_a} and {symbol_b}: {e}"
-                    )
-                    correlation_matrix[symbol_a][symbol_b] = 0.0
+    def _portfolio_returns(
+        self,
+        symbols: List[str],
+        timeframe_days: int,
+        min_data_points: int,
+        use_cache: bool = True,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Fetch and align returns for ``symbols``, remembering the result.
+
+        Every fetch is remembered for a short TTL so a diversification check
+        right after a correlation call (``use_cache=True``) fetches only the
+        candidate symbol's prices. Correlation calls pass ``use_cache=False``
+        and always read the database.
+
+        Returns:
+            Tuple of (returns, kept column indices, price timestamps) as
+            produced by ``_aligned_returns``
+        """
+        key = (tuple(symbols), timeframe_days, min_data_points)
+        cached = self._returns_cache.get(key) if use_cache else None
+        if cached and time.monotonic() - cached[0] < _RETURNS_CACHE_TTL:
+            return cached[1]
+
+        placeholders = ",".join("?" * len(symbols))
+        with closing(self._cursor()) as c:
+            timestamps, row_symbols, close_prices = _fetch_price_rows(
+                c,
+                f"symbol IN ({placeholders}) AND timestamp >= ?",
+                (*symbols, _cutoff(timeframe_days)),
+                min_rows=min_data_points,
+            )
+        result = _aligned_returns(
+            timestamps, row_symbols, close_prices, symbols, min_data_points
+        )
+        self._returns_cache = {key: (time.monotonic(), result)}
+        return result
+
+    def calculate_correlation_matrix(
+        self, symbols: List[str], timeframe_days: int = 30, min_data_points: int = 20
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Calculate correlation matrix between all symbol pairs.
+
+        Args:
+            symbols: List of trading symbols (e.g., ['BTC', 'ETH', 'SOL'])
+            timeframe_days: Number of days of data to analyze
+            min_data_points: Minimum data points required
 
-        return correlation_matrix
+        Returns:
+            Dictionary of symbol_a -> {symbol_b: correlation}
+        """
+        matrix, index = self.calculate_correlation_array(
+            symbols, timeframe_days, min_data_points
+        )
+        return _matrix_to_dict(matrix, index)
 
     def get_current_correlations(
         self, symbols: List[str], threshold: float = 0.8, lookback_days: int = 30
@@ -161,9 +483,6 @@ class CorrelationAnalyzer:
         Returns:
             List of correlation alerts for high correlations
         """
-        if not self.cursor:
-            self._connect()
-
         alerts = []
 
         # Calculate current correlations
@@ -205,37 +524,38 @@ class CorrelationAnalyzer:
         Returns:
             DataFrame with historical correlation data
         """
-        if not self.cursor:
-            self._connect()
-
         try:
-            # Query historical price data
-            query = f"""
-                        SELECT timestamp, close_price
-                        FROM trade_exits
-                        WHERE symbol IN ('{symbol_a}', '{symbol_b}')
-                           AND timestamp >= datetime('now', '-{period_days} days')
-                        ORDER BY timestamp DESC
-                        LIMIT 1000
-                    """
-
-            self.cursor.execute(query, (period_days,))
-
-            # Get both datasets
-            df_a = pd.DataFrame(
-                self.cursor.fetchall(), columns=["timestamp", "close_price"]
-            )
-            df_b = pd.DataFrame(
-                self.cursor.fetchall(), columns=["timestamp", "close_price"]
-            )
+            # Query historical price data for both symbols
+            with closing(self._cursor()) as c:
+                timestamps, row_symbols, close_prices = _fetch_price_rows(
+                    c,
+                    "symbol IN (?, ?) AND timestamp >= ?",
+                    (symbol_a, symbol_b, _cutoff(period_days)),
+                    order="timestamp DESC",
+                    limit=1000,
+                )
 
-            # Merge on timestamps
-            df_merged = pd.merge(df_a, df_b, on="timestamp", how="inner")
-            df_merged = df_merged.dropna()
+            # Align on timestamps
+            prices = pd.DataFrame(
+                {
+                    "timestamp": timestamps,
+                    "symbol": row_symbols,
+                    "close_price": close_prices,
+                }
+            ).pivot_table(index="timestamp", columns="symbol", values="close_price")
+            prices = prices.reindex(columns=[symbol_a, symbol_b]).dropna()
+
+            df_merged = pd.DataFrame(
+                {
+                    "timestamp": prices.index,
+                    "close_a": prices[symbol_a].to_numpy(),
+                    "close_b": prices[symbol_b].to_numpy(),
+                }
+            )
 
             # Calculate returns for each period
-            df_merged["return_a"] = df_merged["close_price"].pct_change()
-            df_merged["return_b"] = df_merged["close_price"].pct_change()
+            df_merged["return_a"] = df_merged["close_a"].pct_change()
+            df_merged["return_b"] = df_merged["close_b"].pct_change()
 
             # Calculate rolling correlation
             result = df_merged.copy()
@@ -268,35 +588,69 @@ class CorrelationAnalyzer:
         Returns:
             Alert if correlation threshold would be exceeded
         """
-        if not self.cursor:
-            self._connect()
-
+        timeframe_days, min_data_points = 30, 20
         try:
-            # Calculate correlations with new symbol
-            test_symbols = portfolio_symbols + [new_symbol]
-            correlation_matrix = self.calculate_correlation_matrix(test_symbols, 30)
+            # Portfolio returns come from the cache when the matrix was just built
+            portfolio_symbols = list(portfolio_symbols)
+            returns, columns, price_times = self._portfolio_returns(
+                portfolio_symbols, timeframe_days, min_data_points
+            )
+            if len(columns) == 0 or len(price_times) < 2:
+                return None
+
+            # Only the new symbol's prices are fetched
+            with closing(self._cursor()) as c:
+                timestamps, _, close_prices = _fetch_price_rows(
+                    c,
+                    "symbol = ? AND timestamp >= ?",
+                    (new_symbol, _cutoff(timeframe_days)),
+                    min_rows=min_data_points,
+                )
+
+            new_prices = np.full(len(price_times), np.nan)
+            pos = np.searchsorted(price_times, timestamps)
+            hit = pos < len(price_times)
+            hit[hit] = price_times[pos[hit]] == timestamps[hit]
+            new_prices[pos[hit]] = close_prices[hit]
+
+            valid = ~np.isnan(new_prices[1:]) & ~np.isnan(new_prices[:-1])
+            n_obs = int(valid.sum())
+            if n_obs < min_data_points:
+                return None
+
+            returns_new = new_prices[1:][valid] / new_prices[:-1][valid] - 1.0
+            returns_portfolio = returns[valid]
+
+            # Correlation of the new column against every portfolio column
+            std_p = returns_portfolio.std(axis=0, ddof=1)
+            std_n = returns_new.std(ddof=1)
+            if std_n == 0:
+                return None
+            with np.errstate(divide="ignore", invalid="ignore"):
+                z_p = (returns_portfolio - returns_portfolio.mean(axis=0)) / std_p
+            z_p[:, std_p == 0] = 0.0
+            z_n = (returns_new - returns_new.mean()) / std_n
+            correlations = np.einsum("ti,t->i", z_p, z_n) / (n_obs - 1)
 
             # Check if new symbol correlates too highly with any existing symbol
-            for existing_symbol in portfolio_symbols:
-                correlation = correlation_matrix[new_symbol].get(existing_symbol, 0.0)
-                if correlation and correlation >= correlation_threshold:
-                    alert = CorrelationAlert(
-                        symbol_a=new_symbol,
-                        symbol_b=existing_symbol,
-                        correlation=correlation,
-                        threshold=correlation_threshold,
-                        timestamp=datetime.now(),
-                        timeframe="30 days",
-                        alert_type="DIVERSIFICATION_ALERT",
-                    )
-                    self._close()
-                    return alert
+            exceeded = np.flatnonzero(correlations >= correlation_threshold)
+            if len(exceeded):
+                k = exceeded[0]
+                return CorrelationAlert(
+                    symbol_a=new_symbol,
+                    symbol_b=portfolio_symbols[columns[k]],
+                    correlation=float(correlations[k]),
+                    threshold=correlation_threshold,
+                    timestamp=datetime.now(),
+                    timeframe=f"{timeframe_days} days",
+                    alert_type="DIVERSIFICATION_ALERT",
+                )
 
         except Exception as e:
             print(
                 f"[CorrelationAnalyzer] Error checking diversification for {new_symbol}: {e}"
             )
-            return None
+        return None
 
     def log_correlation_metrics(self, metrics: List[CorrelationMetrics]) -> None:
         """
@@ -305,27 +659,25 @@ class CorrelationAnalyzer:
         Args:
             metrics: List of correlation metrics to log
         """
-        if not self.cursor:
-            self._connect()
-
         try:
-            for metric in metrics:
-                self.cursor.execute(
-                    f"""
-                    INSERT INTO correlation_history
-                    (symbol_a, symbol_b, correlation, p_value, timestamp, timeframe, alert_type)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        metric.symbol_a,
-                        metric.symbol_b,
-                        metric.correlation,
-                        metric.p_value,
-                        metric.timestamp,
-                        metric.timeframe,
-                        metric.alert_type,
-                    ),
-                )
+            with closing(self._cursor()) as c:
+                for metric in metrics:
+                    c.execute(
+                        f"""
+                        INSERT INTO correlation_history
+                        (symbol_a, symbol_b, correlation, p_value, timestamp, timeframe, alert_type)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                        (
+                            metric.symbol_a,
+                            metric.symbol_b,
+                            metric.correlation,
+                            metric.p_value,
+                            metric.timestamp,
+                            metric.timeframe,
+                            metric.alert_type,
+                        ),
+                    )
 
             self.conn.commit()
 
@@ -337,7 +689,6 @@ class CorrelationAnalyzer:
         if self.conn:
             self.conn.close()
             self.conn = None
-            self.cursor = None
 
 
 def calculate_portfolio_correlation(
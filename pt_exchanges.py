@@ -26,15 +26,59 @@ Usage:
 import time
 import hmac
 import hashlib
+import asyncio
+import atexit
+import os
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, NamedTuple, Optional, Tuple, Any
 from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlparse
 import argparse
 import json
-import statistics
+import numpy as np
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit: the kernels below run as plain Python."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 
 class ExchangeType(Enum):
@@ -43,7 +87,7 @@ class ExchangeType(Enum):
     COINBASE = "coinbase"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Ticker:
     exchange: str
     symbol: str
@@ -54,8 +98,7 @@ class Ticker:
     timestamp: datetime
 
 
-@dataclass
-class OHLCV:
+class OHLCV(NamedTuple):
     timestamp: int
     open: float
     high: float
@@ -68,45 +111,421 @@ class OHLCV:
         return datetime.fromtimestamp(self.timestamp)
 
 
-@dataclass
+# eq=False: field-wise == / hash would hit the arrays and raise, so books
+# compare and hash by identity
+@dataclass(slots=True, frozen=True, eq=False)
 class OrderBook:
     exchange: str
     symbol: str
-    bids: List[Tuple[float, float]]  # [(price, quantity), ...]
-    asks: List[Tuple[float, float]]
+    bids: np.ndarray  # (N, 2) float64: [[price, quantity], ...], best first
+    asks: np.ndarray
     timestamp: datetime
 
 
-class ExchangeBase(ABC):
+TIMEFRAME_SECONDS = {
+    "1min": 60,
+    "5min": 300,
+    "15min": 900,
+    "30min": 1800,
+    "1hour": 3600,
+    "2hour": 7200,
+    "4hour": 14400,
+    "8hour": 28800,
+    "12hour": 43200,
+    "1day": 86400,
+    "1week": 604800,
+}
+
+
+# Column order of candle arrays returned by get_candles_np()
+CANDLE_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+
+def _candle_array(rows: List[list], columns: Tuple[int, ...]) -> np.ndarray:
+    """
+    Build an ascending (N, 6) float64 candle array from raw exchange rows.
+
+    ``columns`` gives the row index of each CANDLE_COLUMNS field; string
+    fields are converted by NumPy in a single pass.
+    """
+    if not rows:
+        return np.empty((0, len(CANDLE_COLUMNS)), dtype=np.float64)
+    arr = np.array([row[:6] for row in rows], dtype=np.float64)[:, columns]
+    if arr[0, 0] > arr[-1, 0]:
+        arr = arr[::-1]  # KuCoin/Coinbase return newest first
+    if np.any(arr[1:, 0] < arr[:-1, 0]):
+        arr = arr[np.argsort(arr[:, 0], kind="stable")]
+    return arr
+
+
+def _parse_binance_klines(rows: List[list]) -> np.ndarray:
+    """
+    Binance kline rows -> candle array: first six columns, open time ms -> s.
+
+    Rows are converted through one object array so the string-to-float step
+    runs inside NumPy rather than a per-row Python loop.
+    """
+    if not len(rows):
+        return np.empty((0, len(CANDLE_COLUMNS)), dtype=np.float64)
+    out = np.asarray(rows, dtype=object)[:, :6].astype(np.float64)
+    out[:, 0] //= 1000
+    return out
+
+
+@njit(cache=True)
+def _detect_arb_nb(prices: np.ndarray) -> Tuple[int, int, float]:
+    """Single pass over exchange prices: (argmin, argmax, spread % of the low)."""
+    lo_i = 0
+    hi_i = 0
+    for i in range(1, prices.shape[0]):
+        if prices[i] < prices[lo_i]:
+            lo_i = i
+        if prices[i] >= prices[hi_i]:
+            hi_i = i
+    lo = prices[lo_i]
+    spread_pct = (prices[hi_i] - lo) / lo * 100.0 if lo > 0 else 0.0
+    return lo_i, hi_i, spread_pct
+
+
+def normalize_ohlc(arr: np.ndarray) -> np.ndarray:
+    """High/low/close relative to open: (N, 4) array of [1, H/O, L/O, C/O]."""
+    return arr[:, 1:5] / arr[:, 1:2]
+
+
+def body_ratio(arr: np.ndarray) -> np.ndarray:
+    """Candle body as a fraction of its range, (C - O) / (H - L); 0 for flat candles."""
+    rng = arr[:, 2] - arr[:, 3]
+    body = arr[:, 4] - arr[:, 1]
+    out = np.zeros(len(arr))
+    np.divide(body, rng, out=out, where=rng != 0)
+    return out
+
+
+def _parse_levels(levels: List[list], depth: int) -> np.ndarray:
+    """
+    Convert raw [price, qty, ...] order-book levels to an (N, 2) float64 array.
+
+    All prices and quantities are converted by one np.fromiter pass over the
+    flattened levels, with no per-level tuples or boxed floats.
+    """
+    levels = levels[:depth]
+    flat = np.fromiter(
+        (x for level in levels for x in level[:2]),
+        dtype=np.float64,
+        count=2 * len(levels),
+    )
+    return flat.reshape(-1, 2)
+
+
+@lru_cache(maxsize=1024)
+def _join_symbol(coin: str, quote: str, sep: str) -> str:
+    """Exchange pair symbol, memoized and shared by every exchange instance."""
+    return f"{coin.upper()}{sep}{quote.upper()}"
+
+
+class FileCache:
+    """
+    File-backed TTL cache for exchange GET responses.
+
+    Entries live at ``.cache/{exchange}/{endpoint}/{md5(url, params)}.json``
+    as a ``{"ts": ..., "ttl": ..., "data": ...}`` envelope, so repeat calls
+    (including across CLI invocations) skip the network while fresh.
+    """
+
+    CACHE_DIR = Path(".cache")
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else self.CACHE_DIR
+
+    def _path(self, exchange: str, url: str, params: Optional[dict]) -> Path:
+        endpoint = urlparse(url).path.strip("/").replace("/", "_") or "root"
+        key = json.dumps([url, sorted((params or {}).items())], default=str)
+        digest = hashlib.md5(key.encode()).hexdigest()
+        return self.cache_dir / exchange / endpoint / f"{digest}.json"
+
+    def get(self, exchange: str, url: str, params: Optional[dict], ttl: float) -> Any:
+        """Return the cached response, or None if missing or older than ttl."""
+        try:
+            envelope = _json_loads(self._path(exchange, url, params).read_bytes())
+        except (OSError, ValueError):
+            return None
+        if time.time() - envelope.get("ts", 0) < ttl:
+            return envelope.get("data")
+        return None
+
+    def set(
+        self, exchange: str, url: str, params: Optional[dict], ttl: float, data: Any
+    ) -> None:
+        path = self._path(exchange, url, params)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"ts": time.time(), "ttl": ttl, "data": data}))
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+
+# One pooled async client per (event loop, exchange host), so keep-alive
+# connections survive across fan-outs instead of re-doing the TLS handshake.
+_async_clients: Dict[Tuple[int, str], Tuple[Any, "httpx.AsyncClient"]] = {}
+_async_clients_lock = threading.Lock()
+
+
+def get_async_client(base_url: str) -> "httpx.AsyncClient":
+    """Return the pooled async client for ``base_url``'s host on the running loop."""
+    if not HTTPX_AVAILABLE:
+        raise ExchangeError("httpx is required for async exchange requests")
+    loop = asyncio.get_running_loop()
+    key = (id(loop), urlparse(base_url).netloc)
+    with _async_clients_lock:
+        for stale in [k for k, (l, _) in _async_clients.items() if l.is_closed()]:
+            del _async_clients[stale]
+        entry = _async_clients.get(key)
+        if entry is None or entry[1].is_closed:
+            client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=10,
+                headers={"User-Agent": "PowerTrader-AI/1.0"},
+                limits=httpx.Limits(
+                    max_connections=30,
+                    max_keepalive_connections=30,
+                    keepalive_expiry=30,
+                ),
+            )
+            entry = _async_clients[key] = (loop, client)
+    return entry[1]
+
+
+async def close_async_clients() -> None:
+    """Close every pooled async client created on the running loop."""
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        keys = [k for k, (l, _) in _async_clients.items() if l is loop]
+        clients = [_async_clients.pop(k)[1] for k in keys]
+    for client in clients:
+        await client.aclose()
+
+
+@atexit.register
+def _close_async_clients_at_exit() -> None:
+    with _async_clients_lock:
+        entries = list(_async_clients.values())
+        _async_clients.clear()
+    for loop, client in entries:
+        if not loop.is_closed() and not loop.is_running():
+            try:
+                loop.run_until_complete(client.aclose())
+            except Exception:
+                pass
+
+
+class AsyncExchangeBase(ABC):
+    """Async request support; each exchange implements ``_aget_ticker``."""
+
+    async def _arequest(
+        self, client: "httpx.AsyncClient", method: str, url: str, **kwargs
+    ) -> dict:
+        await self._bucket.aacquire()
+        try:
+            resp = await client.request(method, url, **kwargs)
+            resp.raise_for_status()
+            return _json_loads(resp.content)
+        except (httpx.HTTPError, ValueError) as e:
+            raise ExchangeError(f"{self.__class__.__name__} request failed: {e}")
+
+    async def aget_ticker(
+        self, symbol: str, client: Optional["httpx.AsyncClient"] = None
+    ) -> Ticker:
+        if client is None:
+            client = get_async_client(self.BASE_URL)
+        return await self._aget_ticker(symbol, client)
+
+    @abstractmethod
+    async def _aget_ticker(self, symbol: str, client: "httpx.AsyncClient") -> Ticker:
+        pass
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: bursts up to ``capacity``, then ``rate`` per second.
+
+    Each acquire reserves a token under the lock and sleeps outside it, so
+    concurrent callers are spaced out instead of serialized.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1.0
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_BUCKETS: Dict[str, TokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+def _shared_bucket(name: str, rate: float, capacity: float) -> TokenBucket:
+    """One bucket per exchange per process, since limits are enforced per IP."""
+    with _BUCKETS_LOCK:
+        if name not in _BUCKETS:
+            _BUCKETS[name] = TokenBucket(rate, capacity)
+        return _BUCKETS[name]
+
+
+_SHARED_SESSION: Optional[requests.Session] = None
+_SHARED_SESSION_LOCK = threading.Lock()
+
+
+def _retry_policy() -> Retry:
+    """
+    Retry transient GET failures (connection errors, 429, 5xx) with jittered
+    exponential backoff, sleeping for the server's Retry-After on 429/503.
+    """
+    kwargs = dict(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    try:
+        return Retry(backoff_jitter=0.1, **kwargs)
+    except TypeError:  # urllib3 < 2 has no jitter option
+        return Retry(**kwargs)
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session used by every exchange.
+
+    Sharing one session keeps a single keep-alive connection pool (and TLS
+    sessions) per host across all ExchangeBase instances and managers.
+    """
+    global _SHARED_SESSION
+    with _SHARED_SESSION_LOCK:
+        if _SHARED_SESSION is None:
+            session = requests.Session()
+            session.headers.update({"User-Agent": "PowerTrader-AI/1.0"})
+            adapter = HTTPAdapter(
+                max_retries=_retry_policy(), pool_connections=20, pool_maxsize=100
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SHARED_SESSION = session
+        return _SHARED_SESSION
+
+
+class ExchangeBase(AsyncExchangeBase, ABC):
+    # Default cache lifetime for GET responses (tickers), in seconds
+    CACHE_TTL = 5.0
+
+    # Sustained requests per second and burst size for the token bucket
+    RATE_LIMIT = 10.0
+    RATE_BURST = 20
+
     def __init__(self):
-        self.rate_limit_delay = 0.1
-        self.last_request_time = 0
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "PowerTrader-AI/1.0"})
+        self.rate_limit_delay = 1.0 / self.RATE_LIMIT
+        self.session = get_shared_session()
+        self.cache = FileCache()
+        self.cache_name = self.__class__.__name__.replace("Exchange", "").lower()
+        self._bucket = _shared_bucket(self.cache_name, self.RATE_LIMIT, self.RATE_BURST)
 
     def _rate_limit(self):
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = time.time()
+        self._bucket.acquire()
+
+    def _request(
+        self, method: str, url: str, ttl_override: Optional[float] = None, **kwargs
+    ) -> dict:
+        ttl = self.CACHE_TTL if ttl_override is None else ttl_override
+        params = kwargs.get("params")
+        use_cache = method == "GET" and ttl > 0
+        if use_cache:
+            cached = self.cache.get(self.cache_name, url, params, ttl)
+            if cached is not None:
+                return cached
 
-    def _request(self, method: str, url: str, **kwargs) -> dict:
         self._rate_limit()
         try:
             resp = self.session.request(method, url, timeout=10, **kwargs)
             resp.raise_for_status()
-            return resp.json()
-        except requests.RequestException as e:
+            data = _json_loads(resp.content)
+        except (requests.RequestException, ValueError) as e:
             raise ExchangeError(f"{self.__class__.__name__} request failed: {e}")
 
+        if use_cache:
+            self.cache.set(self.cache_name, url, params, ttl, data)
+        return data
+
+    def _candle_ttl(self, timeframe: str, end_time: Optional[int]) -> float:
+        """Closed candle windows are cached for a full timeframe; live ones briefly."""
+        if end_time and end_time <= time.time():
+            return float(TIMEFRAME_SECONDS.get(timeframe, 3600))
+        return self.CACHE_TTL
+
     @abstractmethod
     def get_ticker(self, symbol: str) -> Ticker:
         pass
 
     @abstractmethod
-    def get_candles(self, symbol: str, timeframe: str, limit: int) -> List[OHLCV]:
+    def get_candles_np(self, symbol: str, timeframe: str, limit: int) -> np.ndarray:
+        """Candles as an (N, 6) float64 array, columns as in CANDLE_COLUMNS."""
         pass
 
+    def get_candles(
+        self,
+        symbol: str,
+        timeframe: str = "1hour",
+        limit: int = 100,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+    ) -> List[OHLCV]:
+        arr = self.get_candles_np(symbol, timeframe, limit, start_time, end_time)
+        return list(map(OHLCV, arr[:, 0].astype(np.int64).tolist(), *arr[:, 1:].T.tolist()))
+
+    def get_tickers(self, symbols: List[str]) -> Dict[str, Ticker]:
+        """
+        Tickers for several symbols at once, keyed by symbol.
+
+        Exchanges with a bulk endpoint override this; the default fans the
+        single-symbol requests out over a small thread pool. Symbols that
+        fail are warned about and left out.
+        """
+        results = {}
+        if not symbols:
+            return results
+        with ThreadPoolExecutor(max_workers=min(8, len(symbols))) as pool:
+            futures = {symbol: pool.submit(self.get_ticker, symbol) for symbol in symbols}
+        for symbol, future in futures.items():
+            try:
+                results[symbol] = future.result()
+            except Exception as e:
+                print(f"Warning: {self.cache_name} ticker {symbol} failed: {e}")
+        return results
+
     @abstractmethod
     def get_orderbook(self, symbol: str, depth: int) -> OrderBook:
         pass
@@ -127,6 +546,10 @@ class ExchangeError(Exception):
 class KuCoinExchange(ExchangeBase):
     BASE_URL = "https://api.kucoin.com"
 
+    # Public market data: 30 requests per 3 seconds
+    RATE_LIMIT = 10.0
+    RATE_BURST = 30
+
     TIMEFRAME_MAP = {
         "1min": "1min",
         "5min": "5min",
@@ -142,7 +565,7 @@ class KuCoinExchange(ExchangeBase):
     }
 
     def normalize_symbol(self, coin: str, quote: str = "USDT") -> str:
-        return f"{coin.upper()}-{quote.upper()}"
+        return _join_symbol(coin, quote, "-")
 
     def normalize_timeframe(self, tf: str) -> str:
         return self.TIMEFRAME_MAP.get(tf, "1hour")
@@ -151,11 +574,36 @@ class KuCoinExchange(ExchangeBase):
         data = self._request(
             "GET", f"{self.BASE_URL}/api/v1/market/stats", params={"symbol": symbol}
         )
+        return self._parse_ticker(symbol, data)
+
+    async def _aget_ticker(self, symbol: str, client: "httpx.AsyncClient") -> Ticker:
+        data = await self._arequest(
+            client,
+            "GET",
+            f"{self.BASE_URL}/api/v1/market/stats",
+            params={"symbol": symbol},
+        )
+        return self._parse_ticker(symbol, data)
+
+    def get_tickers(self, symbols: List[str]) -> Dict[str, Ticker]:
+        data = self._request("GET", f"{self.BASE_URL}/api/v1/market/allTickers")
 
         if data.get("code") != "200000":
             raise ExchangeError(f"KuCoin error: {data.get('msg', 'Unknown error')}")
 
-        stats = data["data"]
+        wanted = set(symbols)
+        return {
+            stats["symbol"]: self._ticker_from_stats(stats["symbol"], stats)
+            for stats in data["data"]["ticker"]
+            if stats["symbol"] in wanted
+        }
+
+    def _parse_ticker(self, symbol: str, data: dict) -> Ticker:
+        if data.get("code") != "200000":
+            raise ExchangeError(f"KuCoin error: {data.get('msg', 'Unknown error')}")
+        return self._ticker_from_stats(symbol, data["data"])
+
+    def _ticker_from_stats(self, symbol: str, stats: dict) -> Ticker:
         return Ticker(
             exchange="kucoin",
             symbol=symbol,
@@ -166,14 +614,14 @@ class KuCoinExchange(ExchangeBase):
             timestamp=datetime.now(),
         )
 
-    def get_candles(
+    def get_candles_np(
         self,
         symbol: str,
         timeframe: str = "1hour",
         limit: int = 100,
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
-    ) -> List[OHLCV]:
+    ) -> np.ndarray:
         params = {"symbol": symbol, "type": self.normalize_timeframe(timeframe)}
 
         if start_time:
@@ -182,31 +630,23 @@ class KuCoinExchange(ExchangeBase):
             params["endAt"] = end_time
 
         data = self._request(
-            "GET", f"{self.BASE_URL}/api/v1/market/candles", params=params
+            "GET",
+            f"{self.BASE_URL}/api/v1/market/candles",
+            ttl_override=self._candle_ttl(timeframe, end_time),
+            params=params,
         )
 
         if data.get("code") != "200000":
             raise ExchangeError(f"KuCoin error: {data.get('msg', 'Unknown error')}")
 
-        candles = []
-        for c in data["data"][:limit]:
-            candles.append(
-                OHLCV(
-                    timestamp=int(c[0]),
-                    open=float(c[1]),
-                    close=float(c[2]),
-                    high=float(c[3]),
-                    low=float(c[4]),
-                    volume=float(c[5]),
-                )
-            )
-
-        return sorted(candles, key=lambda x: x.timestamp)
+        # KuCoin rows: [time, open, close, high, low, volume, turnover]
+        return _candle_array(data["data"][:limit], (0, 1, 3, 4, 2, 5))
 
     def get_orderbook(self, symbol: str, depth: int = 20) -> OrderBook:
         data = self._request(
             "GET",
             f"{self.BASE_URL}/api/v1/market/orderbook/level2_20",
+            ttl_override=1,
             params={"symbol": symbol},
         )
 
@@ -217,8 +657,8 @@ class KuCoinExchange(ExchangeBase):
         return OrderBook(
             exchange="kucoin",
             symbol=symbol,
-            bids=[(float(b[0]), float(b[1])) for b in book["bids"][:depth]],
-            asks=[(float(a[0]), float(a[1])) for a in book["asks"][:depth]],
+            bids=_parse_levels(book["bids"], depth),
+            asks=_parse_levels(book["asks"], depth),
             timestamp=datetime.now(),
         )
 
@@ -226,6 +666,10 @@ class KuCoinExchange(ExchangeBase):
 class BinanceExchange(ExchangeBase):
     BASE_URL = "https://api.binance.com"
 
+    # 1200 request weight per minute
+    RATE_LIMIT = 20.0
+    RATE_BURST = 40
+
     TIMEFRAME_MAP = {
         "1min": "1m",
         "5min": "5m",
@@ -241,7 +685,7 @@ class BinanceExchange(ExchangeBase):
     }
 
     def normalize_symbol(self, coin: str, quote: str = "USDT") -> str:
-        return f"{coin.upper()}{quote.upper()}"
+        return _join_symbol(coin, quote, "")
 
     def normalize_timeframe(self, tf: str) -> str:
         return self.TIMEFRAME_MAP.get(tf, "1h")
@@ -250,7 +694,28 @@ class BinanceExchange(ExchangeBase):
         data = self._request(
             "GET", f"{self.BASE_URL}/api/v3/ticker/24hr", params={"symbol": symbol}
         )
+        return self._parse_ticker(symbol, data)
 
+    async def _aget_ticker(self, symbol: str, client: "httpx.AsyncClient") -> Ticker:
+        data = await self._arequest(
+            client,
+            "GET",
+            f"{self.BASE_URL}/api/v3/ticker/24hr",
+            params={"symbol": symbol},
+        )
+        return self._parse_ticker(symbol, data)
+
+    def get_tickers(self, symbols: List[str]) -> Dict[str, Ticker]:
+        if not symbols:
+            return {}
+        data = self._request(
+            "GET",
+            f"{self.BASE_URL}/api/v3/ticker/24hr",
+            params={"symbols": json.dumps(sorted(symbols), separators=(",", ":"))},
+        )
+        return {item["symbol"]: self._parse_ticker(item["symbol"], item) for item in data}
+
+    def _parse_ticker(self, symbol: str, data: dict) -> Ticker:
         return Ticker(
             exchange="binance",
             symbol=symbol,
@@ -261,14 +726,14 @@ class BinanceExchange(ExchangeBase):
             timestamp=datetime.now(),
         )
 
-    def get_candles(
+    def get_candles_np(
         self,
         symbol: str,
         timeframe: str = "1hour",
         limit: int = 100,
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
-    ) -> List[OHLCV]:
+    ) -> np.ndarray:
         params = {
             "symbol": symbol,
             "interval": self.normalize_timeframe(timeframe),
@@ -280,35 +745,29 @@ class BinanceExchange(ExchangeBase):
         if end_time:
             params["endTime"] = end_time * 1000
 
-        data = self._request("GET", f"{self.BASE_URL}/api/v3/klines", params=params)
-
-        candles = []
-        for c in data:
-            candles.append(
-                OHLCV(
-                    timestamp=int(c[0] // 1000),
-                    open=float(c[1]),
-                    high=float(c[2]),
-                    low=float(c[3]),
-                    close=float(c[4]),
-                    volume=float(c[5]),
-                )
-            )
+        data = self._request(
+            "GET",
+            f"{self.BASE_URL}/api/v3/klines",
+            ttl_override=self._candle_ttl(timeframe, end_time),
+            params=params,
+        )
 
-        return candles
+        # Binance rows: [open_time_ms, open, high, low, close, volume, ...], ascending
+        return _parse_binance_klines(data)
 
     def get_orderbook(self, symbol: str, depth: int = 20) -> OrderBook:
         data = self._request(
             "GET",
             f"{self.BASE_URL}/api/v3/depth",
+            ttl_override=1,
             params={"symbol": symbol, "limit": depth},
         )
 
         return OrderBook(
             exchange="binance",
             symbol=symbol,
-            bids=[(float(b[0]), float(b[1])) for b in data["bids"]],
-            asks=[(float(a[0]), float(a[1])) for a in data["asks"]],
+            bids=_parse_levels(data["bids"], depth),
+            asks=_parse_levels(data["asks"], depth),
             timestamp=datetime.now(),
         )
 
@@ -316,6 +775,10 @@ class BinanceExchange(ExchangeBase):
 class CoinbaseExchange(ExchangeBase):
     BASE_URL = "https://api.exchange.coinbase.com"
 
+    # Public endpoints: 10 requests per second
+    RATE_LIMIT = 10.0
+    RATE_BURST = 10
+
     TIMEFRAME_MAP = {
         "1min": 60,
         "5min": 300,
@@ -327,7 +790,7 @@ class CoinbaseExchange(ExchangeBase):
     }
 
     def normalize_symbol(self, coin: str, quote: str = "USD") -> str:
-        return f"{coin.upper()}-{quote.upper()}"
+        return _join_symbol(coin, quote, "-")
 
     def normalize_timeframe(self, tf: str) -> int:
         return self.TIMEFRAME_MAP.get(tf, 3600)
@@ -335,7 +798,16 @@ class CoinbaseExchange(ExchangeBase):
     def get_ticker(self, symbol: str) -> Ticker:
         ticker_data = self._request("GET", f"{self.BASE_URL}/products/{symbol}/ticker")
         stats_data = self._request("GET", f"{self.BASE_URL}/products/{symbol}/stats")
+        return self._parse_ticker(symbol, ticker_data, stats_data)
 
+    async def _aget_ticker(self, symbol: str, client: "httpx.AsyncClient") -> Ticker:
+        ticker_data, stats_data = await asyncio.gather(
+            self._arequest(client, "GET", f"{self.BASE_URL}/products/{symbol}/ticker"),
+            self._arequest(client, "GET", f"{self.BASE_URL}/products/{symbol}/stats"),
+        )
+        return self._parse_ticker(symbol, ticker_data, stats_data)
+
+    def _parse_ticker(self, symbol: str, ticker_data: dict, stats_data: dict) -> Ticker:
         return Ticker(
             exchange="coinbase",
             symbol=symbol,
@@ -346,14 +818,14 @@ class CoinbaseExchange(ExchangeBase):
             timestamp=datetime.now(),
         )
 
-    def get_candles(
+    def get_candles_np(
         self,
         symbol: str,
         timeframe: str = "1hour",
         limit: int = 100,
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
-    ) -> List[OHLCV]:
+    ) -> np.ndarray:
         granularity = self.normalize_timeframe(timeframe)
 
         params = {"granularity": granularity}
@@ -363,39 +835,53 @@ class CoinbaseExchange(ExchangeBase):
             params["end"] = datetime.fromtimestamp(end_time).isoformat()
 
         data = self._request(
-            "GET", f"{self.BASE_URL}/products/{symbol}/candles", params=params
+            "GET",
+            f"{self.BASE_URL}/products/{symbol}/candles",
+            ttl_override=self._candle_ttl(timeframe, end_time),
+            params=params,
         )
 
-        candles = []
-        for c in data[:limit]:
-            candles.append(
-                OHLCV(
-                    timestamp=int(c[0]),
-                    low=float(c[1]),
-                    high=float(c[2]),
-                    open=float(c[3]),
-                    close=float(c[4]),
-                    volume=float(c[5]),
-                )
-            )
-
-        return sorted(candles, key=lambda x: x.timestamp)
+        # Coinbase rows: [time, low, high, open, close, volume]
+        return _candle_array(data[:limit], (0, 3, 2, 1, 4, 5))
 
     def get_orderbook(self, symbol: str, depth: int = 20) -> OrderBook:
         data = self._request(
-            "GET", f"{self.BASE_URL}/products/{symbol}/book", params={"level": 2}
+            "GET",
+            f"{self.BASE_URL}/products/{symbol}/book",
+            ttl_override=1,
+            params={"level": 2},
         )
 
         return OrderBook(
             exchange="coinbase",
             symbol=symbol,
-            bids=[(float(b[0]), float(b[1])) for b in data["bids"][:depth]],
-            asks=[(float(a[0]), float(a[1])) for a in data["asks"][:depth]],
+            bids=_parse_levels(data["bids"], depth),
+            asks=_parse_levels(data["asks"], depth),
             timestamp=datetime.now(),
         )
 
 
+def _median(prices: List[float]) -> float:
+    """Median of a short price list (one per exchange) without statistics' overhead."""
+    n = len(prices)
+    if n == 1:
+        return prices[0]
+    if n == 2:
+        return 0.5 * (prices[0] + prices[1])
+    if n == 3:
+        a, b, c = prices
+        if a > b:
+            a, b = b, a
+        return b if b <= c else (a if a > c else c)
+    ordered = sorted(prices)
+    mid = n // 2
+    return ordered[mid] if n & 1 else 0.5 * (ordered[mid - 1] + ordered[mid])
+
+
 class ExchangeManager:
+    # Seconds a get_all_tickers result is reused in-process
+    TICKER_CACHE_TTL = 1.0
+
     def __init__(self, enabled_exchanges: Optional[List[str]] = None):
         self.exchanges: Dict[str, ExchangeBase] = {}
 
@@ -415,6 +901,96 @@ class ExchangeManager:
                 except Exception as e:
                     print(f"Warning: Could not initialize {name}: {e}")
 
+        # (coin, quote) -> (fetched_at, tickers); absorbs repeat calls within a scan
+        self._ticker_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Ticker]]] = {}
+
+        # (coin, exchange) -> (fetched_at, ticker), kept fresh by start_poller()
+        self.ticker_map: Dict[Tuple[str, str], Tuple[float, Ticker]] = {}
+        self._ticker_map_lock = threading.RLock()
+        self._poll_stop = threading.Event()
+        self._poll_threads: List[threading.Thread] = []
+        self._poll_quote = "USDT"
+        self._poll_interval = 1.0
+
+        # Reused across calls so per-exchange requests can run concurrently
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, len(self.exchanges)), thread_name_prefix="exchange"
+        )
+
+    def close(self):
+        """Stop the poller and shut down the worker pool."""
+        self.stop_poller()
+        self._pool.shutdown(wait=False)
+
+    def start_poller(
+        self, coins: List[str], interval: float = 1.0, quote: str = "USDT"
+    ) -> None:
+        """
+        Continuously refresh tickers for ``coins`` in the background.
+
+        One thread per exchange cycles through the coins once per ``interval``
+        (never faster than the exchange's rate_limit_delay), and
+        get_all_tickers() serves fresh entries from ticker_map without
+        touching the network.
+        """
+        self.stop_poller()
+        self._poll_stop.clear()
+        self._poll_quote = quote
+        self._poll_interval = interval
+        coins = list(coins)
+        for name, ex in self.exchanges.items():
+            thread = threading.Thread(
+                target=self._poll_exchange,
+                args=(name, ex, coins, interval, quote),
+                name=f"poller-{name}",
+                daemon=True,
+            )
+            self._poll_threads.append(thread)
+            thread.start()
+
+    def stop_poller(self) -> None:
+        self._poll_stop.set()
+        for thread in self._poll_threads:
+            thread.join(timeout=5)
+        self._poll_threads = []
+
+    def _poll_exchange(
+        self,
+        name: str,
+        ex: ExchangeBase,
+        coins: List[str],
+        interval: float,
+        quote: str,
+    ) -> None:
+        q = "USD" if name == "coinbase" else quote
+        pause = max(interval / max(1, len(coins)), getattr(ex, "rate_limit_delay", 0))
+        while not self._poll_stop.is_set():
+            for coin in coins:
+                if self._poll_stop.is_set():
+                    return
+                try:
+                    ticker = ex.get_ticker(ex.normalize_symbol(coin, q))
+                    with self._ticker_map_lock:
+                        self.ticker_map[(coin, name)] = (time.monotonic(), ticker)
+                except Exception as e:
+                    print(f"Warning: {name} poll for {coin} failed: {e}")
+                self._poll_stop.wait(pause)
+
+    def _polled_tickers(self, coin: str, quote: str) -> Optional[Dict[str, Ticker]]:
+        """Tickers from the poller if every exchange has a fresh entry for coin."""
+        if not self._poll_threads or quote != self._poll_quote:
+            return None
+        max_age = 2 * self._poll_interval
+        now = time.monotonic()
+        results = {}
+        with self._ticker_map_lock:
+            for name in self.exchanges:
+                entry = self.ticker_map.get((coin, name))
+                if entry is None or now - entry[0] > max_age:
+                    return None
+                results[name] = entry[1]
+        return results
+
     def get_price(
         self, coin: str, exchange: str = "kucoin", quote: str = "USDT"
     ) -> float:
@@ -466,39 +1042,138 @@ class ExchangeManager:
         return ex.get_orderbook(symbol, depth)
 
     def get_all_tickers(self, coin: str, quote: str = "USDT") -> Dict[str, Ticker]:
-        results = {}
+        polled = self._polled_tickers(coin, quote)
+        if polled is not None:
+            return polled
+
+        key = (coin, quote)
+        cached = self._ticker_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.TICKER_CACHE_TTL:
+            return dict(cached[1])
+
+        futures = {}
         for name, ex in self.exchanges.items():
+            q = "USD" if name == "coinbase" else quote
+            futures[name] = self._pool.submit(
+                lambda ex=ex, q=q: ex.get_ticker(ex.normalize_symbol(coin, q))
+            )
+
+        # Requests run concurrently; results are collected in exchange order
+        results = {}
+        for name, future in futures.items():
             try:
-                q = "USD" if name == "coinbase" else quote
-                symbol = ex.normalize_symbol(coin, q)
-                results[name] = ex.get_ticker(symbol)
+                results[name] = future.result()
             except Exception as e:
                 print(f"Warning: {name} ticker failed: {e}")
+
+        self._ticker_cache[key] = (time.monotonic(), dict(results))
         return results
 
+    async def aget_all_tickers(
+        self,
+        coin: str,
+        quote: str = "USDT",
+        client: Optional["httpx.AsyncClient"] = None,
+    ) -> Dict[str, Ticker]:
+        """Async ``get_all_tickers``; ``client=None`` uses the pooled per-host clients."""
+        names = list(self.exchanges)
+        results = await asyncio.gather(
+            *[
+                self.exchanges[name].aget_ticker(
+                    self.exchanges[name].normalize_symbol(
+                        coin, "USD" if name == "coinbase" else quote
+                    ),
+                    client,
+                )
+                for name in names
+            ],
+            return_exceptions=True,
+        )
+
+        tickers = {}
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                print(f"Warning: {name} ticker failed: {result}")
+            else:
+                tickers[name] = result
+        return tickers
+
+    async def ascan_arbitrage(
+        self, coins: List[str], min_spread_pct: float = 0.5
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Check several coins for arbitrage with every ticker request in flight at once."""
+        all_tickers = await asyncio.gather(
+            *[self.aget_all_tickers(coin) for coin in coins]
+        )
+        return {
+            coin: self._detect_arb(coin, tickers, min_spread_pct)
+            for coin, tickers in zip(coins, all_tickers)
+        }
+
+    def scan_arbitrage(
+        self, coins: List[str], min_spread_pct: float = 0.5, quote: str = "USDT"
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Check several coins for arbitrage using each exchange's bulk ticker call.
+
+        One get_tickers() request per exchange (run concurrently) replaces
+        one request per coin per exchange.
+        """
+        symbols = {}
+        futures = {}
+        for name, ex in self.exchanges.items():
+            q = "USD" if name == "coinbase" else quote
+            symbols[name] = {coin: ex.normalize_symbol(coin, q) for coin in coins}
+            futures[name] = self._pool.submit(ex.get_tickers, list(symbols[name].values()))
+
+        per_coin: Dict[str, Dict[str, Ticker]] = {coin: {} for coin in coins}
+        for name, future in futures.items():
+            try:
+                tickers = future.result()
+            except Exception as e:
+                print(f"Warning: {name} batch tickers failed: {e}")
+                continue
+            for coin, symbol in symbols[name].items():
+                if symbol in tickers:
+                    per_coin[coin][name] = tickers[symbol]
+
+        return {
+            coin: self._detect_arb(coin, tickers, min_spread_pct)
+            for coin, tickers in per_coin.items()
+        }
+
     def get_aggregated_price(self, coin: str, method: str = "median") -> Dict[str, Any]:
-        tickers = self.get_all_tickers(coin)
+        return self._aggregate(coin, self.get_all_tickers(coin), method)
 
+    def _aggregate(
+        self, coin: str, tickers: Dict[str, Ticker], method: str = "median"
+    ) -> Dict[str, Any]:
         if not tickers:
             raise ExchangeError(f"No price data available for {coin}")
 
-        prices = [t.price for t in tickers.values()]
-        volumes = [t.volume_24h for t in tickers.values()]
-
-        if method == "median":
-            agg_price = statistics.median(prices)
-        elif method == "mean":
-            agg_price = statistics.mean(prices)
-        elif method == "vwap":
-            total_volume = sum(volumes)
-            if total_volume > 0:
-                agg_price = sum(p * v for p, v in zip(prices, volumes)) / total_volume
-            else:
-                agg_price = statistics.median(prices)
+        # One pass for the extremes, the sum and the VWAP terms
+        prices = []
+        lo = hi = next(iter(tickers.values())).price
+        total = pv = total_volume = 0.0
+        for t in tickers.values():
+            p, v = t.price, t.volume_24h
+            prices.append(p)
+            if p < lo:
+                lo = p
+            elif p > hi:
+                hi = p
+            total += p
+            pv += p * v
+            total_volume += v
+
+        if method == "mean":
+            agg_price = total / len(prices)
+        elif method == "vwap" and total_volume > 0:
+            agg_price = pv / total_volume
         else:
-            agg_price = statistics.median(prices)
+            agg_price = _median(prices)
 
-        spread = max(prices) - min(prices)
+        spread = hi - lo
         spread_pct = (spread / agg_price) * 100 if agg_price > 0 else 0
 
         return {
@@ -514,17 +1189,22 @@ class ExchangeManager:
     def detect_arbitrage(
         self, coin: str, min_spread_pct: float = 0.5
     ) -> Optional[Dict[str, Any]]:
-        tickers = self.get_all_tickers(coin)
+        return self._detect_arb(coin, self.get_all_tickers(coin), min_spread_pct)
 
+    def _detect_arb(
+        self, coin: str, tickers: Dict[str, Ticker], min_spread_pct: float
+    ) -> Optional[Dict[str, Any]]:
         if len(tickers) < 2:
             return None
 
-        sorted_by_price = sorted(tickers.items(), key=lambda x: x[1].price)
-        lowest_name, lowest_ticker = sorted_by_price[0]
-        highest_name, highest_ticker = sorted_by_price[-1]
+        names = list(tickers)
+        lo_i, hi_i, spread_pct = _detect_arb_nb(
+            np.array([tickers[name].price for name in names], dtype=np.float64)
+        )
+        lowest_name, lowest_ticker = names[lo_i], tickers[names[lo_i]]
+        highest_name, highest_ticker = names[hi_i], tickers[names[hi_i]]
 
         spread = highest_ticker.price - lowest_ticker.price
-        spread_pct = (spread / lowest_ticker.price) * 100
 
         if spread_pct >= min_spread_pct:
             return {
@@ -546,7 +1226,9 @@ def print_price_comparison(manager: ExchangeManager, coin: str):
     print(f"PRICE COMPARISON: {coin}")
     print("=" * 60)
 
-    agg = manager.get_aggregated_price(coin)
+    # One fetch serves both the aggregate and the arbitrage check
+    tickers = manager.get_all_tickers(coin)
+    agg = manager._aggregate(coin, tickers)
 
     print(f"\nAggregated Price (median): ${agg['aggregated_price']:,.2f}")
     print(f"Cross-exchange spread: ${agg['spread']:.2f} ({agg['spread_pct']:.3f}%)")
@@ -560,7 +1242,7 @@ def print_price_comparison(manager: ExchangeManager, coin: str):
         sign = "+" if diff >= 0 else ""
         print(f"{ex_name:<12} ${price:>13,.2f} {sign}{diff_pct:>10.3f}%")
 
-    arb = manager.detect_arbitrage(coin)
+    arb = manager._detect_arb(coin, tickers, 0.5)
     if arb:
         print(f"\n{'!' * 40}")
         print(f"ARBITRAGE OPPORTUNITY DETECTED!")
@@ -639,18 +1321,27 @@ def main():
         print("\nScanning for arbitrage opportunities...")
         print("=" * 60)
         found = False
-        for coin in args.coins:
+        coins = [coin.upper() for coin in args.coins]
+        scanned = {}
+        try:
+            scanned = manager.scan_arbitrage(coins, args.min_spread)
+        except Exception as e:
+            print(f"Warning: batch scan failed, falling back to per-coin checks: {e}")
+        for coin in coins:
             try:
-                arb = manager.detect_arbitrage(coin.upper(), args.min_spread)
+                if coin in scanned:
+                    arb = scanned[coin]
+                else:
+                    arb = manager.detect_arbitrage(coin, args.min_spread)
                 if arb:
                     found = True
                     print(
-                        f"\n{coin.upper()}: Buy {arb['buy_exchange']} @ ${arb['buy_price']:,.2f} "
+                        f"\n{coin}: Buy {arb['buy_exchange']} @ ${arb['buy_price']:,.2f} "
                         f"-> Sell {arb['sell_exchange']} @ ${arb['sell_price']:,.2f} "
                         f"({arb['spread_pct']:.3f}%)"
                     )
             except Exception as e:
-                print(f"{coin.upper()}: Error - {e}")
+                print(f"{coin}: Error - {e}")
 
         if not found:
             print(f"\nNo arbitrage opportunities found above {args.min_spread}% spread")
@@ -29,6 +29,8 @@ from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 from enum import Enum
 
+import numpy as np
+
 from pt_exchanges import ExchangeManager, ExchangeError, Ticker, OrderBook
 
 
@@ -403,12 +405,9 @@ class LiquidityAggregator:
                 symbol = ex.normalize_symbol(coin, q)
                 book = ex.get_orderbook(symbol, depth)
 
-                if side == "buy":
-                    # Sum ask-side liquidity
-                    total = sum(price * qty for price, qty in book.asks)
-                else:
-                    # Sum bid-side liquidity
-                    total = sum(price * qty for price, qty in book.bids)
+                # Sum ask-side liquidity for buys, bid-side for sells
+                levels = book.asks if side == "buy" else book.bids
+                total = float(levels[:, 0] @ levels[:, 1])
 
                 liquidity[ex_name] = total
             except Exception:
@@ -478,19 +477,15 @@ class LiquidityAggregator:
                 book = ex.get_orderbook(symbol, 50)
 
                 levels = book.asks if side == "buy" else book.bids
-                if not levels:
+                if len(levels) == 0:
                     impacts[ex_name] = 999.0  # no liquidity
                     continue
 
-                best_price = levels[0][0]
-                remaining = quantity
-                worst_price = best_price
+                best_price = levels[0, 0]
 
-                for price, qty in levels:
-                    if remaining <= 0:
-                        break
-                    worst_price = price
-                    remaining -= qty
+                # Deepest level touched: first where cumulative size covers the order
+                filled = np.searchsorted(np.cumsum(levels[:, 1]), quantity)
+                worst_price = levels[min(filled, len(levels) - 1), 0]
 
                 impact_pct = abs(worst_price - best_price) / best_price * 100
                 impacts[ex_name] = round(impact_pct, 4)
@@ -17,13 +17,20 @@ Usage:
 """
 
 import asyncio
+import io
 import logging
 import sqlite3
-from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+import sys
+import threading
+import time
+from array import array
+from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass, asdict, replace
 from typing import List, Dict, Optional, Set, Any, Callable
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, asynccontextmanager
+from functools import partial
 from enum import Enum
 import json
 
@@ -62,10 +69,33 @@ try:
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 from pt_config import ConfigManager, NotificationConfig
 
 DB_PATH = Path("hub_data/notifications.db")
 
+# Explicit datetime <-> TIMESTAMP mapping (sqlite3's built-in defaults are
+# deprecated since Python 3.12); PARSE_DECLTYPES then hands back datetimes.
+sqlite3.register_adapter(datetime, lambda dt: dt.isoformat(" "))
+sqlite3.register_converter("TIMESTAMP", lambda b: datetime.fromisoformat(b.decode()))
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -86,7 +116,7 @@ class NotificationPlatform(Enum):
 # NotificationConfig is imported from pt_config
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NotificationRecord:
     id: Optional[int]
     timestamp: datetime
@@ -99,45 +129,86 @@ class NotificationRecord:
 
 
 class RateLimiter:
+    """
+    Sliding-window limiter: at most ``max_calls`` per ``period``.
+
+    The accepted-call log lives in a fixed ring buffer of ``max_calls``
+    monotonic timestamps; the slot about to be overwritten is always the
+    oldest call, so a single comparison decides each request.
+    """
+
     def __init__(self, max_calls: int, period: timedelta = timedelta(minutes=1)):
         self.max_calls = max_calls
         self.period = period
-        self.calls: List[datetime] = []
+        self.period_seconds = period.total_seconds()
+        self._buf = array("d", [float("-inf")] * max(max_calls, 0))
+        self._idx = 0
         self._lock = asyncio.Lock()
 
     async def acquire(self) -> bool:
         async with self._lock:
-            now = datetime.now()
-            self.calls = [c for c in self.calls if c > now - self.period]
-
-            if len(self.calls) >= self.max_calls:
+            if not self._buf:
                 return False
-
-            self.calls.append(now)
+            now = time.monotonic()
+            if now - self._buf[self._idx] < self.period_seconds:
+                return False
+            self._buf[self._idx] = now
+            self._idx = (self._idx + 1) % len(self._buf)
             return True
 
     def reset(self):
-        self.calls = []
+        for i in range(len(self._buf)):
+            self._buf[i] = float("-inf")
+        self._idx = 0
 
 
 class NotificationDatabase:
     def __init__(self, db_path: Path = DB_PATH):
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One long-lived connection shared by all threads; the lock serializes
+        # access so sqlite's page cache survives between writes.
+        self._conn = sqlite3.connect(
+            self.db_path,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False,
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-64000")
+        self._conn.execute("PRAGMA mmap_size=268435456")
+        self._lock = threading.Lock()
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._write_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        # Single dedicated thread for queued writes, so batches hit the disk in
+        # order and never occupy the loop's default executor.
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notif-db")
         self._init_db()
 
     @contextmanager
     def _get_conn(self):
-        conn = sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        finally:
-            conn.close()
+        with self._lock:
+            try:
+                yield self._conn
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+
+    def close(self):
+        self._writer.shutdown(wait=True)
+        with self._lock:
+            try:
+                self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            self._conn.close()
 
     def _init_db(self):
         with self._get_conn() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS notifications (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -152,19 +223,61 @@ class NotificationDatabase:
                 )
             """)
 
+            # One composite index serves the date-range filter, the ORDER BY
+            # and (covering) the level/platform/success aggregates; it makes
+            # the older single-column indexes redundant.
+            for old_index in (
+                "idx_notifications_timestamp",
+                "idx_notifications_level",
+                "idx_notifications_platform",
+            ):
+                conn.execute(f"DROP INDEX IF EXISTS {old_index}")
             conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_notifications_timestamp ON notifications(timestamp)"
-            )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_notifications_level ON notifications(level)"
-            )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_notifications_platform ON notifications(platform)"
+                "CREATE INDEX IF NOT EXISTS idx_notif_ts_level_plat "
+                "ON notifications(timestamp DESC, level, platform, success)"
             )
+            # Planner statistics: gather once for a new database; afterwards
+            # close() keeps them fresh with PRAGMA optimize.
+            has_stats = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone()
+            if not has_stats:
+                conn.execute("ANALYZE")
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_notifications_success ON notifications(success)"
             )
 
+    _INSERT_SQL = """
+        INSERT INTO notifications
+        (timestamp, level, platform, message, success, error_message, metadata)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+    WRITE_BATCH_SIZE = 128
+
+    # Fixed query text (absent filters bind NULL, absent dates the datetime
+    # extremes) so sqlite's statement cache reuses one prepared statement;
+    # the timestamp range stays unconditional so it can still seek the index.
+    _RANGE_WHERE = "WHERE timestamp >= :start AND timestamp <= :end"
+    _LIST_SQL = f"""
+        SELECT * FROM notifications {_RANGE_WHERE}
+          AND (:level IS NULL OR level = :level)
+          AND (:platform IS NULL OR platform = :platform)
+          AND (:success IS NULL OR success = :success)
+        ORDER BY timestamp DESC LIMIT :limit
+    """
+
+    @staticmethod
+    def _record_row(record: NotificationRecord) -> tuple:
+        return (
+            record.timestamp,
+            record.level,
+            record.platform,
+            record.message,
+            record.success,
+            record.error_message,
+            _json_dumps(record.metadata) if record.metadata else None,
+        )
+
     def log_notification(
         self,
         level: str,
@@ -174,31 +287,9 @@ class NotificationDatabase:
         error_message: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> NotificationRecord:
-        timestamp = datetime.now()
-        metadata_json = json.dumps(metadata) if metadata else None
-
-        with self._get_conn() as conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO notifications 
-                (timestamp, level, platform, message, success, error_message, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    timestamp,
-                    level,
-                    platform,
-                    message,
-                    success,
-                    error_message,
-                    metadata_json,
-                ),
-            )
-            record_id = cursor.lastrowid
-
-        return NotificationRecord(
-            id=record_id,
-            timestamp=timestamp,
+        record = NotificationRecord(
+            id=None,
+            timestamp=datetime.now(),
             level=level,
             platform=platform,
             message=message,
@@ -206,6 +297,62 @@ class NotificationDatabase:
             error_message=error_message,
             metadata=metadata,
         )
+        with self._get_conn() as conn:
+            cursor = conn.execute(self._INSERT_SQL, self._record_row(record))
+            return replace(record, id=cursor.lastrowid)
+
+    def log_notifications(self, records: List[NotificationRecord]):
+        """Insert several records in a single transaction."""
+        with self._get_conn() as conn:
+            conn.executemany(self._INSERT_SQL, [self._record_row(r) for r in records])
+
+    async def alog_notification(self, **kwargs) -> NotificationRecord:
+        """
+        Queue a notification for the background writer and return immediately.
+
+        Queued records are inserted in batches by ``_writer_loop``; the
+        returned record has no ``id`` yet. ``flush()`` waits for the queue.
+        """
+        record = NotificationRecord(id=None, timestamp=datetime.now(), **kwargs)
+        self._writer_queue().put_nowait(record)
+        return record
+
+    def _writer_queue(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._write_queue is None or self._write_loop is not loop:
+            self._write_queue = asyncio.Queue()
+            self._write_loop = loop
+            self._writer_task = loop.create_task(self._writer_loop(self._write_queue))
+        return self._write_queue
+
+    async def _writer_loop(self, queue: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                batch = [await queue.get()]
+                while len(batch) < self.WRITE_BATCH_SIZE and not queue.empty():
+                    batch.append(queue.get_nowait())
+                try:
+                    await loop.run_in_executor(self._writer, self.log_notifications, batch)
+                except Exception as e:
+                    logger.error(f"Failed to write {len(batch)} notification records: {e}")
+                finally:
+                    for _ in batch:
+                        queue.task_done()
+        except asyncio.CancelledError:
+            # Loop is shutting down (e.g. asyncio.run returning): write what's left.
+            pending = []
+            while not queue.empty():
+                pending.append(queue.get_nowait())
+                queue.task_done()
+            if pending:
+                self.log_notifications(pending)
+            raise
+
+    async def flush(self):
+        """Wait until every queued record has been written."""
+        if self._write_queue is not None and self._write_loop is asyncio.get_running_loop():
+            await self._write_queue.join()
 
     def get_notifications(
         self,
@@ -216,40 +363,25 @@ class NotificationDatabase:
         success: Optional[bool] = None,
         limit: int = 100,
     ) -> List[NotificationRecord]:
-        query = "SELECT * FROM notifications WHERE 1=1"
-        params = []
-
-        if level:
-            query += " AND level = ?"
-            params.append(level)
-        if platform:
-            query += " AND platform = ?"
-            params.append(platform)
-        if start_date:
-            query += " AND timestamp >= ?"
-            params.append(start_date)
-        if end_date:
-            query += " AND timestamp <= ?"
-            params.append(end_date)
-        if success is not None:
-            query += " AND success = ?"
-            params.append(success)
-
-        query += " ORDER BY timestamp DESC LIMIT ?"
-        params.append(limit)
+        params = {
+            "level": level or None,
+            "platform": platform or None,
+            "start": start_date or datetime.min,
+            "end": end_date or datetime.max,
+            "success": success,
+            "limit": limit,
+        }
 
         with self._get_conn() as conn:
-            rows = conn.execute(query, params).fetchall()
+            rows = conn.execute(self._LIST_SQL, params).fetchall()
 
         records = []
         for r in rows:
-            metadata = json.loads(r["metadata"]) if r["metadata"] else None
+            metadata = _json_loads(r["metadata"]) if r["metadata"] else None
             records.append(
                 NotificationRecord(
                     id=r["id"],
-                    timestamp=datetime.fromisoformat(r["timestamp"])
-                    if isinstance(r["timestamp"], str)
-                    else r["timestamp"],
+                    timestamp=r["timestamp"],
                     level=r["level"],
                     platform=r["platform"],
                     message=r["message"],
@@ -264,67 +396,67 @@ class NotificationDatabase:
     def get_statistics(
         self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
     ) -> Dict[str, Any]:
-        query = "SELECT * FROM notifications WHERE 1=1"
-        params = []
-
-        if start_date:
-            query += " AND timestamp >= ?"
-            params.append(start_date)
-        if end_date:
-            query += " AND timestamp <= ?"
-            params.append(end_date)
+        params = {"start": start_date or datetime.min, "end": end_date or datetime.max}
+        where = self._RANGE_WHERE
 
         with self._get_conn() as conn:
-            rows = conn.execute(query, params).fetchall()
-
-        if not rows:
-            return {
-                "total": 0,
-                "successful": 0,
-                "failed": 0,
-                "by_level": {},
-                "by_platform": {},
-                "success_rate": 0.0,
-            }
-
-        total = len(rows)
-        successful = sum(1 for r in rows if r["success"])
-        failed = total - successful
-
-        by_level = {}
-        by_platform = {}
-
-        for r in rows:
-            level = r["level"]
-            platform = r["platform"]
-
-            if level not in by_level:
-                by_level[level] = {"total": 0, "successful": 0}
-            by_level[level]["total"] += 1
-            if r["success"]:
-                by_level[level]["successful"] += 1
-
-            if platform not in by_platform:
-                by_platform[platform] = {"total": 0, "successful": 0}
-            by_platform[platform]["total"] += 1
-            if r["success"]:
-                by_platform[platform]["successful"] += 1
+            groups = conn.execute(
+                "SELECT level, platform, COUNT(*), SUM(success) FROM notifications "
+                f"{where} GROUP BY level, platform",
+                params,
+            ).fetchall()
+
+        # One index pass yields a few (level, platform) cells; roll them up here.
+        total = successful = 0
+        by_level: Dict[str, Dict[str, int]] = {}
+        by_platform: Dict[str, Dict[str, int]] = {}
+        for level, platform, count, ok in groups:
+            total += count
+            successful += ok
+            for bucket, key in ((by_level, level), (by_platform, platform)):
+                cell = bucket.setdefault(key, {"total": 0, "successful": 0})
+                cell["total"] += count
+                cell["successful"] += ok
 
         return {
             "total": total,
             "successful": successful,
-            "failed": failed,
+            "failed": total - successful,
             "by_level": by_level,
             "by_platform": by_platform,
             "success_rate": (successful / total * 100) if total > 0 else 0.0,
         }
 
 
+def new_http_client() -> "httpx.AsyncClient":
+    """Pooled keep-alive client for the HTTP notifiers."""
+    return httpx.AsyncClient(
+        timeout=10,
+        limits=httpx.Limits(
+            max_connections=32, max_keepalive_connections=32, keepalive_expiry=60
+        ),
+    )
+
+
 class BaseNotifier:
+    # NotificationConfig field naming where messages go (webhook URL, chat id...)
+    DESTINATION_FIELD: Optional[str] = None
+
     def __init__(self, config: NotificationConfig, db: NotificationDatabase):
         self.config = config
         self.db = db
         self.enabled = False
+        # Set by NotificationManager so all notifiers share one connection pool;
+        # standalone notifiers fall back to their own lazily created client.
+        self.get_http: Optional[Callable[[], "httpx.AsyncClient"]] = None
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def destination(self) -> str:
+        if self.DESTINATION_FIELD is None:
+            return ""
+        return str(getattr(self.config, self.DESTINATION_FIELD, "") or "")
 
     def is_available(self) -> bool:
         return False
@@ -334,10 +466,40 @@ class BaseNotifier:
     ) -> bool:
         return False
 
-    def _log(
+    def _http_client(self) -> "httpx.AsyncClient":
+        if self.get_http is not None:
+            return self.get_http()
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = new_http_client()
+            self._client_loop = loop
+        return self._client
+
+    async def _post_json(
+        self, url: str, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None
+    ):
+        """POST a JSON payload, raising on HTTP errors."""
+        if HTTPX_AVAILABLE:
+            resp = await self._http_client().post(url, json=payload, headers=headers)
+            resp.raise_for_status()
+            return resp
+
+        def _post():
+            resp = requests.post(url, headers=headers, json=payload, timeout=10)
+            resp.raise_for_status()
+            return resp
+
+        return await asyncio.get_event_loop().run_in_executor(None, _post)
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _log(
         self, success: bool, level: str, message: str, error: Optional[str] = None
     ):
-        self.db.log_notification(
+        await self.db.alog_notification(
             level=level,
             platform=self.__class__.__name__.replace("Notifier", "").lower(),
             message=message,
@@ -347,6 +509,8 @@ class BaseNotifier:
 
 
 class EmailNotifier(BaseNotifier):
+    DESTINATION_FIELD = "email_address"
+
     def __init__(self, config: NotificationConfig, db: NotificationDatabase):
         super().__init__(config, db)
         self.enabled = (
@@ -373,7 +537,7 @@ class EmailNotifier(BaseNotifier):
     ) -> bool:
         if not self.is_available():
             logger.warning("Email notifier not available")
-            self._log(
+            await self._log(
                 False, level.value, message, "Email not configured or unavailable"
             )
             return False
@@ -389,23 +553,31 @@ class EmailNotifier(BaseNotifier):
                 ),
             )
 
-            self._log(True, level.value, message)
+            await self._log(True, level.value, message)
             logger.info(f"Email sent successfully: {message[:50]}...")
             return True
 
         except Exception as e:
             logger.error(f"Failed to send email: {e}")
-            self._log(False, level.value, message, str(e))
+            await self._log(False, level.value, message, str(e))
             return False
 
 
 class DiscordNotifier(BaseNotifier):
+    DESTINATION_FIELD = "discord_webhook_url"
+    COLOR_MAP = {
+        NotificationLevel.INFO: 0x00BFFF,
+        NotificationLevel.WARNING: 0xFFAA00,
+        NotificationLevel.ERROR: 0xFF0000,
+        NotificationLevel.CRITICAL: 0x8B0000,
+    }
+
     def __init__(self, config: NotificationConfig, db: NotificationDatabase):
         super().__init__(config, db)
-        self.enabled = config.discord_webhook_url and DISCORD_AVAILABLE
+        self.enabled = config.discord_webhook_url and (HTTPX_AVAILABLE or DISCORD_AVAILABLE)
 
     def is_available(self) -> bool:
-        return self.enabled and DISCORD_AVAILABLE
+        return self.enabled and (HTTPX_AVAILABLE or DISCORD_AVAILABLE)
 
     async def send(
         self,
@@ -416,49 +588,53 @@ class DiscordNotifier(BaseNotifier):
     ) -> bool:
         if not self.is_available():
             logger.warning("Discord notifier not available")
-            self._log(
+            await self._log(
                 False, level.value, message, "Discord not configured or unavailable"
             )
             return False
 
         try:
-            webhook = DiscordWebhook(
-                url=self.config.discord_webhook_url, content=message
-            )
-
             if embed_color is None:
-                color_map = {
-                    NotificationLevel.INFO: 0x00BFFF,
-                    NotificationLevel.WARNING: 0xFFAA00,
-                    NotificationLevel.ERROR: 0xFF0000,
-                    NotificationLevel.CRITICAL: 0x8B0000,
+                embed_color = self.COLOR_MAP.get(level, 0x00BFFF)
+            title = f"PowerTrader AI - {level.value.upper()}"
+
+            if HTTPX_AVAILABLE:
+                payload = {
+                    "content": message,
+                    "embeds": [
+                        {
+                            "title": title,
+                            "description": message,
+                            "color": embed_color,
+                            "timestamp": datetime.now(timezone.utc).isoformat(),
+                        }
+                    ],
                 }
-                embed_color = color_map.get(level, 0x00BFFF)
-
-            embed = DiscordEmbed(
-                title=f"PowerTrader AI - {level.value.upper()}",
-                description=message,
-                color=embed_color,
-            )
-            embed.set_timestamp()
-
-            webhook.add_embed(embed)
-
-            await asyncio.get_event_loop().run_in_executor(
-                None, lambda: webhook.execute()
-            )
+                await self._post_json(self.config.discord_webhook_url, payload)
+            else:
+                webhook = DiscordWebhook(
+                    url=self.config.discord_webhook_url, content=message
+                )
+                embed = DiscordEmbed(title=title, description=message, color=embed_color)
+                embed.set_timestamp()
+                webhook.add_embed(embed)
+                await asyncio.get_event_loop().run_in_executor(
+                    None, lambda: webhook.execute()
+                )
 
-            self._log(True, level.value, message)
+            await self._log(True, level.value, message)
             logger.info(f"Discord message sent successfully: {message[:50]}...")
             return True
 
         except Exception as e:
             logger.error(f"Failed to send Discord message: {e}")
-            self._log(False, level.value, message, str(e))
+            await self._log(False, level.value, message, str(e))
             return False
 
 
 class TelegramNotifier(BaseNotifier):
+    DESTINATION_FIELD = "telegram_chat_id"
+
     def __init__(self, config: NotificationConfig, db: NotificationDatabase):
         super().__init__(config, db)
         self.enabled = (
@@ -485,7 +661,7 @@ class TelegramNotifier(BaseNotifier):
     ) -> bool:
         if not self.is_available():
             logger.warning("Telegram notifier not available")
-            self._log(
+            await self._log(
                 False, level.value, message, "Telegram not configured or unavailable"
             )
             return False
@@ -493,36 +669,45 @@ class TelegramNotifier(BaseNotifier):
         try:
             formatted_message = f"<b>[{level.value.upper()}]</b>\n\n{message}"
 
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.bot.send_message(
-                    chat_id=self.config.telegram_chat_id,
-                    text=formatted_message,
-                    parse_mode=parse_mode,
-                ),
+            send_message = partial(
+                self.bot.send_message,
+                chat_id=self.config.telegram_chat_id,
+                text=formatted_message,
+                parse_mode=parse_mode,
             )
+            if asyncio.iscoroutinefunction(self.bot.send_message):
+                # python-telegram-bot v20+ is asyncio-native
+                await send_message()
+            else:
+                await asyncio.get_event_loop().run_in_executor(None, send_message)
 
-            self._log(True, level.value, message)
+            await self._log(True, level.value, message)
             logger.info(f"Telegram message sent successfully: {message[:50]}...")
             return True
 
         except TelegramError as e:
             logger.error(f"Failed to send Telegram message: {e}")
-            self._log(False, level.value, message, str(e))
+            await self._log(False, level.value, message, str(e))
             return False
         except Exception as e:
             logger.error(f"Unexpected error sending Telegram message: {e}")
-            self._log(False, level.value, message, str(e))
+            await self._log(False, level.value, message, str(e))
             return False
 
     async def close(self):
+        await super().close()
         if self.bot:
-            await asyncio.get_event_loop().run_in_executor(
-                None, lambda: self.bot.shutdown()
-            )
+            if asyncio.iscoroutinefunction(self.bot.shutdown):
+                await self.bot.shutdown()
+            else:
+                await asyncio.get_event_loop().run_in_executor(
+                    None, lambda: self.bot.shutdown()
+                )
 
 
 class SlackNotifier(BaseNotifier):
+    DESTINATION_FIELD = "slack_webhook_url"
+
     def __init__(self, config: NotificationConfig, db: NotificationDatabase):
         super().__init__(config, db)
         self.enabled = config.slack_webhook_url and REQUESTS_AVAILABLE
@@ -538,29 +723,26 @@ class SlackNotifier(BaseNotifier):
     ) -> bool:
         if not self.is_available():
             logger.warning("Slack notifier not available")
-            self._log(False, level.value, message, "Slack not configured or requests missing")
+            await self._log(False, level.value, message, "Slack not configured or requests missing")
             return False
 
         try:
             payload = {"text": f"[{level.value.upper()}] PowerTrader AI\n{message}"}
             
-            def _post():
-                resp = requests.post(self.config.slack_webhook_url, json=payload, timeout=10)
-                resp.raise_for_status()
-                return resp
-
-            await asyncio.get_event_loop().run_in_executor(None, _post)
-            self._log(True, level.value, message)
+            await self._post_json(self.config.slack_webhook_url, payload)
+            await self._log(True, level.value, message)
             logger.info(f"Slack message sent successfully: {message[:50]}...")
             return True
 
         except Exception as e:
             logger.error(f"Failed to send Slack message: {e}")
-            self._log(False, level.value, message, str(e))
+            await self._log(False, level.value, message, str(e))
             return False
 
 
 class TeamsNotifier(BaseNotifier):
+    DESTINATION_FIELD = "teams_webhook_url"
+
     def __init__(self, config: NotificationConfig, db: NotificationDatabase):
         super().__init__(config, db)
         self.enabled = config.teams_webhook_url and REQUESTS_AVAILABLE
@@ -576,7 +758,7 @@ class TeamsNotifier(BaseNotifier):
     ) -> bool:
         if not self.is_available():
             logger.warning("Teams notifier not available")
-            self._log(False, level.value, message, "Teams not configured or requests missing")
+            await self._log(False, level.value, message, "Teams not configured or requests missing")
             return False
 
         try:
@@ -609,23 +791,20 @@ class TeamsNotifier(BaseNotifier):
                 ]
             }
             
-            def _post():
-                resp = requests.post(self.config.teams_webhook_url, json=payload, timeout=10)
-                resp.raise_for_status()
-                return resp
-
-            await asyncio.get_event_loop().run_in_executor(None, _post)
-            self._log(True, level.value, message)
+            await self._post_json(self.config.teams_webhook_url, payload)
+            await self._log(True, level.value, message)
             logger.info(f"Teams message sent successfully: {message[:50]}...")
             return True
 
         except Exception as e:
             logger.error(f"Failed to send Teams message: {e}")
-            self._log(False, level.value, message, str(e))
+            await self._log(False, level.value, message, str(e))
             return False
 
 
 class TwilioNotifier(BaseNotifier):
+    DESTINATION_FIELD = "twilio_to_number"
+
     def __init__(self, config: NotificationConfig, db: NotificationDatabase):
         super().__init__(config, db)
         self.enabled = (
@@ -654,7 +833,7 @@ class TwilioNotifier(BaseNotifier):
     ) -> bool:
         if not self.is_available():
             logger.warning("Twilio notifier not available")
-            self._log(False, level.value, message, "Twilio not configured or unavailable")
+            await self._log(False, level.value, message, "Twilio not configured or unavailable")
             return False
 
         try:
@@ -671,21 +850,23 @@ class TwilioNotifier(BaseNotifier):
                 )
 
             await asyncio.get_event_loop().run_in_executor(None, _send_sms)
-            self._log(True, level.value, message)
+            await self._log(True, level.value, message)
             logger.info(f"Twilio SMS sent successfully: {message[:50]}...")
             return True
 
         except TwilioRestException as e:
             logger.error(f"Twilio API Error: {e}")
-            self._log(False, level.value, message, str(e))
+            await self._log(False, level.value, message, str(e))
             return False
         except Exception as e:
             logger.error(f"Failed to send Twilio message: {e}")
-            self._log(False, level.value, message, str(e))
+            await self._log(False, level.value, message, str(e))
             return False
 
 
 class OneSignalNotifier(BaseNotifier):
+    DESTINATION_FIELD = "onesignal_app_id"
+
     def __init__(self, config: NotificationConfig, db: NotificationDatabase):
         super().__init__(config, db)
         self.enabled = config.onesignal_app_id and config.onesignal_rest_api_key and REQUESTS_AVAILABLE
@@ -701,7 +882,7 @@ class OneSignalNotifier(BaseNotifier):
     ) -> bool:
         if not self.is_available():
             logger.warning("OneSignal notifier not available")
-            self._log(False, level.value, message, "OneSignal not configured or requests missing")
+            await self._log(False, level.value, message, "OneSignal not configured or requests missing")
             return False
 
         try:
@@ -717,23 +898,22 @@ class OneSignalNotifier(BaseNotifier):
                 "contents": {"en": message}
             }
             
-            def _post():
-                resp = requests.post("https://onesignal.com/api/v1/notifications", headers=headers, json=payload, timeout=10)
-                resp.raise_for_status()
-                return resp
-
-            await asyncio.get_event_loop().run_in_executor(None, _post)
-            self._log(True, level.value, message)
+            await self._post_json(
+                "https://onesignal.com/api/v1/notifications", payload, headers=headers
+            )
+            await self._log(True, level.value, message)
             logger.info(f"OneSignal push sent successfully: {message[:50]}...")
             return True
 
         except Exception as e:
             logger.error(f"Failed to send OneSignal push message: {e}")
-            self._log(False, level.value, message, str(e))
+            await self._log(False, level.value, message, str(e))
             return False
 
 
 class WebhookNotifier(BaseNotifier):
+    DESTINATION_FIELD = "custom_webhook_url"
+
     def __init__(self, config: NotificationConfig, db: NotificationDatabase):
         super().__init__(config, db)
         self.enabled = config.custom_webhook_url and REQUESTS_AVAILABLE
@@ -749,7 +929,7 @@ class WebhookNotifier(BaseNotifier):
     ) -> bool:
         if not self.is_available():
             logger.warning("Custom Webhook notifier not available")
-            self._log(False, level.value, message, "Custom Webhook not configured or requests missing")
+            await self._log(False, level.value, message, "Custom Webhook not configured or requests missing")
             return False
 
         try:
@@ -760,19 +940,14 @@ class WebhookNotifier(BaseNotifier):
                 "timestamp": datetime.utcnow().isoformat() + "Z"
             }
             
-            def _post():
-                resp = requests.post(self.config.custom_webhook_url, json=payload, timeout=10)
-                resp.raise_for_status()
-                return resp
-
-            await asyncio.get_event_loop().run_in_executor(None, _post)
-            self._log(True, level.value, message)
+            await self._post_json(self.config.custom_webhook_url, payload)
+            await self._log(True, level.value, message)
             logger.info(f"Webhook pushed successfully: {message[:50]}...")
             return True
 
         except Exception as e:
             logger.error(f"Failed to POST to Custom Webhook: {e}")
-            self._log(False, level.value, message, str(e))
+            await self._log(False, level.value, message, str(e))
             return False
 
 
@@ -815,6 +990,35 @@ class NotificationManager:
             "onesignal": self.onesignal_notifier,
             "webhook": self.webhook_notifier,
         }
+        self._recompute_routing()
+
+        self._dest_queues: Dict[str, asyncio.Queue] = {}
+        self._dest_workers: Dict[str, asyncio.Task] = {}
+        self._dest_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._http: Optional["httpx.AsyncClient"] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
+        for notifier in self.notifiers.values():
+            notifier.get_http = self._get_http
+
+    def _get_http(self) -> "httpx.AsyncClient":
+        """One pooled HTTP client shared by every notifier on the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http_loop is not loop:
+            self._http = new_http_client()
+            self._http_loop = loop
+        return self._http
+
+    def _recompute_routing(self):
+        """Cache the enabled platforms for each level; rerun after config changes."""
+        self._platforms_by_level: Dict[str, tuple] = {
+            level.value: tuple(
+                p
+                for p, enabled in self.config.platforms.items()
+                if enabled and self.config.level_platforms.get(level.value, {}).get(p, False)
+            )
+            for level in NotificationLevel
+        }
 
     def _load_config(self) -> NotificationConfig:
         try:
@@ -841,6 +1045,7 @@ class NotificationManager:
         for key, value in kwargs.items():
             if hasattr(self.config, key):
                 setattr(self.config, key, value)
+        self._recompute_routing()
         self.save_config()
 
     async def send(
@@ -855,12 +1060,7 @@ class NotificationManager:
             return {}
 
         if platforms is None:
-            platforms = [
-                p
-                for p, enabled in self.config.platforms.items()
-                if enabled
-                and self.config.level_platforms.get(level.value, {}).get(p, False)
-            ]
+            platforms = self._platforms_by_level[level.value]
 
         results = {}
         tasks = []
@@ -885,17 +1085,65 @@ class NotificationManager:
                 results[platform] = False
                 continue
 
-            tasks.append((platform, notifier.send(message, level, **kwargs)))
+            tasks.append((platform, self._enqueue(platform, notifier, message, level, kwargs)))
 
-        for platform, task in tasks:
-            try:
-                results[platform] = await task
-            except Exception as e:
-                logger.error(f"Error sending to {platform}: {e}")
-                results[platform] = False
+        if tasks:
+            names, futures = zip(*tasks)
+            done = await asyncio.gather(*futures, return_exceptions=True)
+            for platform, result in zip(names, done):
+                if isinstance(result, Exception):
+                    logger.error(f"Error sending to {platform}: {result}")
+                    results[platform] = False
+                else:
+                    results[platform] = result
 
         return results
 
+    def _enqueue(
+        self,
+        platform: str,
+        notifier: BaseNotifier,
+        message: str,
+        level: NotificationLevel,
+        kwargs: Dict[str, Any],
+    ) -> asyncio.Future:
+        """
+        Queue a send for the notifier's destination and return its result future.
+
+        Each destination (webhook URL, chat id, ...) has its own queue and
+        worker: messages to one destination go out in order, while a slow or
+        rate-limited destination never holds up the others.
+        """
+        loop = asyncio.get_running_loop()
+        if self._dest_loop is not loop:
+            self._dest_queues = {}
+            self._dest_workers = {}
+            self._dest_loop = loop
+
+        key = f"{platform}:{getattr(notifier, 'destination', '')}"
+        queue = self._dest_queues.get(key)
+        if queue is None:
+            queue = self._dest_queues[key] = asyncio.Queue()
+            self._dest_workers[key] = loop.create_task(self._destination_worker(queue))
+
+        future = loop.create_future()
+        queue.put_nowait((notifier, message, level, kwargs, future))
+        return future
+
+    async def _destination_worker(self, queue: asyncio.Queue):
+        while True:
+            notifier, message, level, kwargs, future = await queue.get()
+            try:
+                result = await notifier.send(message, level, **kwargs)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                queue.task_done()
+
     async def send_info(self, message: str, **kwargs) -> Dict[str, bool]:
         return await self.send(message, NotificationLevel.INFO, **kwargs)
 
@@ -919,9 +1167,10 @@ class NotificationManager:
     ):
         stats = self.get_statistics(start_date=start_date, end_date=end_date)
 
-        print("\n" + "=" * 60)
-        print("POWERTRADER AI - NOTIFICATION STATISTICS")
-        print("=" * 60)
+        out = io.StringIO()
+        out.write("\n" + "=" * 60 + "\n")
+        out.write("POWERTRADER AI - NOTIFICATION STATISTICS\n")
+        out.write("=" * 60 + "\n")
 
         period_str = "All time"
         if start_date and end_date:
@@ -933,44 +1182,47 @@ class NotificationManager:
         elif end_date:
             period_str = f"Until {end_date.strftime('%Y-%m-%d')}"
 
-        print(f"\nPeriod: {period_str}")
-        print("-" * 40)
-        print(f"Total Notifications:  {stats['total']:>10}")
-        print(f"Successful:           {stats['successful']:>10}")
-        print(f"Failed:               {stats['failed']:>10}")
-        print(f"Success Rate:         {stats['success_rate']:>9.1f}%")
+        out.write(f"\nPeriod: {period_str}\n")
+        out.write("-" * 40 + "\n")
+        out.write(f"Total Notifications:  {stats['total']:>10}\n")
+        out.write(f"Successful:           {stats['successful']:>10}\n")
+        out.write(f"Failed:               {stats['failed']:>10}\n")
+        out.write(f"Success Rate:         {stats['success_rate']:>9.1f}%\n")
 
-        if stats["by_level"]:
-            print(f"\nBY LEVEL")
-            print("-" * 40)
-            for level, data in stats["by_level"].items():
-                rate = (
-                    (data["successful"] / data["total"] * 100)
-                    if data["total"] > 0
-                    else 0
-                )
-                print(
-                    f"{level.upper():<10} {data['total']:>5} sent  {rate:>5.1f}% success"
-                )
-
-        if stats["by_platform"]:
-            print(f"\nBY PLATFORM")
-            print("-" * 40)
-            for platform, data in stats["by_platform"].items():
+        for title, groups in (("BY LEVEL", stats["by_level"]), ("BY PLATFORM", stats["by_platform"])):
+            if not groups:
+                continue
+            out.write(f"\n{title}\n")
+            out.write("-" * 40 + "\n")
+            for name, data in groups.items():
                 rate = (
                     (data["successful"] / data["total"] * 100)
                     if data["total"] > 0
                     else 0
                 )
-                print(
-                    f"{platform.upper():<10} {data['total']:>5} sent  {rate:>5.1f}% success"
+                out.write(
+                    f"{name.upper():<10} {data['total']:>5} sent  {rate:>5.1f}% success\n"
                 )
 
-        print("\n" + "=" * 60)
+        out.write("\n" + "=" * 60 + "\n")
+        sys.stdout.write(out.getvalue())
 
     async def close(self):
+        if self._dest_loop is asyncio.get_running_loop():
+            for queue in self._dest_queues.values():
+                await queue.join()
+            for worker in self._dest_workers.values():
+                worker.cancel()
+        self._dest_queues = {}
+        self._dest_workers = {}
+        self._dest_loop = None
         if self.telegram_notifier.enabled:
             await self.telegram_notifier.close()
+        if self._http is not None and self._http_loop is asyncio.get_running_loop():
+            await self._http.aclose()
+        self._http = None
+        await self.db.flush()
+        self.db.close()
 
 
 def create_notification_manager(
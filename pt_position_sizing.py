@@ -15,7 +15,7 @@ import os
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 
 
@@ -183,6 +183,81 @@ class PositionSizer:
             print(f"[PositionSizer] Error calculating ATR for {symbol}: {e}")
             return 0.0
 
+    def get_volatility_batch(
+        self, symbols: List[str], lookback_days: int = 14
+    ) -> Dict[str, VolatilityMetrics]:
+        """
+        Calculate 14-period ATR metrics for several symbols with one query.
+
+        Rows for every symbol are fetched in a single ``IN (...)`` query and
+        split per symbol; the ATR matches calculate_atr() for each of them.
+        Symbols with too little history are left out of the result.
+
+        Args:
+            symbols: Trading symbols
+            lookback_days: Days of historical data to analyze (default 14)
+
+        Returns:
+            Dictionary of symbol -> VolatilityMetrics
+        """
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
+        if not self.cursor:
+            self._connect()
+
+        try:
+            cutoff_date = datetime.now() - timedelta(days=lookback_days * 2)
+            placeholders = ",".join("?" * len(symbols))
+            query = f"""
+                SELECT symbol, close_price, high_price, low_price
+                FROM trade_exits
+                WHERE symbol IN ({placeholders})
+                    AND timestamp >= ?
+                ORDER BY symbol, timestamp
+            """
+            self.cursor.execute(query, (*symbols, cutoff_date.isoformat(" ")))
+            rows = self.cursor.fetchall()
+        except Exception as e:
+            print(f"[PositionSizer] Error loading volatility data: {e}")
+            return {}
+
+        by_symbol: Dict[str, list] = {}
+        for symbol, close, high, low in rows:
+            by_symbol.setdefault(symbol, []).append((close, high, low))
+
+        now = datetime.now()
+        result = {}
+        for symbol, prices in by_symbol.items():
+            # calculate_atr() looks at the latest 1000 rows
+            prices = np.array(prices[-1000:], dtype=np.float64)
+            if len(prices) < 20:
+                continue
+            close, high, low = prices[:, 0], prices[:, 1], prices[:, 2]
+            prev_close = close[:-1]
+            true_range = np.maximum.reduce(
+                [
+                    high[1:] - low[1:],
+                    np.abs(high[1:] - prev_close),
+                    np.abs(low[1:] - prev_close),
+                ]
+            )
+            if len(true_range) < 14:
+                continue
+
+            atr = float(true_range[-14:].mean())
+            prev_atr = float(true_range[-15:-1].mean()) if len(true_range) >= 15 else 0.0
+            result[symbol] = VolatilityMetrics(
+                symbol=symbol,
+                atr=atr,
+                atr_pct_change=(atr / prev_atr - 1) * 100 if prev_atr > 0 else 0.0,
+                atr_pct_position=atr / close[-1] * 100 if close[-1] else 0.0,
+                timestamp=now,
+                timeframe=f"{lookback_days}d",
+            )
+
+        return result
+
     def get_market_volatility(self, symbol: str, period: int = 30) -> pd.DataFrame:
         """
         Get market volatility data for a symbol.
@@ -304,6 +379,51 @@ class PositionSizer:
             volatility_level=volatility_level,
         )
 
+    def calculate_position_sizes(
+        self,
+        account_value: float,
+        atr_pcts: np.ndarray,
+        risk_pct: Optional[float] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized calculate_position_size over many symbols at once.
+
+        Sizing only depends on ATR relative to price, so it takes each
+        symbol's ATR as a percentage of its price; 0 falls back to the same
+        2% default as the scalar version.
+
+        Args:
+            account_value: Total account value in USD
+            atr_pcts: ATR as a percentage of price, one per symbol
+            risk_pct: Risk percentage (overrides default if not None)
+
+        Returns:
+            Dictionary of arrays: position_size_usd, position_size_pct,
+            risk_amount, volatility_factor and atr_pct (after the 2% fallback)
+        """
+        atr_pct = np.asarray(atr_pcts, dtype=np.float64)
+        atr_pct = np.where(atr_pct == 0, 2.0, atr_pct)
+
+        risk_to_use = risk_pct if risk_pct is not None else self.default_risk_pct
+        kelly_adj = kelly_fraction(0.60, 1.0, 1.0)
+        risk_to_use = min(risk_to_use * (1 + kelly_adj), self.max_risk_pct)
+
+        volatility_factor = np.select(
+            [atr_pct < 1.0, atr_pct < 2.0, atr_pct > 5.0], [1.5, 1.25, 0.75], 1.0
+        )
+        position_pct = np.clip(
+            risk_to_use * volatility_factor, self.min_risk_pct, self.max_risk_pct
+        )
+        position_size_usd = account_value * position_pct
+
+        return {
+            "position_size_usd": position_size_usd,
+            "position_size_pct": position_pct * 100,
+            "risk_amount": position_size_usd * risk_to_use,
+            "volatility_factor": volatility_factor,
+            "atr_pct": atr_pct,
+        }
+
     def get_sizing_recommendation(
         self,
         symbol: str,
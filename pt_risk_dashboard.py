@@ -1,24 +1,129 @@
+import base64
 import tkinter as tk
 from tkinter import ttk
 import threading
-from pt_correlation import CorrelationAnalyzer, calculate_portfolio_correlation
-from pt_position_sizing import PositionSizer
-from pt_config import ConfigManager
-import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+import numpy as np
+
+# Cell colours for low (< 0.3), moderate and high (> 0.7) correlation
+MATRIX_COLORS = np.array(["#004400", "#444400", "#880000"])
+
+
+def matrix_values(matrix, coins):
+    """Correlation array or dict-of-dicts -> (n, n) float32 array with a unit diagonal."""
+    if isinstance(matrix, np.ndarray):
+        # astype copies, so the caller's array is left untouched
+        vals = matrix.astype(np.float32)
+        np.fill_diagonal(vals, 1.0)
+        return vals
+    vals = np.array(
+        [[matrix.get(a, {}).get(b, 0.0) for b in coins] for a in coins], dtype=np.float32
+    ).reshape(len(coins), len(coins))
+    np.fill_diagonal(vals, 1.0)
+    return vals
+
+
+def color_indices(vals):
+    """Branchless MATRIX_COLORS index: 0 below 0.3, 2 above 0.7, 1 between."""
+    return (vals >= 0.3).astype(np.uint8) + (vals > 0.7)
+
+
+# RGB rows for MATRIX_COLORS, plus black for the cell borders
+_CELL_RGB = np.array(
+    [[int(c[k:k + 2], 16) for k in (1, 3, 5)] for c in MATRIX_COLORS] + [[0, 0, 0]],
+    dtype=np.uint8,
+)
+_BORDER = len(MATRIX_COLORS)
+
+
+def heatmap_ppm(indices, width, height):
+    """
+    Render an (n, n) colour-index grid as a width x height binary PPM.
+
+    indices[i, j] is the cell in column i and row j; every cell gets a
+    one-pixel black border on its top/left edge, like the old outlined
+    rectangles.
+    """
+    n = indices.shape[0]
+    width = max(int(width), 1)
+    height = max(int(height), 1)
+    col = np.minimum(np.arange(width) * n // width, n - 1)
+    row = np.minimum(np.arange(height) * n // height, n - 1)
+
+    pixels = indices[col[None, :], row[:, None]]
+    pixels[:, np.r_[True, col[1:] != col[:-1]]] = _BORDER
+    pixels[np.r_[True, row[1:] != row[:-1]], :] = _BORDER
+    pixels[:, -1] = _BORDER
+    pixels[-1, :] = _BORDER
+
+    return b"P6\n%d %d\n255\n" % (width, height) + _CELL_RGB[pixels].tobytes()
+
+
+# Correlation runs in a worker process so its NumPy/Python work never holds
+# the GIL the Tk mainloop and trader threads need; created on first refresh
+_analysis_pool = None
+_analysis_pool_lock = threading.Lock()
+
+# Per-process analyzers, so the worker keeps its returns cache between refreshes
+_analyzers = {}
+
+
+def _get_analysis_pool():
+    global _analysis_pool
+    with _analysis_pool_lock:
+        if _analysis_pool is None:
+            _analysis_pool = ProcessPoolExecutor(max_workers=1)
+        return _analysis_pool
+
+
+def _compute_matrix(db_path, coins):
+    """Worker-process entry point: the float32 correlation array for coins."""
+    analyzer = _analyzers.get(db_path)
+    if analyzer is None:
+        from pt_correlation import CorrelationAnalyzer
+
+        analyzer = _analyzers[db_path] = CorrelationAnalyzer(db_path)
+    matrix, _ = analyzer.calculate_correlation_array(coins, dtype=np.float32)
+    return matrix
+
 
 class RiskDashboard(ttk.Frame):
     def __init__(self, parent, coin_list, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
         self.coin_list = coin_list
 
+        # Analysis modules (pandas, numba) are imported when first used, not
+        # when the hub builds this tab
+        from pt_config import ConfigManager
+
         cm = ConfigManager()
         self.db_path = cm.get().analytics.database_path
 
-        self.corr_analyzer = CorrelationAnalyzer(self.db_path)
-        self.sizer = PositionSizer(self.db_path)
+        # Heatmap kept across refreshes: one image for the cell colours and a
+        # text item per cell, (i, j) -> text_id
+        self._heatmap = None
+        self._heatmap_size = None
+        self._cell_ids = {}
+        self._cell_layout = None
+        self._cell_colors = None
+        self._cell_labels = None
+
+        # Canvas size as last reported by <Configure>; None until it is mapped
+        self._canvas_w = None
+        self._canvas_h = None
+        self._last_matrix = None
+        self._redraw_pending = False
 
         self._setup_ui()
 
+    @cached_property
+    def sizer(self):
+        from pt_position_sizing import PositionSizer
+
+        return PositionSizer(self.db_path)
+
     def _setup_ui(self):
         # Top control bar
         top = ttk.Frame(self)
@@ -43,6 +148,7 @@ class RiskDashboard(ttk.Frame):
 
         self.matrix_canvas = tk.Canvas(corr_frame, bg="#000000") # Placeholder background
         self.matrix_canvas.pack(fill="both", expand=True)
+        self.matrix_canvas.bind("<Configure>", self._on_canvas_resize)
 
         # --- Position Sizing ---
         size_frame = ttk.LabelFrame(right_frame, text="Volatility-Adjusted Position Sizing")
@@ -73,85 +179,143 @@ class RiskDashboard(ttk.Frame):
 
     def refresh(self):
         self.status_lbl.config(text="Analyzing...")
-        threading.Thread(target=self._run_analysis, daemon=True).start()
+        future = _get_analysis_pool().submit(_compute_matrix, self.db_path, list(self.coin_list))
+        future.add_done_callback(self._run_analysis)
 
-    def _run_analysis(self):
+    def _run_analysis(self, future):
         try:
             # Correlation
-            matrix = self.corr_analyzer.calculate_correlation_matrix(self.coin_list)
+            matrix = future.result()
+        except Exception as e:
+            self.after(0, self.status_lbl.config, {"text": f"Error: {e}"})
+            return
 
-            self.after(0, lambda: self._draw_matrix(matrix))
-            self.after(0, lambda: self.status_lbl.config(text=f"Updated {os.times()}")) # simpler timestamp
+        # One mainloop event for the redraw and the status update
+        self.after(0, self._on_matrix, matrix, time.strftime("%H:%M:%S"))
 
-        except Exception as e:
-            self.after(0, lambda: self.status_lbl.config(text=f"Error: {e}"))
+    def _on_matrix(self, matrix, ts):
+        self._draw_matrix(matrix)
+        self.status_lbl.config(text=f"Updated {ts}")
+
+    def _invalidate_matrix(self):
+        """Drop the heatmap item pool so the next draw rebuilds it at the new size."""
+        self._cell_ids = {}
+        self._cell_layout = None
+
+    def _on_canvas_resize(self, event):
+        if (event.width, event.height) == (self._canvas_w, self._canvas_h):
+            return
+        self._canvas_w = event.width
+        self._canvas_h = event.height
+        self._invalidate_matrix()
+
+        # A drag fires many <Configure> events; redraw once things settle
+        if self._last_matrix is not None and not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._redraw_matrix)
+
+    def _redraw_matrix(self):
+        self._redraw_pending = False
+        self._draw_matrix(self._last_matrix)
 
     def _draw_matrix(self, matrix):
-        self.matrix_canvas.delete("all")
+        self._last_matrix = matrix
 
         n = len(self.coin_list)
-        if n == 0: return
-
-        w = self.matrix_canvas.winfo_width()
-        h = self.matrix_canvas.winfo_height()
+        if n == 0:
+            self.matrix_canvas.delete("all")
+            self._invalidate_matrix()
+            return
+
+        # Not mapped yet: the first <Configure> will draw it at the real size
+        if self._canvas_w is None:
+            return
+        w = self._canvas_w
+        h = self._canvas_h
+
+        vals = matrix_values(matrix, self.coin_list)
+        colors = color_indices(vals)
+        labels = np.char.mod("%.2f", vals)
+
+        layout = (w, h, tuple(self.coin_list))
+        if self._cell_layout == layout and len(self._cell_ids) == n * n:
+            self._update_cells(colors, labels)
+        else:
+            self._build_cells(w, h, colors, labels)
+            self._cell_layout = layout
+
+        self._cell_colors = colors
+        self._cell_labels = labels
+
+    def _heatmap_data(self, colors):
+        return base64.b64encode(heatmap_ppm(colors, *self._heatmap_size))
+
+    def _update_cells(self, colors, labels):
+        """Repaint the heatmap image if any colour changed and re-label changed cells."""
+        if not np.array_equal(colors, self._cell_colors):
+            self._heatmap.configure(data=self._heatmap_data(colors))
+
+        itemconfig = self.matrix_canvas.itemconfig
+        cell_ids = self._cell_ids
+        for i, j in zip(*np.nonzero(labels != self._cell_labels)):
+            itemconfig(cell_ids[i, j], text=str(labels[i, j]))
+
+    def _build_cells(self, w, h, colors, labels):
+        canvas = self.matrix_canvas
+        canvas.delete("all")
 
+        n = len(self.coin_list)
         cell_w = w / (n + 1)
         cell_h = h / (n + 1)
 
+        centers_x = ((np.arange(n) + 1.5) * cell_w).tolist()
+        centers_y = ((np.arange(n) + 1.5) * cell_h).tolist()
+
+        create_text = canvas.create_text
+
         # Draw headers
         for i, coin in enumerate(self.coin_list):
-            self.matrix_canvas.create_text((i + 1.5) * cell_w, 0.5 * cell_h, text=coin, fill="white")
-            self.matrix_canvas.create_text(0.5 * cell_w, (i + 1.5) * cell_h, text=coin, fill="white")
-
-        # Draw grid
-        for i, coin_a in enumerate(self.coin_list):
-            for j, coin_b in enumerate(self.coin_list):
-                if i == j:
-                    val = 1.0
-                else:
-                    val = matrix.get(coin_a, {}).get(coin_b, 0.0)
-
-                # Color map: Red (1.0) -> Green (0.0)
-                # Actually Red (1.0) -> Yellow -> Green (0.0) or Blue (-1.0)
-                # Simple: Red > 0.7, Green < 0.3, Yellow otherwise
-                if val > 0.7:
-                    color = "#880000" # Dark Red
-                elif val < 0.3:
-                    color = "#004400" # Dark Green
-                else:
-                    color = "#444400" # Dark Yellow
-
-                x1 = (i + 1) * cell_w
-                y1 = (j + 1) * cell_h
-                x2 = x1 + cell_w
-                y2 = y1 + cell_h
-
-                self.matrix_canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="black")
-                self.matrix_canvas.create_text((x1+x2)/2, (y1+y2)/2, text=f"{val:.2f}", fill="white")
+            create_text(centers_x[i], 0.5 * cell_h, text=coin, fill="white")
+            create_text(0.5 * cell_w, centers_y[i], text=coin, fill="white")
+
+        # All n * n cell colours are one image rather than n * n rectangles
+        self._heatmap_size = (round(n * cell_w), round(n * cell_h))
+        self._heatmap = tk.PhotoImage(master=canvas, data=self._heatmap_data(colors))
+        canvas.create_image(cell_w, cell_h, image=self._heatmap, anchor="nw")
+
+        # Labels on top (column i = coin_a, row j = coin_b)
+        cell_ids = {}
+        for i in range(n):
+            cx = centers_x[i]
+            col_labels = labels[i].tolist()
+            for j in range(n):
+                cell_ids[i, j] = create_text(cx, centers_y[j], text=col_labels[j], fill="white")
+        self._cell_ids = cell_ids
 
     def _calculate_sizing(self):
         balance = self.balance_var.get()
         risk_pct = self.risk_var.get() / 100.0
 
-        # We need volatility data. If we don't have DB data, generate sample?
-        # Ideally fetch from DB populated by pt_analytics/pt_volume
-        # For now, let's assume PositionSizer can get data or we mock it if empty
-
-        # To make this real, we'd need price history in the DB.
-        # PositionSizer.get_volatility needs trade history or OHLCV in DB.
-        # Currently pt_analytics stores trades.
-
-        # I'll just show placeholders if DB empty
-        for i in self.size_tree.get_children():
-            self.size_tree.delete(i)
-
-        for coin in self.coin_list:
-            # Mock calculation if DB empty
-            metrics = self.sizer.get_volatility(coin)
-            # If metrics is dummy, we show defaults
-
-            rec = self.sizer.calculate_position_size(balance, risk_pct, metrics.atr_pct if metrics else 0.05)
-
-            self.size_tree.insert("", "end", values=(
-                coin, f"{rec.metrics.atr_pct*100:.1f}%", f"${rec.recommended_size_usd:,.2f}", f"{rec.volatility_factor:.2f}x"
-            ))
+        # One query for every coin's ATR instead of one per coin
+        metrics = self.sizer.get_volatility_batch(self.coin_list)
+
+        atr_pcts = np.array(
+            [getattr(metrics.get(coin), "atr_pct_position", 0.0) for coin in self.coin_list],
+            dtype=np.float32,
+        )
+        sizes = self.sizer.calculate_position_sizes(balance, atr_pcts, risk_pct=risk_pct)
+
+        # Format whole columns at once; only the thousands separator needs str.format
+        rows = list(zip(
+            self.coin_list,
+            np.char.mod("%.1f%%", sizes["atr_pct"]).tolist(),
+            list(map("${:,.2f}".format, sizes["position_size_usd"].tolist())),
+            np.char.mod("%.2fx", sizes["volatility_factor"]).tolist(),
+        ))
+
+        # Clear in one call and insert under the coin as iid
+        tree = self.size_tree
+        tree.delete(*tree.get_children())
+        insert = tree.insert
+        for row in rows:
+            insert("", "end", iid=row[0], values=row)
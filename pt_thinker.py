@@ -935,18 +935,8 @@ def step_coin(sym: str):
         while True:
             try:
                 current = robinhood_current_ask(rh_symbol)
-                arb_opp = detect_arbitrage_opportunities(sym, min_spread_pct=0.3)
-
-                if arb_opp:
-                    print(f"\n[ARBITRAGE OPPORTUNITY]")
-                    print(f"  Coin: {arb_opp['coin']}")
-                    print(
-                        f"  Buy: {arb_opp['buy_exchange']} @ ${arb_opp['buy_price']:,.2f}"
-                    )
-                    print(
-                        f"  Sell: {arb_opp['sell_exchange']} @ ${arb_opp['sell_price']:,.2f}"
-                    )
-                    print(f"  Spread: {arb_opp['spread_pct']:.2f}%")
+                # Logs the opportunity itself if there is one
+                detect_arbitrage_opportunities(sym, min_spread_pct=0.3)
 
                 break
             except Exception as e:
@@ -16,11 +16,28 @@ Integration pattern:
 - Robinhood current price fetch is unchanged (still used for execution price)
 """
 
-from pt_exchanges import ExchangeManager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pt_exchanges import ExchangeManager, TIMEFRAME_SECONDS
+import os
+import sys
 import time
 
 _exchange_manager = None
 
+# Seconds an aggregated price is reused; one thinker tick asks for the same
+# coin from several places, and each miss costs a REST call per exchange
+CACHE_TTL = float(os.environ.get("POWERTRADER_PRICE_CACHE_TTL", "1.0"))
+
+# (coin, method) -> (price, spread_pct, expiry)
+_price_cache = {}
+# (coin, timeframe, exchange) -> (candle, expiry); a tenth of a bar is reused
+_candle_cache = {}
+
+# Candle sources are queried concurrently; once any of them answers, the
+# higher-priority ones get this many seconds to finish before it is used
+PRIMARY_GRACE = 0.25
+_candle_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="candles")
+
 
 def init_exchanges():
     global _exchange_manager
@@ -38,6 +55,12 @@ def get_aggregated_current_price(coin_symbol, method="median"):
     if _exchange_manager is None:
         init_exchanges()
 
+    key = (coin_symbol, method)
+    now = time.monotonic()
+    cached = _price_cache.get(key)
+    if cached is not None and now < cached[2]:
+        return cached[0]
+
     try:
         agg = _exchange_manager.get_aggregated_price(coin=coin_symbol, method=method)
         if agg:
@@ -46,6 +69,7 @@ def get_aggregated_current_price(coin_symbol, method="median"):
                 print(
                     f"[Arbitrage] {coin_symbol}: {spread_pct:.2f}% spread detected across exchanges"
                 )
+            _price_cache[key] = (agg["aggregated_price"], spread_pct, now + CACHE_TTL)
             return agg["aggregated_price"]
     except Exception as e:
         print(f"[Exchange] Error fetching aggregated price for {coin_symbol}: {e}")
@@ -57,26 +81,71 @@ def get_candle_from_exchanges(coin_symbol, timeframe, exchange="kucoin"):
     if _exchange_manager is None:
         init_exchanges()
 
+    key = (coin_symbol, timeframe, exchange)
+    now = time.monotonic()
+    cached = _candle_cache.get(key)
+    if cached is not None and now < cached[1]:
+        return cached[0]
+
     exchanges_to_try = [exchange]
     if exchange == "kucoin":
         exchanges_to_try.extend(["binance", "coinbase"])
 
-    for ex in exchanges_to_try:
-        try:
-            candles = _exchange_manager.get_candles(
-                coin=coin_symbol.replace("-USDT", ""),
-                exchange=ex,
-                timeframe=timeframe,
-                limit=1,
-            )
-            if candles:
-                return candles[0]
-        except Exception as e:
-            if ex == exchange:
-                print(f"Warning: {ex} candle fetch failed, trying fallback...")
-            continue
+    coin = coin_symbol.replace("-USDT", "")
+    futures = {
+        _candle_pool.submit(_fetch_candle, coin, ex, timeframe): rank
+        for rank, ex in enumerate(exchanges_to_try)
+    }
+
+    results = {}
+    failed = set()
+    pending = set(futures)
+    deadline = None
+    while pending:
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        for future in done:
+            rank = futures[future]
+            try:
+                candle = future.result()
+            except Exception:
+                candle = None
+                if rank == 0:
+                    print(f"Warning: {exchange} candle fetch failed, trying fallback...")
+            if candle is None:
+                failed.add(rank)
+            else:
+                results[rank] = candle
+        if results:
+            best = min(results)
+            # Nothing ahead of the best answer is still outstanding
+            if all(rank in failed for rank in range(best)):
+                break
+            if deadline is None:
+                deadline = time.monotonic() + PRIMARY_GRACE
+
+    for future in pending:
+        future.cancel()
+
+    if not results:
+        return None
+
+    candle = results[min(results)]
+    ttl = TIMEFRAME_SECONDS.get(timeframe, 3600) / 10
+    _candle_cache[key] = (candle, now + ttl)
+    return candle
 
-    return None
+
+def _fetch_candle(coin, exchange, timeframe):
+    candles = _exchange_manager.get_candles(
+        coin=coin,
+        exchange=exchange,
+        timeframe=timeframe,
+        limit=1,
+    )
+    return candles[0] if candles else None
 
 
 def detect_arbitrage_opportunities(coin_symbol, min_spread_pct=0.3):
@@ -89,11 +158,14 @@ def detect_arbitrage_opportunities(coin_symbol, min_spread_pct=0.3):
             coin_symbol, min_spread_pct=min_spread_pct
         )
         if arb:
-            print(f"\n[ARBITRAGE OPPORTUNITY]")
-            print(f"  Coin: {arb['coin']}")
-            print(f"  Buy: {arb['buy_exchange']} @ ${arb['buy_price']:,.2f}")
-            print(f"  Sell: {arb['sell_exchange']} @ ${arb['sell_price']:,.2f}")
-            print(f"  Spread: {arb['spread_pct']:.2f}%")
+            # One write (one stdout lock/flush) for the whole block
+            sys.stdout.write(
+                f"\n[ARBITRAGE OPPORTUNITY]\n"
+                f"  Coin: {arb['coin']}\n"
+                f"  Buy: {arb['buy_exchange']} @ ${arb['buy_price']:,.2f}\n"
+                f"  Sell: {arb['sell_exchange']} @ ${arb['sell_price']:,.2f}\n"
+                f"  Spread: {arb['spread_pct']:.2f}%\n"
+            )
         return arb
     except Exception as e:
         print(f"[Exchange] Error checking arbitrage: {e}")
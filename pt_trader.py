@@ -1,22 +1,53 @@
+import atexit
 import base64
+import bisect
 import datetime
+import functools
 import json
+import tempfile
+import threading
 import uuid
 import time
-import math
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Optional
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 from nacl.signing import SigningKey
 import os
+import re
+import sys
 import colorama
 from colorama import Fore, Style
 import traceback
-from cryptography.hazmat.primitives.asymmetric import ed25519
-from cryptography.hazmat.primitives import serialization
 from pt_config import ConfigManager
 from pt_risk_management import RiskManager
 from pt_rebalancer import Rebalancer
 
+try:
+    import orjson
+
+    # numpy scalars can reach the status dict from the per-tick array math
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _json_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=_ORJSON_OPTS)
+
+    def _json_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=_ORJSON_OPTS | orjson.OPT_APPEND_NEWLINE)
+
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def _json_line(obj: Any) -> bytes:
+        return _json_bytes(obj) + b"\n"
+
+    _json_loads = json.loads
+
 try:
     from pt_analytics import TradeJournal
 
@@ -37,11 +68,24 @@ TRADER_STATUS_PATH = os.path.join(HUB_DATA_DIR, "trader_status.json")
 TRADE_HISTORY_PATH = os.path.join(HUB_DATA_DIR, "trade_history.jsonl")
 PNL_LEDGER_PATH = os.path.join(HUB_DATA_DIR, "pnl_ledger.json")
 ACCOUNT_VALUE_HISTORY_PATH = os.path.join(HUB_DATA_DIR, "account_value_history.jsonl")
+DCA_STATE_PATH = os.path.join(HUB_DATA_DIR, "dca_state.json")
+
+# { "BTC": current_buy_price, ... } in the working directory, where the
+# per-coin <SYM>_current_price.txt files used to be written
+CURRENT_PRICES_PATH = "current_prices.json"
 
 
 # Initialize colorama
 colorama.init(autoreset=True)
 
+# Cursor home, erase screen and scrollback: what `clear` prints, without
+# spawning a shell every tick (colorama translates it on legacy Windows consoles)
+CLEAR_SCREEN = "\x1b[H\x1b[2J\x1b[3J"
+
+GREEN = Fore.GREEN
+RED = Fore.RED
+RESET = Style.RESET_ALL
+
 
 def _build_base_paths(main_dir_in: str, coins_in: list) -> dict:
     """
@@ -52,6 +96,9 @@ def _build_base_paths(main_dir_in: str, coins_in: list) -> dict:
     """
     out = {"BTC": main_dir_in}
     try:
+        # One directory listing instead of a stat per coin
+        with os.scandir(main_dir_in) as it:
+            subdirs = {os.path.normcase(e.name) for e in it if e.is_dir()}
         for sym in coins_in:
             sym = str(sym).strip().upper()
             if not sym:
@@ -59,14 +106,108 @@ def _build_base_paths(main_dir_in: str, coins_in: list) -> dict:
             if sym == "BTC":
                 out["BTC"] = main_dir_in
                 continue
-            sub = os.path.join(main_dir_in, sym)
-            if os.path.isdir(sub):
-                out[sym] = sub
+            if os.path.normcase(sym) in subdirs:
+                out[sym] = os.path.join(main_dir_in, sym)
     except Exception:
         pass
     return out
 
 
+def _iter_lines_reversed(path: str, block_size: int = 65536):
+    """Yield the lines of a file newest-first (as bytes, without newlines)."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        tail = b""
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + tail).split(b"\n")
+            # The first piece may be the end of a line that starts further back
+            tail = lines.pop(0)
+            for line in reversed(lines):
+                yield line
+        yield tail
+
+
+# Numeric tokens in a low_bound_prices.html price list
+_PRICE_TOKEN_RE = re.compile(rb"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+# Leading "ts" of a trade_history.jsonl line (always the first key written),
+# read without parsing the whole record
+_HISTORY_TS_RE = re.compile(rb'\{\s*"ts":\s*(-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)')
+
+# Symbols per best_bid_ask request; keeps the query string short
+QUOTE_BATCH_SIZE = 20
+
+# Target time from one manage_trades start to the next (work time included)
+TICK_INTERVAL_S = 0.5
+
+# 1e-9 .. 1e-1: _fmt_price finds a sub-dollar price's decade by bisection
+_DECADES_BELOW_ONE = [1e-9, 1e-8, 1e-7, 1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1]
+
+
+# path -> (mtime_ns, size, parsed value, trusted) for the per-coin signal
+# files, which the thinker rewrites far less often than the trader reads them
+_file_cache = {}
+
+# A read this close to the file's mtime may have raced a same-size rewrite
+# within one timestamp tick, so it is not trusted for cache hits
+_MTIME_SLACK_NS = 2_000_000_000
+
+
+def _read_cached(path: str, parse, default):
+    """parse(bytes) of path, re-read only when its mtime or size changes."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return default
+    cached = _file_cache.get(path)
+    if (
+        cached is not None
+        and cached[3]
+        and cached[0] == st.st_mtime_ns
+        and cached[1] == st.st_size
+    ):
+        return cached[2]
+    try:
+        with open(path, "rb") as f:
+            value = parse(f.read())
+    except Exception:
+        return default
+    trusted = time.time_ns() - st.st_mtime_ns > _MTIME_SLACK_NS
+    _file_cache[path] = (st.st_mtime_ns, st.st_size, value, trusted)
+    return value
+
+
+def _parse_dca_signal(raw: bytes) -> int:
+    return int(float(raw.strip()))
+
+
+def _parse_price_levels(raw: bytes) -> list:
+    # Python-list, comma/semicolon/pipe or newline separated: every
+    # number token is a level, whatever the separators are
+    vals = [float(m) for m in _PRICE_TOKEN_RE.findall(raw)]
+
+    # De-dupe (first occurrence wins, hence reversed), then sort high->low
+    # for stable N1..N7 mapping
+    unique = {round(v, 12): v for v in reversed(vals)}
+    return sorted(unique.values(), reverse=True)
+
+
+def _as_float(value) -> Optional[float]:
+    """float(value) for numbers and numeric strings (API payloads), else None."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
 # Live globals (will be refreshed inside manage_trades())
 crypto_symbols = ["BTC", "ETH", "XRP", "BNB", "DOGE"]
 
@@ -84,8 +225,20 @@ TRAILING_GAP_PCT = 0.5
 PM_START_PCT_NO_DCA = 5.0
 PM_START_PCT_WITH_DCA = 2.5
 
+# Quotes younger than this are served from memory instead of re-fetched
+QUOTE_TTL_SECONDS = 1.0
 
-_last_config_hash = None
+
+# (config file stamp, main_dir stamp) the current globals were built from
+_last_config_stamp = None
+
+
+def _stat_stamp(path) -> Optional[tuple]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
 
 
 def _refresh_paths_and_symbols():
@@ -103,16 +256,21 @@ def _refresh_paths_and_symbols():
         DCA_LEVELS, \
         MAX_DCA_BUYS_PER_24H
     global TRAILING_GAP_PCT, PM_START_PCT_NO_DCA, PM_START_PCT_WITH_DCA
-    global _last_config_hash
+    global QUOTE_TTL_SECONDS
+    global _last_config_stamp
 
     try:
         cm = ConfigManager()
+
+        # One stat each for the config file and main_dir (whose mtime moves
+        # when a coin folder is added) replaces a reload on every tick
+        config_stamp = _stat_stamp(cm.config_path)
+        if (config_stamp, _stat_stamp(main_dir)) == _last_config_stamp:
+            return
+
         cm.reload()
         config = cm.get().trading
 
-        # Check if config actually changed (optional optimization, but good practice)
-        # For now we just apply it every time as reload() is cheap enough
-
         coins = config.coins
         mndir = config.main_neural_dir
 
@@ -125,6 +283,7 @@ def _refresh_paths_and_symbols():
         TRAILING_GAP_PCT = max(0.0, config.trailing_gap_pct)
         PM_START_PCT_NO_DCA = max(0.0, config.pm_start_pct_no_dca)
         PM_START_PCT_WITH_DCA = max(0.0, config.pm_start_pct_with_dca)
+        QUOTE_TTL_SECONDS = max(0.0, config.quote_ttl_seconds)
 
         # Keep it safe if folder isn't real on this machine
         if not mndir or not os.path.isdir(mndir):
@@ -132,51 +291,97 @@ def _refresh_paths_and_symbols():
 
         crypto_symbols = list(coins)
         main_dir = mndir
+        main_dir_stamp = _stat_stamp(main_dir)
         base_paths = _build_base_paths(main_dir, crypto_symbols)
+        _last_config_stamp = (config_stamp, main_dir_stamp)
 
     except Exception as e:
         print(f"Error refreshing settings: {e}")
 
 
 # API STUFF
-API_KEY = ""
-BASE64_PRIVATE_KEY = ""
+CREDENTIALS_MISSING_MESSAGE = (
+    "\n[PowerTrader] Robinhood API credentials not found.\n"
+    "Open the GUI and go to Settings → Robinhood API → Setup / Update.\n"
+    "That wizard will generate your keypair, tell you where to paste the public key on Robinhood,\n"
+    "and will save r_key.txt + r_secret.txt so this trader can authenticate.\n"
+)
 
-try:
-    with open("r_key.txt", "r", encoding="utf-8") as f:
-        API_KEY = (f.read() or "").strip()
-    with open("r_secret.txt", "r", encoding="utf-8") as f:
-        BASE64_PRIVATE_KEY = (f.read() or "").strip()
-except Exception:
-    API_KEY = ""
-    BASE64_PRIVATE_KEY = ""
-
-if not API_KEY or not BASE64_PRIVATE_KEY:
-    print(
-        "\n[PowerTrader] Robinhood API credentials not found.\n"
-        "Open the GUI and go to Settings → Robinhood API → Setup / Update.\n"
-        "That wizard will generate your keypair, tell you where to paste the public key on Robinhood,\n"
-        "and will save r_key.txt + r_secret.txt so this trader can authenticate.\n"
-    )
-    raise SystemExit(1)
+
+class CredentialsMissing(Exception):
+    """r_key.txt / r_secret.txt are absent or empty."""
+
+
+def _read_small_text(path: str, limit: int = 4096) -> str:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, limit).decode("utf-8").strip()
+    finally:
+        os.close(fd)
 
 
 class CryptoAPITrading:
+    _creds = None  # (api_key, base64_private_key), read on first construction
+
+    @classmethod
+    def _load_credentials(cls):
+        if cls._creds is None:
+            try:
+                api_key = _read_small_text("r_key.txt")
+                private_key = _read_small_text("r_secret.txt")
+            except (OSError, UnicodeDecodeError):
+                api_key = private_key = ""
+            if not api_key or not private_key:
+                raise CredentialsMissing(CREDENTIALS_MISSING_MESSAGE)
+            cls._creds = (api_key, private_key)
+        return cls._creds
+
     def __init__(self):
+        api_key, base64_private_key = self._load_credentials()
+
         # keep a copy of folder map (same idea as trader.py)
         self.path_map = dict(base_paths)
 
-        self.api_key = API_KEY
-        private_key_seed = base64.b64decode(BASE64_PRIVATE_KEY)
+        # --- Hub file writes, coalesced by a background flusher ---
+        # Only the newest status is written; JSONL lines are appended in one
+        # write per file per flush.
+        self._pending_status = None
+        self._pending_lines = {}  # { path: [b"line\n", ...] }
+        self._pending_lock = threading.Lock()
+        self._flush_io_lock = threading.Lock()
+        self._flush_interval = 0.25
+        threading.Thread(target=self._flusher_loop, name="hub-flusher", daemon=True).start()
+        atexit.register(self.flush_pending)
+
+        self.api_key = api_key
+        self._api_key_bytes = api_key.encode("utf-8")
+        private_key_seed = base64.b64decode(base64_private_key)
         self.private_key = SigningKey(private_key_seed)
         self.base_url = "https://trading.robinhood.com"
 
+        # Keep-alive connections to the API; no automatic retries, since a
+        # retried POST could place an order twice
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0),
+        )
+        # Shared by every concurrent batch of API calls (reuses threads and,
+        # through the session, their connections across ticks)
+        self._io_pool = ThreadPoolExecutor(max_workers=10, thread_name_prefix="api")
+
         self.dca_levels_triggered = {}  # Track DCA levels for each crypto
         self.dca_levels = list(DCA_LEVELS)  # Hard DCA triggers (percent PnL)
 
         # --- Trailing profit margin (per-coin state) ---
-        # Each coin keeps its own trailing PM line, peak, and "was above line" flag.
-        self.trailing_pm = {}  # { "BTC": {"active": bool, "line": float, "peak": float, "was_above": bool}, . }
+        # Each coin keeps its own trailing PM line, peak, and "was above line" flag,
+        # one dict per field keyed by symbol ("BTC"). A coin has state when it
+        # is in _pm_line; _clear_trailing_pm drops it from all of them.
+        self._pm_active = {}  # { "BTC": bool }
+        self._pm_line = {}  # { "BTC": float }
+        self._pm_peak = {}  # { "BTC": float }
+        self._pm_was_above = {}  # { "BTC": bool }
+        self._pm_settings_sig = {}  # { "BTC": (gap, pm0, pm1) }
         self.trailing_gap_pct = float(TRAILING_GAP_PCT)  # % trail gap behind peak
         self.pm_start_pct_no_dca = float(PM_START_PCT_NO_DCA)
         self.pm_start_pct_with_dca = float(PM_START_PCT_WITH_DCA)
@@ -188,6 +393,10 @@ class CryptoAPITrading:
             float(self.pm_start_pct_with_dca),
         )
 
+        # Holdings quantity each cost basis entry covers; fills move both, and a
+        # mismatch with the exchange (or a fill we can't price) forces a full rebuild
+        self._cost_basis_qty = {}
+        self._cost_basis_dirty = False
         self.cost_basis = (
             self.calculate_cost_basis()
         )  # Initialize cost basis at startup
@@ -197,8 +406,10 @@ class CryptoAPITrading:
         self._pnl_ledger = self._load_pnl_ledger()
         self._reconcile_pending_orders()
 
-        # Cache last known bid/ask per symbol so transient API misses don't zero out account value
+        # Cache last known bid/ask per symbol so transient API misses don't zero out account value;
+        # entries younger than quote_ttl_s are also reused instead of re-fetched
         self._last_good_bid_ask = {}
+        self.quote_ttl_s = float(QUOTE_TTL_SECONDS)
 
         # Cache last *complete* account snapshot so transient holdings/price misses can't write a bogus low value
         self._last_good_account_snapshot = {
@@ -214,33 +425,77 @@ class CryptoAPITrading:
         self.max_dca_buys_per_24h = int(MAX_DCA_BUYS_PER_24H)
         self.dca_window_seconds = 24 * 60 * 60
 
-        self._dca_buy_ts = {}  # { "BTC": [ts, ts, ...] } (DCA buys only)
+        self._dca_buy_ts = {}  # { "BTC": array("d", [ts, ...]) } sorted, DCA buys only
         self._dca_last_sell_ts = {}  # { "BTC": ts_of_last_sell }
-        self._seed_dca_window_from_history()
+        if not self._load_dca_state():
+            self._seed_dca_window_from_history()
+            self._save_dca_state()
         
         # --- Rebalancing state ---
         self.rebalancer = Rebalancer(config=None, db_path=os.path.join(HUB_DATA_DIR, "trades.db"))
         self._last_rebalance_ts = 0.0
+        self._last_tick_ms = 0.0  # duration of the previous manage_trades, for the GUI
+        self._last_prices_written = None  # last CURRENT_PRICES_PATH payload
 
         # --- Analytics integration for persistent trade logging ---
         self.analytics_journal = TradeJournal() if ANALYTICS_AVAILABLE else None
         self._trade_group_ids = {}  # Track trade group IDs for linking entries/DCAs/exits
 
-    def _atomic_write_json(self, path: str, data: dict) -> None:
+    def _atomic_write_json(self, path: str, data: dict, durable: bool = False) -> bool:
+        """
+        Replace path with data via a uniquely named temp file in the same
+        directory. durable=True fsyncs before the rename (the PnL ledger);
+        scratch files for the GUI skip it. Returns False if the write failed.
+        """
+        tmp = None
         try:
-            tmp = f"{path}.tmp"
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=os.path.dirname(path) or ".", prefix=".tmp-", delete=False
+            ) as f:
+                tmp = f.name
+                f.write(_json_bytes(data))
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
             os.replace(tmp, path)
+            return True
         except Exception:
-            pass
+            if tmp is not None:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+            return False
 
     def _append_jsonl(self, path: str, obj: dict) -> None:
         try:
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(obj) + "\n")
+            # Serialize now so later changes to obj don't leak into the file
+            line = _json_line(obj)
         except Exception:
-            pass
+            return
+        with self._pending_lock:
+            self._pending_lines.setdefault(path, []).append(line)
+
+    def _flusher_loop(self) -> None:
+        while True:
+            time.sleep(self._flush_interval)
+            self.flush_pending()
+
+    def flush_pending(self) -> None:
+        """Write the queued status and JSONL lines now."""
+        with self._flush_io_lock:
+            with self._pending_lock:
+                status, self._pending_status = self._pending_status, None
+                lines, self._pending_lines = self._pending_lines, {}
+
+            if status is not None:
+                self._atomic_write_json(TRADER_STATUS_PATH, status)
+            for path, chunk in lines.items():
+                try:
+                    with open(path, "ab") as f:
+                        f.write(b"".join(chunk))
+                except Exception:
+                    pass
 
     def _load_pnl_ledger(self) -> dict:
         try:
@@ -269,7 +524,7 @@ class CryptoAPITrading:
     def _save_pnl_ledger(self) -> None:
         try:
             self._pnl_ledger["last_updated_ts"] = time.time()
-            self._atomic_write_json(PNL_LEDGER_PATH, self._pnl_ledger)
+            self._atomic_write_json(PNL_LEDGER_PATH, self._pnl_ledger, durable=True)
         except Exception:
             pass
 
@@ -277,6 +532,7 @@ class CryptoAPITrading:
         try:
             if not order_id:
                 return False
+            self.flush_pending()
             if not os.path.isfile(TRADE_HISTORY_PATH):
                 return False
             with open(TRADE_HISTORY_PATH, "r", encoding="utf-8") as f:
@@ -285,7 +541,7 @@ class CryptoAPITrading:
                     if not line:
                         continue
                     try:
-                        obj = json.loads(line)
+                        obj = _json_loads(line)
                     except Exception:
                         continue
                     if str(obj.get("order_id", "")).strip() == str(order_id).strip():
@@ -707,19 +963,23 @@ class CryptoAPITrading:
                 print(f"[Analytics] Failed to log trade: {e}")
 
     def _write_trader_status(self, status: dict) -> None:
-        self._atomic_write_json(TRADER_STATUS_PATH, status)
+        # Picked up by the flusher; a newer status simply replaces this one
+        with self._pending_lock:
+            self._pending_status = status
 
     @staticmethod
     def _get_current_timestamp() -> int:
         return int(datetime.datetime.now(tz=datetime.timezone.utc).timestamp())
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _fmt_price(price: float) -> str:
         """
         Dynamic decimal formatting by magnitude:
         - >= 1.0   -> 2 decimals (BTC/ETH/etc won't show 8 decimals)
         - <  1.0   -> enough decimals to show meaningful digits (based on first non-zero),
                      then trim trailing zeros.
+        Cached: the same bid/ask and lines are formatted several times per tick.
         """
         try:
             p = float(price)
@@ -732,17 +992,16 @@ class CryptoAPITrading:
         ap = abs(p)
 
         if ap >= 1.0:
-            decimals = 2
+            s = f"{p:.2f}"
         else:
             # Example:
             # 0.5      -> decimals ~ 4 (prints "0.5" after trimming zeros)
             # 0.05     -> 5
             # 0.005    -> 6
             # 0.000012 -> 8
-            decimals = int(-math.floor(math.log10(ap))) + 3
-            decimals = max(2, min(12, decimals))
-
-        s = f"{p:.{decimals}f}"
+            # (3 past the first significant digit, capped at 12)
+            decimals = min(12, 13 - bisect.bisect_right(_DECADES_BELOW_ONE, ap))
+            s = f"{p:.{decimals}f}"
 
         # Trim useless trailing zeros for cleaner output (0.5000 -> 0.5)
         if "." in s:
@@ -764,13 +1023,7 @@ class CryptoAPITrading:
             sym, main_dir if sym == "BTC" else os.path.join(main_dir, sym)
         )
         path = os.path.join(folder, "long_dca_signal.txt")
-        try:
-            with open(path, "r") as f:
-                raw = f.read().strip()
-            val = int(float(raw))
-            return val
-        except Exception:
-            return 0
+        return _read_cached(path, _parse_dca_signal, 0)
 
     @staticmethod
     def _read_short_dca_signal(symbol: str) -> int:
@@ -786,13 +1039,7 @@ class CryptoAPITrading:
             sym, main_dir if sym == "BTC" else os.path.join(main_dir, sym)
         )
         path = os.path.join(folder, "short_dca_signal.txt")
-        try:
-            with open(path, "r") as f:
-                raw = f.read().strip()
-            val = int(float(raw))
-            return val
-        except Exception:
-            return 0
+        return _read_cached(path, _parse_dca_signal, 0)
 
     @staticmethod
     def _read_long_price_levels(symbol: str) -> list:
@@ -809,38 +1056,8 @@ class CryptoAPITrading:
             sym, main_dir if sym == "BTC" else os.path.join(main_dir, sym)
         )
         path = os.path.join(folder, "low_bound_prices.html")
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                raw = (f.read() or "").strip()
-            if not raw:
-                return []
-
-            # Normalize common formats: python-list, comma-separated, newline-separated
-            raw = raw.strip().strip("[]()")
-            raw = raw.replace(",", " ").replace(";", " ").replace("|", " ")
-            raw = raw.replace("\n", " ").replace("\t", " ")
-            parts = [p for p in raw.split() if p]
-
-            vals = []
-            for p in parts:
-                try:
-                    vals.append(float(p))
-                except Exception:
-                    continue
-
-            # De-dupe, then sort high->low for stable N1..N7 mapping
-            out = []
-            seen = set()
-            for v in vals:
-                k = round(float(v), 12)
-                if k in seen:
-                    continue
-                seen.add(k)
-                out.append(float(v))
-            out.sort(reverse=True)
-            return out
-        except Exception:
-            return []
+        # Copy: callers may reorder or trim the list they get
+        return list(_read_cached(path, _parse_price_levels, []))
 
     def initialize_dca_levels(self):
         """
@@ -853,11 +1070,15 @@ class CryptoAPITrading:
             print("No holdings found. Skipping DCA levels initialization.")
             return
 
+        order_results = self.get_orders_many(
+            [f"{holding['asset_code']}-USD" for holding in holdings.get("results", [])]
+        )
+
         for holding in holdings.get("results", []):
             symbol = holding["asset_code"]
 
             full_symbol = f"{symbol}-USD"
-            orders = self.get_orders(full_symbol)
+            orders = order_results[full_symbol]
 
             if not orders or "results" not in orders:
                 print(f"No orders found for {full_symbol}. Skipping.")
@@ -950,38 +1171,53 @@ class CryptoAPITrading:
         if not os.path.isfile(TRADE_HISTORY_PATH):
             return
 
+        # The history is append-only, so read it newest-first and stop once
+        # records are older than the window (with an hour of slack for
+        # slightly out-of-order timestamps). Sells before the window cannot
+        # exclude any buy inside it, so nothing older is needed.
+        stop_before = cutoff - 3600.0
+
         try:
-            with open(TRADE_HISTORY_PATH, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = (line or "").strip()
-                    if not line:
-                        continue
+            for line in _iter_lines_reversed(TRADE_HISTORY_PATH):
+                line = line.strip()
+                if not line:
+                    continue
 
-                    try:
-                        obj = json.loads(line)
-                    except Exception:
-                        continue
+                # Cheap byte checks first: only sells and DCA buys matter, and
+                # the age cutoff can be read off the leading "ts"
+                m = _HISTORY_TS_RE.match(line)
+                if m is not None and float(m.group(1)) < stop_before:
+                    break
+                if b'"DCA"' not in line and b'sell"' not in line.lower():
+                    continue
 
-                    ts = obj.get("ts", None)
-                    side = str(obj.get("side", "")).lower()
-                    tag = obj.get("tag", None)
-                    sym_full = str(obj.get("symbol", "")).upper().strip()
-                    base = sym_full.split("-")[0].strip() if sym_full else ""
-                    if not base:
-                        continue
+                try:
+                    obj = _json_loads(line)
+                except Exception:
+                    continue
 
-                    try:
-                        ts_f = float(ts)
-                    except Exception:
-                        continue
+                ts = obj.get("ts", None)
+                try:
+                    ts_f = float(ts)
+                except Exception:
+                    continue
+                if ts_f < stop_before:
+                    break
+
+                side = str(obj.get("side", "")).lower()
+                tag = obj.get("tag", None)
+                sym_full = str(obj.get("symbol", "")).upper().strip()
+                base = sym_full.split("-")[0].strip() if sym_full else ""
+                if not base:
+                    continue
 
-                    if side == "sell":
-                        prev = float(self._dca_last_sell_ts.get(base, 0.0) or 0.0)
-                        if ts_f > prev:
-                            self._dca_last_sell_ts[base] = ts_f
+                if side == "sell":
+                    prev = float(self._dca_last_sell_ts.get(base, 0.0) or 0.0)
+                    if ts_f > prev:
+                        self._dca_last_sell_ts[base] = ts_f
 
-                    elif side == "buy" and tag == "DCA":
-                        self._dca_buy_ts.setdefault(base, []).append(ts_f)
+                elif side == "buy" and tag == "DCA":
+                    self._dca_buy_ts.setdefault(base, []).append(ts_f)
 
         except Exception:
             return
@@ -991,7 +1227,55 @@ class CryptoAPITrading:
             last_sell = float(self._dca_last_sell_ts.get(base, 0.0) or 0.0)
             kept = [t for t in ts_list if (t > last_sell) and (t >= cutoff)]
             kept.sort()
-            self._dca_buy_ts[base] = kept
+            self._dca_buy_ts[base] = array("d", kept)
+
+    @staticmethod
+    def _trade_history_size() -> int:
+        try:
+            return os.path.getsize(TRADE_HISTORY_PATH)
+        except OSError:
+            return 0
+
+    def _load_dca_state(self) -> bool:
+        """
+        Restore the DCA window from DCA_STATE_PATH if it was written against
+        the current trade history (same file size); False means reseed.
+        """
+        try:
+            with open(DCA_STATE_PATH, "rb") as f:
+                state = _json_loads(f.read())
+            if state.get("trade_history_size") != self._trade_history_size():
+                return False
+            buy_ts = {
+                str(base): array("d", sorted(float(t) for t in ts_list))
+                for base, ts_list in state["dca_buy_ts"].items()
+            }
+            last_sell_ts = {
+                str(base): float(ts) for base, ts in state["dca_last_sell_ts"].items()
+            }
+        except Exception:
+            return False
+
+        self._dca_buy_ts = buy_ts
+        self._dca_last_sell_ts = last_sell_ts
+        # The snapshot may be older than the window; drop what has aged out
+        for base in list(self._dca_buy_ts):
+            self._dca_window_count(base)
+        return True
+
+    def _save_dca_state(self) -> None:
+        # The recorded size must include any trade line still queued
+        self.flush_pending()
+        self._atomic_write_json(
+            DCA_STATE_PATH,
+            {
+                "trade_history_size": self._trade_history_size(),
+                "dca_buy_ts": {
+                    base: ts_list.tolist() for base, ts_list in self._dca_buy_ts.items()
+                },
+                "dca_last_sell_ts": self._dca_last_sell_ts,
+            },
+        )
 
     def _dca_window_count(
         self, base_symbol: str, now_ts: Optional[float] = None
@@ -1008,9 +1292,14 @@ class CryptoAPITrading:
         cutoff = now - float(getattr(self, "dca_window_seconds", 86400))
         last_sell = float(self._dca_last_sell_ts.get(base, 0.0) or 0.0)
 
-        ts_list = list(self._dca_buy_ts.get(base, []) or [])
-        ts_list = [t for t in ts_list if (t > last_sell) and (t >= cutoff)]
-        self._dca_buy_ts[base] = ts_list
+        # Lists are kept sorted, so everything outside the window is a prefix
+        ts_list = self._dca_buy_ts.setdefault(base, array("d"))
+        expired = max(
+            bisect.bisect_right(ts_list, last_sell),
+            bisect.bisect_left(ts_list, cutoff),
+        )
+        if expired:
+            del ts_list[:expired]
         return len(ts_list)
 
     def _note_dca_buy(self, base_symbol: str, ts: Optional[float] = None) -> None:
@@ -1018,8 +1307,9 @@ class CryptoAPITrading:
         if not base:
             return
         t = float(ts if ts is not None else time.time())
-        self._dca_buy_ts.setdefault(base, []).append(t)
+        bisect.insort(self._dca_buy_ts.setdefault(base, array("d")), t)
         self._dca_window_count(base, now_ts=t)  # prune in-place
+        self._save_dca_state()
 
     def _reset_dca_window_for_trade(
         self, base_symbol: str, sold: bool = False, ts: Optional[float] = None
@@ -1029,19 +1319,97 @@ class CryptoAPITrading:
             return
         if sold:
             self._dca_last_sell_ts[base] = float(ts if ts is not None else time.time())
-        self._dca_buy_ts[base] = []
+        self._dca_buy_ts[base] = array("d")
+        self._save_dca_state()
+
+    def _update_trailing_pm(
+        self, symbols: list, base_pm: np.ndarray, sell: np.ndarray, settings_sig: tuple
+    ) -> dict:
+        """
+        One trailing PM step for several coins over arrays (one row per symbol).
+        Coins with no state, or state from other settings, start fresh. Returns
+        { "BTC": (known, active, line, peak, above_now, hit) }; nothing is stored.
+        """
+        if not symbols:
+            return {}
+        known = np.array(
+            [
+                s in self._pm_line and self._pm_settings_sig.get(s) == settings_sig
+                for s in symbols
+            ],
+            dtype=bool,
+        )
+        was_active = known & np.array(
+            [self._pm_active.get(s, False) for s in symbols], dtype=bool
+        )
+        was_above = known & np.array(
+            [self._pm_was_above.get(s, False) for s in symbols], dtype=bool
+        )
+        old_line = np.array([self._pm_line.get(s, 0.0) for s in symbols], dtype=np.float64)
+        old_peak = np.array([self._pm_peak.get(s, 0.0) for s in symbols], dtype=np.float64)
+
+        # Until trailing activates the line is just the PM line (it follows
+        # the cost basis down after a DCA); once active it never drops below it.
+        line = np.where(was_active, np.maximum(old_line, base_pm), base_pm)
+        peak = np.where(known, old_peak, 0.0)
+        above_now = sell >= line
+        active = was_active | above_now
+        peak = np.where(was_active, peak, np.where(above_now, sell, peak))
+        peak = np.where(active, np.maximum(peak, sell), peak)
+        new_line = np.maximum(peak * (1.0 - (self.trailing_gap_pct / 100.0)), base_pm)
+        line = np.where(active, np.maximum(line, new_line), line)
+        # Forced sell on cross from ABOVE -> BELOW the trailing line
+        hit = active & was_above & (sell < line)
+
+        return dict(
+            zip(
+                symbols,
+                zip(
+                    known.tolist(),
+                    active.tolist(),
+                    line.tolist(),
+                    peak.tolist(),
+                    above_now.tolist(),
+                    hit.tolist(),
+                ),
+            )
+        )
+
+    def _clear_trailing_pm(self, symbol: Optional[str] = None) -> None:
+        """Drop trailing PM state for one coin, or for every coin."""
+        fields = (
+            self._pm_active,
+            self._pm_line,
+            self._pm_peak,
+            self._pm_was_above,
+            self._pm_settings_sig,
+        )
+        for field in fields:
+            if symbol is None:
+                field.clear()
+            else:
+                field.pop(symbol, None)
+
+    def make_api_request(self, method: str, path: str, body: Any = "") -> Any:
+        # Serialize once: the signed bytes are exactly the bytes that are sent
+        if not body:
+            body = b""
+        elif isinstance(body, str):
+            body = body.encode("utf-8")
+        elif not isinstance(body, bytes):
+            body = _json_bytes(body)
 
-    def make_api_request(self, method: str, path: str, body: Optional[str] = "") -> Any:
         timestamp = self._get_current_timestamp()
         headers = self.get_authorization_header(method, path, body, timestamp)
         url = self.base_url + path
 
         try:
             if method == "GET":
-                response = requests.get(url, headers=headers, timeout=10)
+                response = self._session.get(url, headers=headers, timeout=10)
             elif method == "POST":
-                response = requests.post(
-                    url, headers=headers, json=json.loads(body), timeout=10
+                headers["Content-Type"] = "application/json"
+                response = self._session.post(
+                    url, headers=headers, data=body, timeout=10
                 )
 
             response.raise_for_status()
@@ -1057,14 +1425,22 @@ class CryptoAPITrading:
             return None
 
     def get_authorization_header(
-        self, method: str, path: str, body: str, timestamp: int
+        self, method: str, path: str, body: Any, timestamp: int
     ) -> Dict[str, str]:
-        message_to_sign = f"{self.api_key}{timestamp}{path}{method}{body}"
-        signed = self.private_key.sign(message_to_sign.encode("utf-8"))
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        message_to_sign = b"%s%d%s%s%s" % (
+            self._api_key_bytes,
+            timestamp,
+            path.encode("utf-8"),
+            method.encode("ascii"),
+            body or b"",
+        )
+        signed = self.private_key.sign(message_to_sign)
 
         return {
             "x-api-key": self.api_key,
-            "x-signature": base64.b64encode(signed.signature).decode("utf-8"),
+            "x-signature": base64.b64encode(signed.signature).decode("ascii"),
             "x-timestamp": str(timestamp),
         }
 
@@ -1093,6 +1469,13 @@ class CryptoAPITrading:
         path = f"/api/v1/crypto/trading/orders/?symbol={symbol}"
         return self.make_api_request("GET", path)
 
+    def get_orders_many(self, symbols: list) -> Dict[str, Any]:
+        """Fetch orders for several symbols concurrently; {symbol: get_orders(symbol)}."""
+        symbols = list(dict.fromkeys(symbols))
+        if len(symbols) <= 1:
+            return {symbol: self.get_orders(symbol) for symbol in symbols}
+        return dict(zip(symbols, self._io_pool.map(self.get_orders, symbols)))
+
     def calculate_cost_basis(self):
         holdings = self.get_holdings()
         if not holdings or "results" not in holdings:
@@ -1107,9 +1490,10 @@ class CryptoAPITrading:
         }
 
         cost_basis = {}
+        order_results = self.get_orders_many([f"{a}-USD" for a in active_assets])
 
         for asset_code in active_assets:
-            orders = self.get_orders(f"{asset_code}-USD")
+            orders = order_results[f"{asset_code}-USD"]
             if not orders or "results" not in orders:
                 continue
 
@@ -1122,48 +1506,139 @@ class CryptoAPITrading:
             buy_orders.sort(key=lambda x: x["created_at"], reverse=True)
 
             remaining_quantity = current_quantities[asset_code]
-            total_cost = 0.0
-
-            for order in buy_orders:
-                for execution in order.get("executions", []):
-                    quantity = float(execution["quantity"])
-                    price = float(execution["effective_price"])
-
-                    if remaining_quantity <= 0:
-                        break
-
-                    # Use only the portion of the quantity needed to match the current holdings
-                    if quantity > remaining_quantity:
-                        total_cost += remaining_quantity * price
-                        remaining_quantity = 0
-                    else:
-                        total_cost += quantity * price
-                        remaining_quantity -= quantity
+            executions = [
+                execution
+                for order in buy_orders
+                for execution in order.get("executions", [])
+            ]
+            quantities = np.fromiter(
+                (float(e["quantity"]) for e in executions),
+                dtype=np.float64,
+                count=len(executions),
+            )
+            prices = np.fromiter(
+                (float(e["effective_price"]) for e in executions),
+                dtype=np.float64,
+                count=len(executions),
+            )
 
-                if remaining_quantity <= 0:
-                    break
+            # Newest executions first until they cover the current holdings;
+            # the one that crosses the cutoff only counts for its needed part
+            total_cost = 0.0
+            if remaining_quantity > 0 and len(quantities):
+                cumulative = np.cumsum(quantities)
+                idx = int(np.searchsorted(cumulative, remaining_quantity))
+                total_cost = float(np.dot(quantities[:idx], prices[:idx]))
+                if idx < len(quantities):
+                    covered = cumulative[idx - 1] if idx else 0.0
+                    total_cost += float((remaining_quantity - covered) * prices[idx])
 
             if current_quantities[asset_code] > 0:
                 cost_basis[asset_code] = total_cost / current_quantities[asset_code]
             else:
                 cost_basis[asset_code] = 0.0
 
+        self._cost_basis_qty = current_quantities
+        self._cost_basis_dirty = False
         return cost_basis
 
+    def _apply_fill_to_cost_basis(
+        self, symbol: str, side: str, qty: float, price: Optional[float]
+    ) -> None:
+        """
+        Fold one fill into self.cost_basis. The newest buys cover the holdings,
+        so a buy on top of them is a weighted average and a full sell drops the
+        coin; anything else is left for calculate_cost_basis.
+        """
+        base = symbol.split("-")[0]
+        old_qty = self._cost_basis_qty.get(base, 0.0)
+        if qty <= 0:
+            return
+        if side == "buy" and price and (old_qty <= 0 or base in self.cost_basis):
+            new_qty = old_qty + qty
+            old_cb = self.cost_basis.get(base, 0.0) if old_qty > 0 else 0.0
+            self.cost_basis[base] = (old_cb * old_qty + price * qty) / new_qty
+            self._cost_basis_qty[base] = new_qty
+        elif side == "sell" and qty >= old_qty * 0.99:
+            self.cost_basis.pop(base, None)
+            self._cost_basis_qty.pop(base, None)
+        else:
+            self._cost_basis_dirty = True
+
+    def _cost_basis_in_sync(self, holdings: Any) -> bool:
+        """True if every holding's quantity is within 1% of what cost_basis was built for."""
+        if self._cost_basis_dirty or not holdings or "results" not in holdings:
+            return False
+        live = {
+            h["asset_code"]: float(h["total_quantity"]) for h in holdings["results"]
+        }
+        for asset in live.keys() | self._cost_basis_qty.keys():
+            have = live.get(asset, 0.0)
+            want = self._cost_basis_qty.get(asset, 0.0)
+            if abs(have - want) > 0.01 * max(have, want):
+                return False
+        return True
+
+    def _get_best_bid_ask(self, symbols: list) -> Any:
+        path = "/api/v1/crypto/marketdata/best_bid_ask/?" + "&".join(
+            f"symbol={symbol}" for symbol in symbols
+        )
+        return self.make_api_request("GET", path)
+
+    def _quote_batch(self, symbols: list) -> list:
+        """
+        Responses for one batch of symbols. If the batch request fails or
+        comes back with errors (one unlisted symbol can reject it all), the
+        symbols are retried one per request so the others still get quotes.
+        """
+        response = self._get_best_bid_ask(symbols)
+        if len(symbols) > 1 and (
+            not isinstance(response, dict)
+            or "results" not in response
+            or response.get("errors")
+        ):
+            return [self._get_best_bid_ask([symbol]) for symbol in symbols]
+        return [response]
+
     def get_price(self, symbols: list) -> Dict[str, float]:
         buy_prices = {}
         sell_prices = {}
         valid_symbols = []
 
-        for symbol in symbols:
-            if symbol == "USDC-USD":
-                continue
+        wanted = [symbol for symbol in dict.fromkeys(symbols) if symbol != "USDC-USD"]
 
-            path = f"/api/v1/crypto/marketdata/best_bid_ask/?symbol={symbol}"
-            response = self.make_api_request("GET", path)
+        # Quotes fetched within the TTL are answered by the cache fallback below
+        now = time.time()
+        ttl = self.quote_ttl_s
+        stale = [
+            symbol
+            for symbol in wanted
+            if now - self._last_good_bid_ask.get(symbol, {}).get("ts", 0.0) >= ttl
+        ]
+
+        # One request per QUOTE_BATCH_SIZE symbols (the endpoint takes repeated
+        # symbol params); several batches are fetched concurrently
+        batches = [
+            stale[i : i + QUOTE_BATCH_SIZE]
+            for i in range(0, len(stale), QUOTE_BATCH_SIZE)
+        ]
+        if len(batches) == 1:
+            responses = self._quote_batch(batches[0])
+        else:
+            responses = [
+                r for rs in self._io_pool.map(self._quote_batch, batches) for r in rs
+            ]
 
+        quotes = {}
+        for response in responses:
             if response and "results" in response:
-                result = response["results"][0]
+                for result in response["results"]:
+                    quotes[result.get("symbol")] = result
+
+        for symbol in wanted:
+            result = quotes.get(symbol)
+
+            if result is not None:
                 ask = float(result["ask_inclusive_of_buy_spread"])
                 bid = float(result["bid_inclusive_of_sell_spread"])
 
@@ -1241,7 +1716,7 @@ class CryptoAPITrading:
                 # --- exact profit tracking snapshot (BEFORE placing order) ---
                 buying_power_before = self._get_buying_power()
 
-                response = self.make_api_request("POST", path, json.dumps(body))
+                response = self.make_api_request("POST", path, body)
                 if response and "errors" not in response:
                     order_id = response.get("id", None)
 
@@ -1294,6 +1769,10 @@ class CryptoAPITrading:
                             buying_power_before
                         )
 
+                        self._apply_fill_to_cost_basis(
+                            symbol, "buy", float(filled_qty), avg_fill_price
+                        )
+
                         # Record for GUI history (ACTUAL fill from order history)
                         self._record_trade(
                             side="buy",
@@ -1368,7 +1847,7 @@ class CryptoAPITrading:
         # --- exact profit tracking snapshot (BEFORE placing order) ---
         buying_power_before = self._get_buying_power()
 
-        response = self.make_api_request("POST", path, json.dumps(body))
+        response = self.make_api_request("POST", path, body)
 
         if response and isinstance(response, dict) and "errors" not in response:
             order_id = response.get("id", None)
@@ -1482,6 +1961,8 @@ class CryptoAPITrading:
                 except Exception:
                     pass
 
+            self._apply_fill_to_cost_basis(symbol, "sell", float(actual_qty), actual_price)
+
             # --- exact profit tracking snapshot (AFTER the order is complete) ---
             buying_power_after = self._get_buying_power()
             buying_power_delta = float(buying_power_after) - float(buying_power_before)
@@ -1522,6 +2003,7 @@ class CryptoAPITrading:
             self.path_map = dict(base_paths)
             self.dca_levels = list(DCA_LEVELS)
             self.max_dca_buys_per_24h = int(MAX_DCA_BUYS_PER_24H)
+            self.quote_ttl_s = float(QUOTE_TTL_SECONDS)
 
             # Trailing PM settings (hot-reload)
             old_sig = getattr(self, "_last_trailing_settings_sig", None)
@@ -1540,18 +2022,17 @@ class CryptoAPITrading:
             # - the line updates immediately
             # - peak/armed/was_above are cleared
             if (old_sig is not None) and (new_sig != old_sig):
-                self.trailing_pm = {}
+                self._clear_trailing_pm()
 
             self._last_trailing_settings_sig = new_sig
         except Exception:
             pass
 
-        # Fetch account details
-        account = self.get_account()
-        # Fetch holdings
+        # Account, holdings and trading pairs are independent; fetch them
+        # together and only wait on each where it is first needed
+        account_future = self._io_pool.submit(self.get_account)
+        pairs_future = self._io_pool.submit(self.get_trading_pairs)
         holdings = self.get_holdings()
-        # Fetch trading pairs
-        trading_pairs = self.get_trading_pairs()
 
         # Use the stored cost_basis instead of recalculating
         cost_basis = self.cost_basis
@@ -1561,32 +2042,31 @@ class CryptoAPITrading:
         ]
 
         # ALSO fetch prices for tracked coins even if not currently held (so GUI can show bid/ask lines)
-        for s in crypto_symbols:
-            full = f"{s}-USD"
-            if full not in symbols:
-                symbols.append(full)
+        symbols.extend(f"{s}-USD" for s in crypto_symbols)  # get_price dedupes
 
         current_buy_prices, current_sell_prices, valid_symbols = self.get_price(symbols)
+        valid_symbols = set(valid_symbols)  # only used for membership below
+        account = account_future.result()
+        trading_pairs = pairs_future.result()
 
         # Calculate total account value (robust: never drop a held coin to $0 on transient API misses)
         snapshot_ok = True
 
         # buying power
-        try:
-            buying_power = float(account.get("buying_power", 0))
-        except Exception:
+        buying_power = (
+            _as_float(account.get("buying_power", 0))
+            if isinstance(account, dict)
+            else None
+        )
+        if buying_power is None:
             buying_power = 0.0
             snapshot_ok = False
 
         # holdings list (treat missing/invalid holdings payload as transient error)
-        try:
-            holdings_list = (
-                holdings.get("results", None) if isinstance(holdings, dict) else None
-            )
-            if not isinstance(holdings_list, list):
-                holdings_list = []
-                snapshot_ok = False
-        except Exception:
+        holdings_list = (
+            holdings.get("results", None) if isinstance(holdings, dict) else None
+        )
+        if not isinstance(holdings_list, list):
             holdings_list = []
             snapshot_ok = False
 
@@ -1594,30 +2074,34 @@ class CryptoAPITrading:
         holdings_sell_value = 0.0
 
         for holding in holdings_list:
-            try:
-                asset = holding.get("asset_code")
-                if asset == "USDC":
-                    continue
+            if not isinstance(holding, dict):
+                snapshot_ok = False
+                continue
 
-                qty = float(holding.get("total_quantity", 0.0))
-                if qty <= 0.0:
-                    continue
+            asset = holding.get("asset_code")
+            if asset == "USDC":
+                continue
 
-                sym = f"{asset}-USD"
-                bp = float(current_buy_prices.get(sym, 0.0) or 0.0)
-                sp = float(current_sell_prices.get(sym, 0.0) or 0.0)
+            qty = _as_float(holding.get("total_quantity", 0.0))
+            if qty is None:
+                snapshot_ok = False
+                continue
+            if qty <= 0.0:
+                continue
 
-                # If any held asset is missing a usable price this tick, do NOT allow a new "low" snapshot
-                if bp <= 0.0 or sp <= 0.0:
-                    snapshot_ok = False
-                    continue
+            # get_price only stores floats
+            sym = f"{asset}-USD"
+            bp = current_buy_prices.get(sym, 0.0)
+            sp = current_sell_prices.get(sym, 0.0)
 
-                holdings_buy_value += qty * bp
-                holdings_sell_value += qty * sp
-            except Exception:
+            # If any held asset is missing a usable price this tick, do NOT allow a new "low" snapshot
+            if bp <= 0.0 or sp <= 0.0:
                 snapshot_ok = False
                 continue
 
+            holdings_buy_value += qty * bp
+            holdings_sell_value += qty * sp
+
         total_account_value = buying_power + holdings_sell_value
         in_use = (
             (holdings_sell_value / total_account_value) * 100
@@ -1677,7 +2161,7 @@ class CryptoAPITrading:
                         for line in f:
                             if not line.strip(): continue
                             try:
-                                obj = json.loads(line)
+                                obj = _json_loads(line)
                                 if "ts" in obj:  # Normalize timestamp keys
                                     obj["timestamp"] = obj["ts"]
                                 th_list.append(obj)
@@ -1705,14 +2189,14 @@ class CryptoAPITrading:
                      trade_history=th_list
                  )
 
-        os.system("cls" if os.name == "nt" else "clear")
-        print("\n--- Account Summary ---")
-        print(f"Total Account Value: ${total_account_value:.2f}")
-        print(f"Holdings Value: ${holdings_sell_value:.2f}")
-        print(f"Percent In Trade: {in_use:.2f}%")
-        print(
+        # One write for the clear + summary block instead of a print per line
+        sys.stdout.write(
+            f"{CLEAR_SCREEN}\n--- Account Summary ---\n"
+            f"Total Account Value: ${total_account_value:.2f}\n"
+            f"Holdings Value: ${holdings_sell_value:.2f}\n"
+            f"Percent In Trade: {in_use:.2f}%\n"
             f"Trailing PM: start +{self.pm_start_pct_no_dca:.2f}% (no DCA) / +{self.pm_start_pct_with_dca:.2f}% (with DCA) "
-            f"| gap {self.trailing_gap_pct:.2f}%"
+            f"| gap {self.trailing_gap_pct:.2f}%\n"
         )
         
         if rebalance_orders:
@@ -1746,6 +2230,82 @@ class CryptoAPITrading:
             
         print("\n--- Current Trades ---")
 
+        # Per-holding price math for the whole tick, computed over arrays once;
+        # the loop below only looks up its row. Rows with no cost basis get 0.
+        row_symbols = [
+            holding["asset_code"]
+            for holding in holdings.get("results", [])
+            if holding["asset_code"] != "USDC"
+            and f"{holding['asset_code']}-USD" in valid_symbols
+        ]
+        tick_math = {}
+        tick_trail = {}
+        settings_sig = (
+            float(self.trailing_gap_pct),
+            float(self.pm_start_pct_no_dca),
+            float(self.pm_start_pct_with_dca),
+        )
+        if row_symbols:
+            cb = np.array([cost_basis.get(s, 0) for s in row_symbols], dtype=np.float64)
+            buy = np.array(
+                [current_buy_prices.get(f"{s}-USD", 0) for s in row_symbols],
+                dtype=np.float64,
+            )
+            sell = np.array(
+                [current_sell_prices.get(f"{s}-USD", 0) for s in row_symbols],
+                dtype=np.float64,
+            )
+            stages = np.array(
+                [len(self.dca_levels_triggered.get(s, [])) for s in row_symbols],
+                dtype=np.intp,
+            )
+            has_cb = cb > 0
+            safe_cb = np.where(has_cb, cb, 1.0)
+            gl_buy = np.where(has_cb, ((buy - cb) / safe_cb) * 100, 0.0)
+            gl_sell = np.where(has_cb, ((sell - cb) / safe_cb) * 100, 0.0)
+            # Hardcoded % per stage (repeat the last level once we reach it)
+            levels = np.asarray(self.dca_levels, dtype=np.float64)
+            hard_next = levels[np.minimum(stages, len(levels) - 1)]
+            hard_line = cb * (1.0 + (hard_next / 100.0))
+            pm_start = np.where(
+                stages == 0, self.pm_start_pct_no_dca, self.pm_start_pct_with_dca
+            )
+            base_pm = cb * (1.0 + (pm_start / 100.0))
+            tick_math = dict(
+                zip(
+                    row_symbols,
+                    zip(
+                        gl_buy.tolist(),
+                        gl_sell.tolist(),
+                        hard_next.tolist(),
+                        hard_line.tolist(),
+                        pm_start.tolist(),
+                        base_pm.tolist(),
+                    ),
+                )
+            )
+
+            # Trailing PM update for every coin with a cost basis at once
+            tick_trail = self._update_trailing_pm(
+                [s for s, ok in zip(row_symbols, has_cb.tolist()) if ok],
+                base_pm[has_cb],
+                sell[has_cb],
+                settings_sig,
+            )
+
+        # Settings that hold for the whole tick, resolved once for the loop below.
+        # Neural DCA applies to the levels BELOW the trade-start level.
+        # Example: trade_start_level=3 => stages 0..3 map to N4..N7 (4 total).
+        start_level = max(1, min(int(TRADE_START_LEVEL or 3), 7))
+        neural_dca_max = max(0, 7 - start_level)
+        dca_multiplier = float(DCA_MULTIPLIER or 0.0)
+        max_dca_24h = self.max_dca_buys_per_24h
+        fmt_price = self._fmt_price
+        pm_line = self._pm_line
+        pm_peak = self._pm_peak
+        pm_active = self._pm_active
+        pm_was_above = self._pm_was_above
+
         positions = {}
         for holding in holdings.get("results", []):
             symbol = holding["asset_code"]
@@ -1758,17 +2318,16 @@ class CryptoAPITrading:
             current_buy_price = current_buy_prices.get(full_symbol, 0)
             current_sell_price = current_sell_prices.get(full_symbol, 0)
             avg_cost_basis = cost_basis.get(symbol, 0)
-
-            if avg_cost_basis > 0:
-                gain_loss_percentage_buy = (
-                    (current_buy_price - avg_cost_basis) / avg_cost_basis
-                ) * 100
-                gain_loss_percentage_sell = (
-                    (current_sell_price - avg_cost_basis) / avg_cost_basis
-                ) * 100
-            else:
-                gain_loss_percentage_buy = 0
-                gain_loss_percentage_sell = 0
+            (
+                gain_loss_percentage_buy,
+                gain_loss_percentage_sell,
+                hard_next,
+                hard_line_price,
+                pm_start_pct,
+                base_pm_line,
+            ) = tick_math[symbol]
+
+            if not avg_cost_basis > 0:
                 print(
                     f"  Warning: Average Cost Basis is 0 for {symbol}, Gain/Loss calculation skipped."
                 )
@@ -1780,18 +2339,6 @@ class CryptoAPITrading:
             # Determine the next DCA trigger for this coin (hardcoded % and optional neural level)
             next_stage = triggered_levels_count  # stage 0 == first DCA after entry (trade starts at neural level 3)
 
-            # Hardcoded % for this stage (repeat -50% after we reach it)
-            hard_next = (
-                self.dca_levels[next_stage]
-                if next_stage < len(self.dca_levels)
-                else self.dca_levels[-1]
-            )
-
-            # Neural DCA applies to the levels BELOW the trade-start level.
-            # Example: trade_start_level=3 => stages 0..3 map to N4..N7 (4 total).
-            start_level = max(1, min(int(TRADE_START_LEVEL or 3), 7))
-            neural_dca_max = max(0, 7 - start_level)
-
             if next_stage < neural_dca_max:
                 neural_next = start_level + 1 + next_stage
                 next_dca_display = f"{hard_next:.2f}% / N{neural_next}"
@@ -1806,10 +2353,7 @@ class CryptoAPITrading:
             dca_line_pct = 0.0
 
             if avg_cost_basis > 0:
-                # Hardcoded trigger line price
-                hard_line_price = avg_cost_basis * (1.0 + (hard_next / 100.0))
-
-                # Default to hardcoded unless neural line is higher (hit first)
+                # Default to the hardcoded trigger line unless neural line is higher (hit first)
                 dca_line_price = hard_line_price
 
                 if next_stage < neural_dca_max:
@@ -1834,21 +2378,14 @@ class CryptoAPITrading:
                 dca_line_pct = gain_loss_percentage_buy
 
             dca_line_price_disp = (
-                self._fmt_price(dca_line_price) if avg_cost_basis > 0 else "N/A"
+                fmt_price(dca_line_price) if avg_cost_basis > 0 else "N/A"
             )
 
             # Set color code:
             # - DCA is green if we're above the chosen DCA line, red if we're below it
             # - SELL stays based on profit vs cost basis (your original behavior)
-            if dca_line_pct >= 0:
-                color = Fore.GREEN
-            else:
-                color = Fore.RED
-
-            if gain_loss_percentage_sell >= 0:
-                color2 = Fore.GREEN
-            else:
-                color2 = Fore.RED
+            color = GREEN if dca_line_pct >= 0 else RED
+            color2 = GREEN if gain_loss_percentage_sell >= 0 else RED
 
             # --- Trailing PM display (per-coin, isolated) ---
             # Display uses current state if present; otherwise shows the base PM start line.
@@ -1861,22 +2398,12 @@ class CryptoAPITrading:
             dist_to_trail_pct = 0.0
 
             if avg_cost_basis > 0:
-                pm_start_pct_disp = (
-                    self.pm_start_pct_no_dca
-                    if int(triggered_levels) == 0
-                    else self.pm_start_pct_with_dca
-                )
-                base_pm_line_disp = avg_cost_basis * (1.0 + (pm_start_pct_disp / 100.0))
+                pm_start_pct_disp = pm_start_pct
+                base_pm_line_disp = base_pm_line
 
-                state = self.trailing_pm.get(symbol)
-                if state is None:
-                    trail_line_disp = base_pm_line_disp
-                    trail_peak_disp = 0.0
-                    active_disp = False
-                else:
-                    trail_line_disp = float(state.get("line", base_pm_line_disp))
-                    trail_peak_disp = float(state.get("peak", 0.0))
-                    active_disp = bool(state.get("active", False))
+                trail_line_disp = pm_line.get(symbol, base_pm_line_disp)
+                trail_peak_disp = pm_peak.get(symbol, 0.0)
+                active_disp = pm_active.get(symbol, False)
 
                 above_disp = current_sell_price >= trail_line_disp
                 # If we're already above the line, trailing is effectively "on/armed" (even if active flips this tick)
@@ -1886,9 +2413,6 @@ class CryptoAPITrading:
                     dist_to_trail_pct = (
                         (current_sell_price - trail_line_disp) / trail_line_disp
                     ) * 100.0
-            file = open(symbol + "_current_price.txt", "w+")
-            file.write(str(current_buy_price))
-            file.close()
             positions[symbol] = {
                 "quantity": quantity,
                 "avg_cost_basis": avg_cost_basis,
@@ -1910,124 +2434,75 @@ class CryptoAPITrading:
                 else 0.0,
             }
 
-            print(
-                f"\nSymbol: {symbol}"
-                f"  |  DCA: {color}{dca_line_pct:+.2f}%{Style.RESET_ALL} @ {self._fmt_price(current_buy_price)} (Line: {dca_line_price_disp} {dca_line_source} | Next: {next_dca_display})"
-                f"  |  Gain/Loss SELL: {color2}{gain_loss_percentage_sell:.2f}%{Style.RESET_ALL} @ {self._fmt_price(current_sell_price)}"
-                f"  |  DCA Levels Triggered: {triggered_levels}"
-                f"  |  Trade Value: ${value:.2f}"
-            )
-
             if avg_cost_basis > 0:
-                print(
+                trail_text = (
                     f"  Trailing Profit Margin"
-                    f"  |  Line: {self._fmt_price(trail_line_disp)}"
+                    f"  |  Line: {fmt_price(trail_line_disp)}"
                     f"  |  Above: {above_disp}"
                 )
             else:
-                print("  PM/Trail: N/A (avg_cost_basis is 0)")
+                trail_text = "  PM/Trail: N/A (avg_cost_basis is 0)"
+
+            # Both display lines for this coin in one write
+            sys.stdout.write(
+                f"\nSymbol: {symbol}"
+                f"  |  DCA: {color}{dca_line_pct:+.2f}%{RESET} @ {fmt_price(current_buy_price)} (Line: {dca_line_price_disp} {dca_line_source} | Next: {next_dca_display})"
+                f"  |  Gain/Loss SELL: {color2}{gain_loss_percentage_sell:.2f}%{RESET} @ {fmt_price(current_sell_price)}"
+                f"  |  DCA Levels Triggered: {triggered_levels}"
+                f"  |  Trade Value: ${value:.2f}\n"
+                f"{trail_text}\n"
+            )
 
             # --- Trailing profit margin (0.5% trail gap) ---
             # PM "start line" is the normal 5% / 2.5% line (depending on DCA levels hit).
             # Trailing activates once price is ABOVE the PM start line, then line follows peaks up
             # by 0.5%. Forced sell happens ONLY when price goes from ABOVE the trailing line to BELOW it.
+            # The line/peak update was done for all coins before the loop
+            # (tick_trail); here we only act on crosses and store the result.
             if avg_cost_basis > 0:
-                pm_start_pct = (
-                    self.pm_start_pct_no_dca
-                    if int(triggered_levels) == 0
-                    else self.pm_start_pct_with_dca
-                )
-                base_pm_line = avg_cost_basis * (1.0 + (pm_start_pct / 100.0))
-                trail_gap = self.trailing_gap_pct / 100.0  # 0.5% => 0.005
-
-                # If trailing settings changed since this coin's state was created, reset it.
-                settings_sig = (
-                    float(self.trailing_gap_pct),
-                    float(self.pm_start_pct_no_dca),
-                    float(self.pm_start_pct_with_dca),
-                )
+                known, active, line, peak, above_now, hit = tick_trail[symbol]
+                if not known:
+                    self._pm_settings_sig[symbol] = settings_sig
 
-                state = self.trailing_pm.get(symbol)
-                if (state is None) or (state.get("settings_sig") != settings_sig):
-                    state = {
-                        "active": False,
-                        "line": base_pm_line,
-                        "peak": 0.0,
-                        "was_above": False,
-                        "settings_sig": settings_sig,
-                    }
-                    self.trailing_pm[symbol] = state
-                else:
-                    # Keep signature up to date
-                    state["settings_sig"] = settings_sig
-
-                    # IMPORTANT:
-                    # If trailing hasn't activated yet, this is just the PM line.
-                    # It MUST track the current avg_cost_basis (so it can move DOWN after each DCA).
-                    if not state.get("active", False):
-                        state["line"] = base_pm_line
-                    else:
-                        # Once trailing is active, the line should never be below the base PM start line.
-                        if state.get("line", 0.0) < base_pm_line:
-                            state["line"] = base_pm_line
-
-                # Use SELL price because that's what you actually get when you market sell
-                above_now = current_sell_price >= state["line"]
-
-                # Activate trailing once we first get above the base PM line
-                if (not state["active"]) and above_now:
-                    state["active"] = True
-                    state["peak"] = current_sell_price
-
-                # If active, update peak and move trailing line up behind it
-                if state["active"]:
-                    if current_sell_price > state["peak"]:
-                        state["peak"] = current_sell_price
-
-                    new_line = state["peak"] * (1.0 - trail_gap)
-                    if new_line < base_pm_line:
-                        new_line = base_pm_line
-                    if new_line > state["line"]:
-                        state["line"] = new_line
-
-                    # Forced sell on cross from ABOVE -> BELOW trailing line
-                    if state["was_above"] and (current_sell_price < state["line"]):
-                        print(
-                            f"  Trailing PM hit for {symbol}. "
-                            f"Sell price {current_sell_price:.8f} fell below trailing line {state['line']:.8f}."
-                        )
-                        response = self.place_sell_order(
-                            str(uuid.uuid4()),
-                            "sell",
-                            "market",
-                            full_symbol,
-                            quantity,
-                            expected_price=current_sell_price,
-                            avg_cost_basis=avg_cost_basis,
-                            pnl_pct=gain_loss_percentage_sell,
-                            tag="TRAIL_SELL",
-                        )
+                if hit:
+                    print(
+                        f"  Trailing PM hit for {symbol}. "
+                        f"Sell price {current_sell_price:.8f} fell below trailing line {line:.8f}."
+                    )
+                    response = self.place_sell_order(
+                        str(uuid.uuid4()),
+                        "sell",
+                        "market",
+                        full_symbol,
+                        quantity,
+                        expected_price=current_sell_price,
+                        avg_cost_basis=avg_cost_basis,
+                        pnl_pct=gain_loss_percentage_sell,
+                        tag="TRAIL_SELL",
+                    )
 
-                        if (
-                            response
-                            and isinstance(response, dict)
-                            and "errors" not in response
-                        ):
-                            trades_made = True
-                            self.trailing_pm.pop(
-                                symbol, None
-                            )  # clear per-coin trailing state on exit
+                    if (
+                        response
+                        and isinstance(response, dict)
+                        and "errors" not in response
+                    ):
+                        trades_made = True
+                        # clear per-coin trailing state on exit
+                        self._clear_trailing_pm(symbol)
 
-                            # Trade ended -> reset rolling 24h DCA window for this coin
-                            self._reset_dca_window_for_trade(symbol, sold=True)
+                        # Trade ended -> reset rolling 24h DCA window for this coin
+                        self._reset_dca_window_for_trade(symbol, sold=True)
 
-                            print(f"  Successfully sold {quantity} {symbol}.")
-                            time.sleep(5)
-                            holdings = self.get_holdings()
-                            continue
+                        print(f"  Successfully sold {quantity} {symbol}.")
+                        time.sleep(5)
+                        holdings = self.get_holdings()
+                        continue
 
                 # Save this tick’s position relative to the line (needed for “above -> below detection)
-                state["was_above"] = above_now
+                pm_active[symbol] = active
+                pm_line[symbol] = line
+                pm_peak[symbol] = peak
+                pm_was_above[symbol] = above_now
 
             # DCA (NEURAL or hardcoded %, whichever hits first for the current stage)
             # Trade starts at neural level 3 => trader is at stage 0.
@@ -2040,11 +2515,7 @@ class CryptoAPITrading:
             current_stage = len(self.dca_levels_triggered.get(symbol, []))
 
             # Hardcoded loss % for this stage (repeat last level after list ends)
-            hard_level = (
-                self.dca_levels[current_stage]
-                if current_stage < len(self.dca_levels)
-                else self.dca_levels[-1]
-            )
+            hard_level = hard_next
             hard_hit = gain_loss_percentage_buy <= hard_level
 
             # Neural trigger only for first 4 DCA stages
@@ -2071,7 +2542,7 @@ class CryptoAPITrading:
                 print(f"  DCAing {symbol} (stage {current_stage + 1}) via {reason}.")
 
                 print(f"  Current Value: ${value:.2f}")
-                dca_amount = value * float(DCA_MULTIPLIER or 0.0)
+                dca_amount = value * dca_multiplier
                 print(f"  DCA Amount: ${dca_amount:.2f}")
                 print(f"  Buying Power: ${buying_power:.2f}")
 
@@ -2082,10 +2553,10 @@ class CryptoAPITrading:
                 safe_liquidity = True  # We would inject pt_volume logic here if available as an external volume USD figure. For now, passthrough.
 
                 recent_dca = self._dca_window_count(symbol)
-                if recent_dca >= self.max_dca_buys_per_24h:
+                if recent_dca >= max_dca_24h:
                     print(
                         f"  Skipping DCA for {symbol}. "
-                        f"Already placed {recent_dca} DCA buys in the last 24h (max {self.max_dca_buys_per_24h})."
+                        f"Already placed {recent_dca} DCA buys in the last 24h (max {max_dca_24h})."
                     )
                 elif not is_safe_drawdown:
                     print(f"  Skipping DCA for {symbol}. max_portfolio_drawdown_pct exceeded.")
@@ -2115,7 +2586,7 @@ class CryptoAPITrading:
 
                         # DCA changes avg_cost_basis, so the PM line must be rebuilt from the new basis
                         # (this will re-init to 5% if DCA=0, or 2.5% if DCA>=1)
-                        self.trailing_pm.pop(symbol, None)
+                        self._clear_trailing_pm(symbol)
 
                         trades_made = True
                         print(f"  Successfully placed DCA buy order for {symbol}.")
@@ -2141,14 +2612,6 @@ class CryptoAPITrading:
                 current_buy_price = current_buy_prices.get(full_symbol, 0.0)
                 current_sell_price = current_sell_prices.get(full_symbol, 0.0)
 
-                # keep the per-coin current price file behavior for consistency
-                try:
-                    file = open(sym + "_current_price.txt", "w+")
-                    file.write(str(current_buy_price))
-                    file.close()
-                except Exception:
-                    pass
-
                 positions[sym] = {
                     "quantity": 0.0,
                     "avg_cost_basis": 0.0,
@@ -2172,6 +2635,13 @@ class CryptoAPITrading:
         except Exception:
             pass
 
+        # Current buy (ask) price of every held or tracked coin in one file,
+        # rewritten only when a price actually moved
+        prices_now = {sym: pos["current_buy_price"] for sym, pos in positions.items()}
+        if prices_now != self._last_prices_written:
+            if self._atomic_write_json(CURRENT_PRICES_PATH, prices_now):
+                self._last_prices_written = prices_now
+
         if not trading_pairs:
             return
 
@@ -2180,9 +2650,9 @@ class CryptoAPITrading:
         if allocation_in_usd < 0.5:
             allocation_in_usd = 0.5
 
-        holding_full_symbols = [
+        holding_full_symbols = {
             f"{h['asset_code']}-USD" for h in holdings.get("results", [])
-        ]
+        }
 
         start_index = 0
         while start_index < len(crypto_symbols):
@@ -2195,13 +2665,14 @@ class CryptoAPITrading:
                 continue
 
             # Neural signals are used as a "permission to start" gate.
+            # Default behavior: long must be >= start_level and short must be 0.
+            # Most coins fail the long check, so the short file is read only after it passes.
             buy_count = self._read_long_dca_signal(base_symbol)
+            if buy_count < start_level:
+                start_index += 1
+                continue
             sell_count = self._read_short_dca_signal(base_symbol)
-
-            start_level = max(1, min(int(TRADE_START_LEVEL or 3), 7))
-
-            # Default behavior: long must be >= start_level and short must be 0
-            if not (buy_count >= start_level and sell_count == 0):
+            if sell_count != 0:
                 start_index += 1
                 continue
 
@@ -2240,7 +2711,7 @@ class CryptoAPITrading:
                 self._reset_dca_window_for_trade(base_symbol, sold=False)
 
                 # Reset trailing PM state for this coin (fresh trade, fresh trailing logic)
-                self.trailing_pm.pop(base_symbol, None)
+                self._clear_trailing_pm(base_symbol)
 
                 print(
                     f"Starting new trade for {full_symbol} (AI start signal long={buy_count}, short={sell_count}). "
@@ -2248,22 +2719,27 @@ class CryptoAPITrading:
                 )
                 time.sleep(5)
                 holdings = self.get_holdings()
-                holding_full_symbols = [
+                holding_full_symbols = {
                     f"{h['asset_code']}-USD" for h in holdings.get("results", [])
-                ]
+                }
 
             start_index += 1
 
         # If any trades were made, recalculate the cost basis
         if trades_made:
             time.sleep(5)
-            print("Trades were made in this iteration. Recalculating cost basis...")
-            new_cost_basis = self.calculate_cost_basis()
-            if new_cost_basis:
-                self.cost_basis = new_cost_basis
-                print("Cost basis recalculated successfully.")
+            # Fills already updated cost_basis; only rebuild it from order
+            # history if the exchange's holdings disagree with that bookkeeping
+            if self._cost_basis_in_sync(self.get_holdings()):
+                print("Trades were made in this iteration. Cost basis updated from fills.")
             else:
-                print("Failed to recalculcate cost basis.")
+                print("Trades were made in this iteration. Recalculating cost basis...")
+                new_cost_basis = self.calculate_cost_basis()
+                if new_cost_basis:
+                    self.cost_basis = new_cost_basis
+                    print("Cost basis recalculated successfully.")
+                else:
+                    print("Failed to recalculcate cost basis.")
             self.initialize_dca_levels()
 
         # --- GUI HUB STATUS WRITE ---
@@ -2285,6 +2761,7 @@ class CryptoAPITrading:
                     ),
                     "trailing_gap_pct": float(getattr(self, "trailing_gap_pct", 0.0)),
                 },
+                "last_tick_ms": self._last_tick_ms,
                 "positions": positions,
             }
             self._append_jsonl(
@@ -2296,14 +2773,29 @@ class CryptoAPITrading:
             pass
 
     def run(self):
+        # Sleep only what is left of the tick, so work time doesn't add to it
+        next_tick = time.monotonic()
         while True:
+            started = time.monotonic()
             try:
                 self.manage_trades()
-                time.sleep(0.5)
             except Exception as e:
                 print(traceback.format_exc())
+            self._last_tick_ms = (time.monotonic() - started) * 1000.0
+
+            next_tick += TICK_INTERVAL_S
+            slack = next_tick - time.monotonic()
+            if slack > 0:
+                time.sleep(slack)
+            else:
+                # Overran (e.g. a trade's settle sleeps); don't try to catch up
+                next_tick = time.monotonic()
 
 
 if __name__ == "__main__":
-    trading_bot = CryptoAPITrading()
+    try:
+        trading_bot = CryptoAPITrading()
+    except CredentialsMissing as e:
+        print(e)
+        raise SystemExit(1)
     trading_bot.run()
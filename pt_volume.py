@@ -24,16 +24,35 @@ from typing import List, Dict, Optional, Tuple, Any
 from pathlib import Path
 from contextlib import contextmanager
 import math
+import threading
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 try:
     from kucoin.client import Market
+    import requests
+    from requests.adapters import HTTPAdapter
 
     KUCOIN_AVAILABLE = True
 except ImportError:
     KUCOIN_AVAILABLE = False
     print("[pt_volume] kucoin-python not installed. Volume data fetching limited.")
 
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit: the kernels below run as plain Python."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 try:
     from pt_analytics import TradeJournal
 
@@ -47,6 +66,47 @@ except ImportError:
 DB_PATH = Path("hub_data/volume.db")
 
 
+# Explicit signature: compiled (or loaded from the on-disk cache) at import,
+# so the first dashboard refresh doesn't pay for JIT compilation
+@njit("Tuple((f8[:], f8[:], f8[:], i8[:]))(f8[:], f8, i8, i8)", cache=True)
+def _stream_kernel(vols, multiplier, width, start):
+    """
+    The serial part of analyze_series in one compiled pass: the EMA over every
+    volume, plus mean/std/count of the trailing `width` volumes for each row
+    from `start` on (two-pass, population std, like analyze_candle).
+    """
+    n = vols.shape[0]
+    ema = np.empty(n)
+    prev = 0.0
+    for i in range(n):
+        if i == 0:
+            prev = vols[0]
+        else:
+            prev = (vols[i] * multiplier) + (prev * (1 - multiplier))
+        ema[i] = prev
+
+    m = n - start
+    mean = np.zeros(m)
+    std = np.zeros(m)
+    count = np.zeros(m, dtype=np.int64)
+    for r in range(m):
+        i = start + r
+        lo = max(0, i - width + 1)
+        c = i + 1 - lo
+        total = 0.0
+        for k in range(lo, i + 1):
+            total += vols[k]
+        mu = total / c
+        sq = 0.0
+        for k in range(lo, i + 1):
+            d = vols[k] - mu
+            sq += d * d
+        mean[r] = mu
+        std[r] = math.sqrt(sq / c)
+        count[r] = c
+    return ema, mean, std, count
+
+
 @dataclass
 class CandleVolumeData:
     """OHLCV candle data with volume metrics."""
@@ -142,6 +202,11 @@ class VolumeAnalyzer:
         self.volume_history: deque = deque(maxlen=max(sma_periods, ema_periods) * 2)
         self.price_volume_history: List[Tuple[float, float]] = []
 
+    def reset(self) -> None:
+        """Forget streamed candles so the analyzer can start a new series."""
+        self.volume_history.clear()
+        self.price_volume_history.clear()
+
     def calculate_sma(self, values: List[float], period: int) -> float:
         """Calculate Simple Moving Average."""
         if len(values) < period:
@@ -263,6 +328,92 @@ class VolumeAnalyzer:
             anomaly_type=anomaly_type,
         )
 
+    def analyze_series(
+        self, candles: List[CandleVolumeData], last: Optional[int] = None
+    ) -> List[VolumeMetrics]:
+        """
+        Metrics for every candle (or only the final `last` ones), computed over
+        arrays. Same values as feeding the candles one by one through
+        analyze_candle on a fresh analyzer; this analyzer's history is untouched.
+        """
+        n = len(candles)
+        if n == 0:
+            return []
+
+        vols = np.fromiter((c.volume for c in candles), dtype=np.float64, count=n)
+        closes = np.fromiter((c.close for c in candles), dtype=np.float64, count=n)
+
+        start = max(0, n - last) if last is not None else 0
+        rows = np.arange(start, n)
+
+        # EMA and the z-score window (the same one analyze_candle keeps in
+        # volume_history) are serial, so they run in the compiled kernel
+        ema, mean, std, count = _stream_kernel(
+            vols, 2 / (self.ema_periods + 1), self.volume_history.maxlen, start
+        )
+        end = rows + 1
+        vol = vols[rows]
+
+        # SMA and VWAP windows from prefix sums
+        csum = np.concatenate(([0.0], np.cumsum(vols)))
+        lo = np.maximum(0, end - self.sma_periods)
+        sma = (csum[end] - csum[lo]) / (end - lo)
+
+        pv_sum = np.concatenate(([0.0], np.cumsum(closes * vols)))
+        lo = np.maximum(0, end - 50)
+        window_vol = csum[end] - csum[lo]
+        vwap = np.divide(
+            pv_sum[end] - pv_sum[lo],
+            window_vol,
+            out=np.zeros(len(rows)),
+            where=window_vol > 0,
+        )
+
+        ratio = np.divide(vol, sma, out=np.ones(len(rows)), where=sma > 0)
+
+        scored = (count >= 10) & (std != 0)
+        z = np.divide(vol - mean, std, out=np.zeros(len(rows)), where=scored)
+
+        # Trend: last 5 volumes, first 2 vs last 3
+        back = [vols[np.maximum(rows - k, 0)] for k in (4, 3, 2, 1)]
+        first = np.where(rows >= 4, (back[0] + back[1]) / 2, 0.0)
+        second = (back[2] + back[3] + vol) / 3
+        change = np.divide(
+            (second - first) * 100, first, out=np.zeros(len(rows)), where=first > 0
+        )
+        trends = np.select(
+            [rows < 4, change > 10, change < -10],
+            ["stable", "increasing", "decreasing"],
+            "stable",
+        )
+
+        return [
+            VolumeMetrics(
+                timestamp=candles[i].timestamp,
+                volume=v,
+                volume_sma=s,
+                volume_ema=e,
+                vwap=w,
+                volume_ratio=r,
+                z_score=zs,
+                trend=t,
+                anomaly=abs(zs) > 2.5,
+                anomaly_type=(
+                    "high_volume" if zs > 2.5 else "low_volume" if zs < -2.5 else ""
+                ),
+            )
+            for i, v, s, e, w, r, zs, t in zip(
+                rows.tolist(),
+                vol.tolist(),
+                sma.tolist(),
+                ema[start:].tolist(),
+                vwap.tolist(),
+                ratio.tolist(),
+                z.tolist(),
+                trends.tolist(),
+            )
+        ]
+
     def calculate_profile(self, candles: List[CandleVolumeData]) -> VolumeProfile:
         """
         Calculate volume profile statistics over a period.
@@ -281,24 +432,22 @@ class VolumeAnalyzer:
                 candle_count=0,
             )
 
-        volumes = [c.volume for c in candles]
-        volumes_sorted = sorted(volumes)
-        count = len(volumes)
-
-        avg = sum(volumes) / count
-        median = volumes_sorted[count // 2]
-
-        total = sum(volumes)
-        std = (
-            math.sqrt(sum((v - avg) ** 2 for v in volumes) / count)
-            if count > 0
-            else 0.0
-        )
-
-        p25 = volumes_sorted[int(count * 0.25)] if count >= 4 else volumes_sorted[0]
-        p50 = volumes_sorted[int(count * 0.50)] if count >= 2 else volumes_sorted[0]
-        p75 = volumes_sorted[int(count * 0.75)] if count >= 4 else volumes_sorted[-1]
-        p90 = volumes_sorted[int(count * 0.90)] if count >= 10 else volumes_sorted[-1]
+        count = len(candles)
+        volumes = np.fromiter((c.volume for c in candles), dtype=np.float64, count=count)
+        total = float(volumes.sum())
+        avg = total / count
+        std = float(volumes.std())  # population std, as before
+
+        # Sorted positions of the median and percentiles; one partition
+        # places all of them without sorting the whole array
+        ranks = [
+            count // 2,
+            int(count * 0.25) if count >= 4 else 0,
+            int(count * 0.50) if count >= 2 else 0,
+            int(count * 0.75) if count >= 4 else count - 1,
+            int(count * 0.90) if count >= 10 else count - 1,
+        ]
+        median, p25, p50, p75, p90 = np.partition(volumes, ranks)[ranks].tolist()
 
         period = f"{candles[0].datetime.date()} to {candles[-1].datetime.date()}"
 
@@ -654,11 +803,30 @@ def log_volume_decision_to_analytics(
 # =============================================================================
 
 
+_market = None
+_market_lock = threading.Lock()
+
+
+def _shared_market() -> "Market":
+    """
+    One KuCoin client for every fetcher, with its pooled session set up front
+    (the SDK otherwise creates one lazily per client, racing across threads).
+    """
+    global _market
+    with _market_lock:
+        if _market is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+            _market = Market(url="https://api.kucoin.com")
+            _market.session = session
+        return _market
+
+
 class VolumeDataFetcher:
     """Fetches OHLCV data with volume from exchange."""
 
     def __init__(self):
-        self.market = Market(url="https://api.kucoin.com") if KUCOIN_AVAILABLE else None
+        self.market = _shared_market() if KUCOIN_AVAILABLE else None
 
     def fetch_candles(
         self,
@@ -698,12 +866,17 @@ class VolumeDataFetcher:
         current_start = int(start_date.timestamp())
         end_ts = int(end_date.timestamp())
 
+        windows = []
         while current_start < end_ts:
             chunk_end = min(current_start + chunk_seconds, end_ts)
+            windows.append((current_start, chunk_end))
+            current_start = chunk_end
 
+        def fetch_window(window: Tuple[int, int]) -> List[CandleVolumeData]:
+            candles = []
             try:
                 data = self.market.get_kline(
-                    symbol, timeframe, startAt=current_start, endAt=chunk_end
+                    symbol, timeframe, startAt=window[0], endAt=window[1]
                 )
 
                 if data:
@@ -717,12 +890,22 @@ class VolumeDataFetcher:
                             low=float(candle_data[4]),
                             volume=float(candle_data[5]),
                         )
-                        all_candles.append(candle)
+                        candles.append(candle)
 
             except Exception as e:
                 print(f"Error fetching volume data: {e}")
 
-            current_start = chunk_end
+            return candles
+
+        # Long ranges span several 1500-candle windows; request them concurrently
+        if len(windows) > 1:
+            with ThreadPoolExecutor(max_workers=min(4, len(windows))) as pool:
+                chunks = list(pool.map(fetch_window, windows))
+        else:
+            chunks = [fetch_window(window) for window in windows]
+
+        for chunk in chunks:
+            all_candles.extend(chunk)
 
         all_candles.sort(key=lambda c: c.timestamp)
         return all_candles
@@ -752,11 +935,14 @@ def analyze_volume(args):
 
     analyzer = VolumeAnalyzer(sma_periods=args.sma, ema_periods=args.ema)
     metrics_list = []
+    append = metrics_list.append
+    analyze = analyzer.analyze_candle
 
+    prev_ema = None
     for candle in candles:
-        prev_ema = metrics_list[-1].volume_ema if metrics_list else None
-        metrics = analyzer.analyze_candle(candle, prev_ema)
-        metrics_list.append(metrics)
+        metrics = analyze(candle, prev_ema)
+        append(metrics)
+        prev_ema = metrics.volume_ema
 
     profile = analyzer.calculate_profile(candles)
 
@@ -828,10 +1014,14 @@ def backtest_volume(args):
     rejected_entries = 0
     decisions = []
 
+    analyze = analyzer.analyze_candle
+    decide = volume_filter.make_decision
+
+    prev_ema = None
     for candle in candles[args.warmup :]:
-        prev_ema = decisions[-1].metrics.volume_ema if decisions else None
-        metrics = analyzer.analyze_candle(candle, prev_ema)
-        decision = volume_filter.make_decision(candle, metrics, coin)
+        metrics = analyze(candle, prev_ema)
+        prev_ema = metrics.volume_ema
+        decision = decide(candle, metrics, coin)
         decisions.append(decision)
 
         total_entries += 1
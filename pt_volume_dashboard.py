@@ -1,8 +1,10 @@
 import tkinter as tk
 from tkinter import ttk
 import time
+import queue
 from pt_volume import VolumeAnalyzer, VolumeDataFetcher, VolumeProfile
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 class VolumeDashboard(ttk.Frame):
@@ -14,6 +16,24 @@ class VolumeDashboard(ttk.Frame):
         self._setup_ui()
         self.fetcher = VolumeDataFetcher()
         self.analyzer = VolumeAnalyzer()
+        # (coin, hour bucket) -> Future of (profile, table rows), or of None
+        # when there were no candles; 1h candles only change hourly
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="volume")
+        self._refresh_job = None  # pending debounced refresh (after id)
+        # (callable, args) from worker threads, run on the Tk thread by _drain
+        self._ui_queue = queue.Queue()
+        self.after(50, self._drain)
+
+        # One long-lived worker; at most one queued coin, newest request wins
+        self._jobs = queue.Queue(maxsize=1)
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+
+        # Load every coin in the background so switching coins is a cache hit
+        for coin in self.coin_list:
+            self._future_for(coin)
 
     def _setup_ui(self):
         # Top control bar
@@ -55,7 +75,8 @@ class VolumeDashboard(ttk.Frame):
         self.tree = ttk.Treeview(analysis_frame, columns=cols, show="headings")
         for c in cols:
             self.tree.heading(c, text=c)
-            self.tree.column(c, width=100)
+            # Fixed widths: no column re-layout as rows are inserted
+            self.tree.column(c, width=100, stretch=False, anchor="w")
 
         scrollbar = ttk.Scrollbar(analysis_frame, orient="vertical", command=self.tree.yview)
         self.tree.configure(yscrollcommand=scrollbar.set)
@@ -68,50 +89,108 @@ class VolumeDashboard(ttk.Frame):
         self.refresh()
 
     def refresh(self):
+        # Debounce: a burst of coin changes / clicks starts only one fetch
         self.status_lbl.config(text="Fetching data...")
-        threading.Thread(target=self._fetch_data, daemon=True).start()
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+        self._refresh_job = self.after(250, self._start_fetch)
 
-    def _fetch_data(self):
+    def _start_fetch(self):
+        self._refresh_job = None
         try:
-            end = datetime.now()
-            start = end - timedelta(days=30)
-            candles = self.fetcher.fetch_candles(self.current_coin, start, end, "1hour")
-
-            if not candles:
-                self.after(0, lambda: self.status_lbl.config(text="No data found"))
+            self._jobs.get_nowait()  # replace a job the worker hasn't started
+        except queue.Empty:
+            pass
+        self._jobs.put_nowait(self.current_coin)
+
+    def _worker_loop(self):
+        while True:
+            self._fetch_data(self._jobs.get())
+
+    def _load(self, coin):
+        end = datetime.now()
+        start = end - timedelta(days=30)
+        candles = self.fetcher.fetch_candles(coin, start, end, "1hour")
+        if not candles:
+            return None
+
+        profile = self.analyzer.calculate_profile(candles)
+
+        # Analyze the whole series, but only build metrics for the rows shown,
+        # and format them here so the Tk thread only inserts
+        rows = [
+            (
+                datetime.fromtimestamp(m.timestamp).strftime('%Y-%m-%d %H:%M'),
+                f"{m.volume:,.0f}",
+                f"{m.volume_ratio:.2f}x",
+                f"{m.z_score:.2f}",
+                m.trend,
+                "YES" if m.anomaly else "",
+            )
+            for m in reversed(self.analyzer.analyze_series(candles, last=50))
+        ]
+        return profile, rows
+
+    def _future_for(self, coin):
+        bucket = int(time.time() // 3600)
+        key = (coin, bucket)
+        with self._cache_lock:
+            future = self._cache.get(key)
+            if future is None:
+                # Drop buckets older than the previous hour, then start this one
+                self._cache = {k: v for k, v in self._cache.items() if k[1] >= bucket - 1}
+                future = self._cache[key] = self._pool.submit(self._load, coin)
+        return key, future
+
+    def _forget(self, key):
+        with self._cache_lock:
+            self._cache.pop(key, None)
+
+    def _drain(self):
+        while True:
+            try:
+                func, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            func(*args)
+        self.after(50, self._drain)
+
+    def _set_status(self, text):
+        self.status_lbl.config(text=text)
+
+    def _fetch_data(self, coin):
+        try:
+            key, future = self._future_for(coin)
+            try:
+                result = future.result()
+            except Exception:
+                self._forget(key)  # retry on the next refresh
+                raise
+
+            if result is None:
+                self._forget(key)
+                self._ui_queue.put((self._set_status, ("No data found",)))
                 return
 
-            profile = self.analyzer.calculate_profile(candles)
-
-            # Analyze recent candles
-            metrics_list = []
-            analyzer = VolumeAnalyzer() # Fresh analyzer for streaming
-            for c in candles:
-                prev_ema = metrics_list[-1].volume_ema if metrics_list else None
-                m = analyzer.analyze_candle(c, prev_ema)
-                metrics_list.append(m)
+            if coin != self.current_coin:
+                return  # user moved on while this loaded; a newer job follows
 
-            self.after(0, lambda: self._update_ui(profile, metrics_list[-50:]))
+            self._ui_queue.put((self._update_ui, result))
 
         except Exception as e:
-            self.after(0, lambda: self.status_lbl.config(text=f"Error: {e}"))
+            self._ui_queue.put((self._set_status, (f"Error: {e}",)))
 
-    def _update_ui(self, profile: VolumeProfile, recent_metrics):
+    def _update_ui(self, profile: VolumeProfile, rows):
         # Update profile
         self.profile_labels["Average Volume"].config(text=f"Average: {profile.avg_volume:,.0f}")
         self.profile_labels["Median Volume"].config(text=f"Median: {profile.median_volume:,.0f}")
         self.profile_labels["Std Dev"].config(text=f"Std Dev: {profile.std_volume:,.0f}")
         self.profile_labels["P90 (High)"].config(text=f"P90: {profile.p90_volume:,.0f}")
 
-        # Update tree
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+        # Update tree (one delete call for all rows)
+        self.tree.delete(*self.tree.get_children())
 
-        for m in reversed(recent_metrics):
-            dt = datetime.fromtimestamp(m.timestamp).strftime('%Y-%m-%d %H:%M')
-            anomaly = "YES" if m.anomaly else ""
-            self.tree.insert("", "end", values=(
-                dt, f"{m.volume:,.0f}", f"{m.volume_ratio:.2f}x", f"{m.z_score:.2f}", m.trend, anomaly
-            ))
+        for row in rows:
+            self.tree.insert("", "end", values=row)
 
         self.status_lbl.config(text=f"Updated {datetime.now().strftime('%H:%M:%S')}")
@@ -44,6 +44,22 @@ class TestMultiExchange(unittest.TestCase):
         spread = min_profitable_spread("binance", "kucoin")
         self.assertAlmostEqual(spread, 0.20)
 
+    def test_liquidity_and_impact(self):
+        import numpy as np
+        from types import SimpleNamespace
+        from pt_multi_exchange import LiquidityAggregator
+        book = SimpleNamespace(
+            asks=np.array([[100.0, 1.0], [101.0, 1.0], [102.0, 1.0]]),
+            bids=np.array([[99.0, 2.0]]),
+        )
+        ex = SimpleNamespace(normalize_symbol=lambda coin, q: coin, get_orderbook=lambda sym, depth: book)
+        manager = SimpleNamespace(exchanges={"binance": ex})
+        agg = LiquidityAggregator(manager)
+        self.assertAlmostEqual(agg.get_liquidity_map("BTC", "buy")["binance"], 303.0)
+        self.assertAlmostEqual(agg.get_liquidity_map("BTC", "sell")["binance"], 198.0)
+        self.assertAlmostEqual(agg.estimate_impact("BTC", "buy", 1.5)["binance"], 1.0)
+        self.assertAlmostEqual(agg.estimate_impact("BTC", "buy", 10)["binance"], 2.0)
+
     def test_execution_tracker(self):
         from pt_multi_exchange import ExecutionTracker
         tracker = ExecutionTracker()
@@ -356,6 +372,1348 @@ class TestEnterprise(unittest.TestCase):
         self.assertIn("recommendations", report)
 
 
+# =============================================================================
+# EXCHANGE TESTS
+# =============================================================================
+
+class _StubExchange:
+    """Offline stand-in for an ExchangeBase subclass."""
+
+    def __init__(self, name, price, volume=1.0, delay=0.0, fail=False):
+        self.name, self.price, self.volume = name, price, volume
+        self.delay, self.fail = delay, fail
+
+    def normalize_symbol(self, coin, quote="USDT"):
+        return f"{coin}-{quote}"
+
+    def _ticker(self, symbol):
+        from datetime import datetime
+        from pt_exchanges import ExchangeError, Ticker
+        if self.fail:
+            raise ExchangeError(f"{self.name} down")
+        return Ticker(self.name, symbol, self.price, self.price, self.price, self.volume, datetime.now())
+
+    def get_ticker(self, symbol):
+        import time
+        time.sleep(self.delay)
+        return self._ticker(symbol)
+
+    def get_tickers(self, symbols):
+        return {symbol: self._ticker(symbol) for symbol in symbols}
+
+    async def aget_ticker(self, symbol, client=None):
+        import asyncio
+        await asyncio.sleep(self.delay)
+        return self._ticker(symbol)
+
+
+class TestExchanges(unittest.TestCase):
+    """Tests for pt_exchanges.py"""
+
+    def _manager(self, *stubs):
+        from pt_exchanges import ExchangeManager
+        manager = ExchangeManager(enabled_exchanges=[s.name for s in stubs])
+        manager.exchanges = {s.name: s for s in stubs}
+        return manager
+
+    def test_all_tickers_concurrent(self):
+        import time
+        manager = self._manager(
+            _StubExchange("kucoin", 100.0, delay=0.2),
+            _StubExchange("binance", 101.0, delay=0.2),
+            _StubExchange("coinbase", 102.0, delay=0.2),
+        )
+        start = time.monotonic()
+        tickers = manager.get_all_tickers("BTC")
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(list(tickers), ["kucoin", "binance", "coinbase"])
+
+    def test_async_all_tickers(self):
+        import asyncio
+        import time
+        manager = self._manager(
+            _StubExchange("kucoin", 100.0, delay=0.2),
+            _StubExchange("binance", 0.0, delay=0.2, fail=True),
+            _StubExchange("coinbase", 102.0, delay=0.2),
+        )
+        start = time.monotonic()
+        tickers = asyncio.run(manager.aget_all_tickers("BTC", client=object()))
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(list(tickers), ["kucoin", "coinbase"])
+
+    def test_async_ticker_is_abstract(self):
+        from pt_exchanges import ExchangeBase
+
+        class _SyncOnly(ExchangeBase):
+            get_ticker = get_candles_np = get_orderbook = lambda self, *a: None
+            normalize_symbol = normalize_timeframe = lambda self, *a: None
+
+        # a missing async ticker fails at construction, not at the first await
+        self.assertEqual(_SyncOnly.__abstractmethods__, frozenset({"_aget_ticker"}))
+        with self.assertRaises(TypeError):
+            _SyncOnly()
+
+    def test_async_client_pooled_per_host(self):
+        import asyncio
+        from pt_exchanges import HTTPX_AVAILABLE, get_async_client, close_async_clients
+        if not HTTPX_AVAILABLE:
+            self.skipTest("httpx not installed")
+
+        async def run():
+            a = get_async_client("https://api.binance.com/api/v3")
+            b = get_async_client("https://api.binance.com/api/v1")
+            c = get_async_client("https://api.kucoin.com")
+            await close_async_clients()
+            return a, b, c
+
+        a, b, c = asyncio.run(run())
+        self.assertIs(a, b)
+        self.assertIsNot(a, c)
+        self.assertTrue(a.is_closed and c.is_closed)
+
+    def test_median_matches_statistics(self):
+        import statistics
+        from pt_exchanges import _median
+        rng = random.Random(3)
+        for n in range(1, 9):
+            for _ in range(50):
+                prices = [rng.uniform(90, 110) for _ in range(n)]
+                self.assertAlmostEqual(_median(prices), statistics.median(prices))
+
+    def test_aggregated_price(self):
+        manager = self._manager(
+            _StubExchange("kucoin", 100.0, volume=1.0),
+            _StubExchange("binance", 103.0, volume=3.0),
+            _StubExchange("coinbase", 101.0, volume=0.0),
+        )
+        self.assertEqual(manager.get_aggregated_price("BTC")["aggregated_price"], 101.0)
+        manager._ticker_cache.clear()
+        agg = manager.get_aggregated_price("BTC", method="vwap")
+        self.assertAlmostEqual(agg["aggregated_price"], 102.25)
+        self.assertAlmostEqual(agg["spread"], 3.0)
+        manager._ticker_cache.clear()
+        self.assertAlmostEqual(manager.get_aggregated_price("BTC", method="mean")["aggregated_price"], 304.0 / 3)
+
+    def test_ticker_memoization(self):
+        stub = _StubExchange("kucoin", 100.0)
+        manager = self._manager(stub, _StubExchange("binance", 104.0))
+        manager.get_aggregated_price("BTC")
+        stub.price = 200.0
+        arb = manager.detect_arbitrage("BTC", min_spread_pct=1.0)
+        self.assertEqual(arb["buy_price"], 100.0)
+
+    def test_background_poller(self):
+        import time
+        stub = _StubExchange("kucoin", 100.0)
+        manager = self._manager(stub)
+        manager.start_poller(["BTC"], interval=0.05)
+        try:
+            time.sleep(0.2)
+            stub.fail = True
+            self.assertEqual(manager.get_all_tickers("BTC")["kucoin"].price, 100.0)
+        finally:
+            manager.close()
+
+    def test_candle_array_layout(self):
+        from pt_exchanges import _candle_array, body_ratio, normalize_ohlc
+        # Coinbase order [time, low, high, open, close, volume], newest first
+        rows = [[120, "9", "12", "10", "11", "5"], [60, "8", "11", "9", "10", "4"]]
+        arr = _candle_array(rows, (0, 3, 2, 1, 4, 5))
+        self.assertEqual(arr.tolist(), [[60, 9, 11, 8, 10, 4], [120, 10, 12, 9, 11, 5]])
+        self.assertAlmostEqual(normalize_ohlc(arr)[1, 1], 1.2)
+        self.assertAlmostEqual(body_ratio(arr)[0], 1 / 3)
+        self.assertEqual(_candle_array([], (0, 1, 2, 3, 4, 5)).shape, (0, 6))
+        shuffled = [[120, 1, 1, 1, 1, 1], [60, 1, 1, 1, 1, 1], [180, 1, 1, 1, 1, 1]]
+        self.assertEqual(_candle_array(shuffled, (0, 1, 2, 3, 4, 5))[:, 0].tolist(), [60, 120, 180])
+
+    def test_get_candles_namedtuples(self):
+        import numpy as np
+        from pt_exchanges import OHLCV, KuCoinExchange
+        ex = KuCoinExchange()
+        ex.get_candles_np = lambda *a: np.array([[60.0, 1, 2, 0.5, 1.5, 10]])
+        candle = ex.get_candles("BTC-USDT")[0]
+        self.assertIsInstance(candle, OHLCV)
+        self.assertEqual(candle, (60, 1.0, 2.0, 0.5, 1.5, 10.0))
+        self.assertIsInstance(candle.timestamp, int)
+        self.assertEqual(candle.datetime.timestamp(), 60)
+
+    def test_shared_session_retries_transient_errors(self):
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        from pt_exchanges import get_shared_session
+        hits = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                status = 503 if len(hits) == 1 else 200
+                self.send_response(status)
+                if status == 503:
+                    self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"{}")
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            resp = get_shared_session().get(f"http://127.0.0.1:{server.server_port}/t", timeout=5)
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(hits), 2)
+
+    def test_ticker_is_slotted_and_frozen(self):
+        import dataclasses
+        from pt_exchanges import Ticker
+        ticker = _StubExchange("kucoin", 100.0).get_ticker("BTC-USDT")
+        self.assertFalse(hasattr(ticker, "__dict__"))
+        self.assertIn("price", Ticker.__slots__)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            ticker.price = 1.0
+
+    def test_binance_klines_parse(self):
+        from pt_exchanges import _parse_binance_klines
+        raw = [[1700000000000, "1", "2", "0.5", "1.5", "10", 1700000059999, "15"]]
+        self.assertEqual(_parse_binance_klines(raw).tolist(), [[1700000000, 1, 2, 0.5, 1.5, 10]])
+        self.assertEqual(_parse_binance_klines([]).shape, (0, 6))
+
+    def test_detect_arbitrage(self):
+        manager = self._manager(
+            _StubExchange("kucoin", 101.0),
+            _StubExchange("binance", 100.0),
+            _StubExchange("coinbase", 102.0),
+        )
+        arb = manager.detect_arbitrage("BTC", min_spread_pct=1.0)
+        self.assertEqual((arb["buy_exchange"], arb["sell_exchange"]), ("binance", "coinbase"))
+        self.assertAlmostEqual(arb["spread_pct"], 2.0)
+        self.assertIsNone(manager.detect_arbitrage("BTC", min_spread_pct=5.0))
+
+    def test_scan_arbitrage(self):
+        manager = self._manager(
+            _StubExchange("kucoin", 100.0),
+            _StubExchange("binance", 103.0),
+            _StubExchange("coinbase", 0.0, fail=True),
+        )
+        scanned = manager.scan_arbitrage(["BTC", "ETH"], min_spread_pct=1.0)
+        self.assertEqual(set(scanned), {"BTC", "ETH"})
+        self.assertEqual(scanned["BTC"]["sell_exchange"], "binance")
+
+    def test_token_bucket(self):
+        import time
+        from pt_exchanges import TokenBucket
+        bucket = TokenBucket(rate=50.0, capacity=5)
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        self.assertLess(time.monotonic() - start, 0.05)
+        for _ in range(5):
+            bucket.acquire()
+        self.assertGreater(time.monotonic() - start, 0.08)
+
+    def test_parse_levels(self):
+        from pt_exchanges import _parse_levels
+        levels = [["100.5", "2", 3], ["100.4", "1.5", 1], ["100.3", "1", 1]]
+        self.assertEqual(_parse_levels(levels, 2).tolist(), [[100.5, 2.0], [100.4, 1.5]])
+        self.assertEqual(_parse_levels([], 20).shape, (0, 2))
+
+    def test_orderbook_compares_by_identity(self):
+        from datetime import datetime
+        import numpy as np
+        from pt_exchanges import OrderBook
+        levels = np.array([[100.0, 1.0]])
+        book = OrderBook("kucoin", "BTC-USDT", levels, levels, datetime.now())
+        twin = OrderBook("kucoin", "BTC-USDT", levels, levels, book.timestamp)
+        self.assertEqual(book, book)
+        self.assertNotEqual(book, twin)
+        self.assertEqual(len({book, twin, book}), 2)
+
+    def test_file_cache_ttl(self):
+        import tempfile
+        from pt_exchanges import FileCache
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = FileCache(tmp)
+            url = "https://api.binance.com/api/v3/ticker/24hr"
+            self.assertIsNone(cache.get("binance", url, {"symbol": "BTCUSDT"}, 5))
+            cache.set("binance", url, {"symbol": "BTCUSDT"}, 5, {"lastPrice": "1"})
+            self.assertEqual(cache.get("binance", url, {"symbol": "BTCUSDT"}, 5), {"lastPrice": "1"})
+            self.assertIsNone(cache.get("binance", url, {"symbol": "ETHUSDT"}, 5))
+            self.assertIsNone(cache.get("binance", url, {"symbol": "BTCUSDT"}, 0))
+
+    def test_all_tickers_skips_failures(self):
+        manager = self._manager(
+            _StubExchange("kucoin", 100.0),
+            _StubExchange("binance", 0.0, fail=True),
+        )
+        tickers = manager.get_all_tickers("BTC")
+        self.assertEqual(list(tickers), ["kucoin"])
+
+
+# =============================================================================
+# THINKER EXCHANGE TESTS
+# =============================================================================
+
+class TestThinkerExchanges(unittest.TestCase):
+    """Tests for pt_thinker_exchanges.py"""
+
+    def test_thinker_price_cache(self):
+        from unittest import mock
+        import pt_thinker_exchanges as tx
+
+        calls = []
+
+        class _Manager:
+            def get_aggregated_price(self, coin, method):
+                calls.append(("price", coin, method))
+                return {"aggregated_price": 100.0 + len(calls), "spread_pct": 0.1}
+
+            def get_candles(self, coin, exchange, timeframe, limit):
+                calls.append(("candles", coin, exchange))
+                return [("candle", len(calls))]
+
+        with mock.patch.object(tx, "_exchange_manager", _Manager()), \
+                mock.patch.dict(tx._price_cache, clear=True), \
+                mock.patch.dict(tx._candle_cache, clear=True):
+            first = tx.get_aggregated_current_price("BTC")
+            self.assertEqual(tx.get_aggregated_current_price("BTC"), first)
+            self.assertNotEqual(tx.get_aggregated_current_price("BTC", method="mean"), first)
+            self.assertEqual(len(calls), 2)
+            tx._price_cache[("BTC", "median")] = (first, 0.1, 0.0)
+            self.assertNotEqual(tx.get_aggregated_current_price("BTC"), first)
+
+            candle = tx.get_candle_from_exchanges("ETH-USDT", "1hour")
+            self.assertIs(tx.get_candle_from_exchanges("ETH-USDT", "1hour"), candle)
+            # one miss queries all three candle sources, the repeat none
+            self.assertEqual(len(calls), 6)
+
+    def test_thinker_candle_prefers_primary(self):
+        import time
+        from unittest import mock
+        import pt_thinker_exchanges as tx
+
+        class _Manager:
+            def __init__(self, delays, failing=()):
+                self.delays = delays
+                self.failing = failing
+
+            def get_candles(self, coin, exchange, timeframe, limit):
+                time.sleep(self.delays.get(exchange, 0))
+                if exchange in self.failing:
+                    raise RuntimeError("down")
+                return [exchange]
+
+        cases = [
+            # primary is slightly slower than the fallbacks but within the grace
+            ({"kucoin": 0.05}, (), "kucoin"),
+            # primary is down, so the next in line wins
+            ({"coinbase": 0.0}, ("kucoin",), "binance"),
+            # primary hangs past the grace window, fallback is used
+            ({"kucoin": 1.0}, (), "binance"),
+        ]
+        for delays, failing, expected in cases:
+            with mock.patch.object(tx, "_exchange_manager", _Manager(delays, failing)), \
+                    mock.patch.dict(tx._candle_cache, clear=True), \
+                    mock.patch.object(tx, "PRIMARY_GRACE", 0.2), \
+                    mock.patch("builtins.print"):
+                self.assertEqual(tx.get_candle_from_exchanges("ETH-USDT", "1hour"), expected)
+
+
+# =============================================================================
+# CORRELATION TESTS
+# =============================================================================
+
+class TestCorrelation(unittest.TestCase):
+    """Tests for pt_correlation.py"""
+
+    def setUp(self):
+        import sqlite3
+        import tempfile
+        from datetime import datetime, timedelta
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "corr.db")
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE trade_exits (symbol TEXT, timestamp TEXT, close_price REAL)")
+        rng = random.Random(7)
+        now = datetime.utcnow()
+        btc = eth = sol = 100.0
+        rows = []
+        for k in range(60, 0, -1):
+            ts = (now - timedelta(hours=k)).isoformat(sep=" ", timespec="seconds")
+            move = rng.uniform(-0.02, 0.02)
+            btc *= 1 + move
+            eth *= 1 + move * 1.5
+            sol *= 1 + rng.uniform(-0.02, 0.02)
+            rows += [("BTC", ts, btc), ("ETH", ts, eth), ("SOL", ts, sol)]
+        conn.executemany("INSERT INTO trade_exits VALUES (?, ?, ?)", rows)
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_correlation_matrix(self):
+        from pt_correlation import CorrelationAnalyzer
+        analyzer = CorrelationAnalyzer(self.db_path)
+        matrix = analyzer.calculate_correlation_matrix(["BTC", "ETH", "SOL"])
+        self.assertAlmostEqual(matrix["BTC"]["ETH"], 1.0, places=2)
+        self.assertAlmostEqual(matrix["ETH"]["BTC"], matrix["BTC"]["ETH"])
+        self.assertLess(abs(matrix["BTC"]["SOL"]), 0.9)
+        self.assertNotIn("BTC", matrix["BTC"])
+
+    def test_correlation_array_dtype(self):
+        import numpy as np
+        from pt_correlation import CorrelationAnalyzer
+        analyzer = CorrelationAnalyzer(self.db_path)
+        arr, index = analyzer.calculate_correlation_array(["BTC", "ETH", "SOL"], dtype=np.float32)
+        self.assertEqual(arr.dtype, np.float32)
+        self.assertEqual(index, ["BTC", "ETH", "SOL"])
+        self.assertAlmostEqual(float(arr[0, 1]), 1.0, places=2)
+
+    def test_insufficient_history(self):
+        from pt_correlation import CorrelationAnalyzer
+        analyzer = CorrelationAnalyzer(self.db_path)
+        matrix = analyzer.calculate_correlation_matrix(["BTC", "DOGE"])
+        self.assertEqual(matrix["BTC"]["DOGE"], 0.0)
+
+    def test_diversification_alert(self):
+        from pt_correlation import CorrelationAnalyzer
+        analyzer = CorrelationAnalyzer(self.db_path)
+        alert = analyzer.detect_diversification_alert(["BTC", "SOL"], "ETH")
+        self.assertIsNotNone(alert)
+        self.assertEqual(alert.symbol_b, "BTC")
+        self.assertEqual(alert.alert_type, "DIVERSIFICATION_ALERT")
+        self.assertIsNone(analyzer.detect_diversification_alert(["BTC"], "DOGE"))
+
+    def test_correlation_refresh_reads_db(self):
+        import sqlite3
+        from pt_correlation import CorrelationAnalyzer
+        analyzer = CorrelationAnalyzer(self.db_path)
+        before = analyzer.calculate_correlation_matrix(["BTC", "SOL"])["BTC"]["SOL"]
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "UPDATE trade_exits SET close_price = (SELECT b.close_price FROM trade_exits b "
+            "WHERE b.symbol = 'BTC' AND b.timestamp = trade_exits.timestamp) "
+            "WHERE symbol = 'SOL'"
+        )
+        conn.commit()
+        conn.close()
+        # a refresh sees the new prices at once; only the diversification
+        # check reuses the portfolio returns just fetched
+        after = analyzer.calculate_correlation_matrix(["BTC", "SOL"])["BTC"]["SOL"]
+        self.assertLess(before, 0.9)
+        self.assertAlmostEqual(after, 1.0, places=6)
+
+    def test_correlation_history(self):
+        from pt_correlation import CorrelationAnalyzer
+        analyzer = CorrelationAnalyzer(self.db_path)
+        history = analyzer.get_correlation_history("BTC", "ETH")
+        self.assertGreater(len(history), 0)
+        self.assertAlmostEqual(history["correlation"].iloc[-1], 1.0, places=2)
+
+    def test_numpy_fallback_matches_kernel(self):
+        import numpy as np
+        from pt_correlation import (
+            NUMBA_AVAILABLE, _correlation, _correlation_numpy, _make_correlation_kernel,
+        )
+        rng = np.random.default_rng(1)
+        for width in (6, 24):
+            returns = rng.normal(size=(50, width))
+            np.testing.assert_allclose(_correlation(returns), _correlation_numpy(returns), atol=1e-9)
+        if NUMBA_AVAILABLE:
+            # the unrolled kernel compiles in the background; check it directly
+            returns = rng.normal(size=(50, 3))
+            np.testing.assert_allclose(
+                _make_correlation_kernel(3)(returns), _correlation_numpy(returns), atol=1e-9
+            )
+
+
+# =============================================================================
+# NOTIFICATION TESTS
+# =============================================================================
+
+class TestNotifications(unittest.TestCase):
+    """Tests for pt_notifications.py"""
+
+    def setUp(self):
+        import tempfile
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmpdir.name) / "notifications.db"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_unavailable_notifier_logs_failure(self):
+        import asyncio
+        from pt_config import NotificationConfig
+        from pt_notifications import NotificationDatabase, SlackNotifier
+        db = NotificationDatabase(self.db_path)
+        notifier = SlackNotifier(NotificationConfig(), db)
+        self.assertFalse(asyncio.run(notifier.send("hello")))
+        records = db.get_notifications()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].platform, "slack")
+        self.assertFalse(records[0].success)
+        self.assertIn("not configured", records[0].error_message)
+        db.close()
+
+    def test_queued_logs_are_batched(self):
+        import asyncio
+        import threading
+        from unittest import mock
+        from pt_notifications import NotificationDatabase
+        db = NotificationDatabase(self.db_path)
+
+        async def burst():
+            for i in range(50):
+                await db.alog_notification(
+                    level="info", platform="email", message=f"m{i}", success=True
+                )
+            await db.flush()
+
+        threads = []
+        write = db.log_notifications
+
+        def log_notifications(records):
+            threads.append(threading.current_thread().name)
+            write(records)
+
+        with mock.patch.object(db, "log_notifications", log_notifications):
+            asyncio.run(burst())
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("notif-db"))
+        self.assertEqual(len(db.get_notifications(limit=100)), 50)
+        db.close()
+
+    def test_send_fans_out_concurrently(self):
+        import asyncio
+        import time
+        from pt_config import NotificationConfig
+        from pt_notifications import NotificationManager
+
+        class SlowNotifier:
+            def __init__(self, fail=False):
+                self.fail = fail
+
+            def is_available(self):
+                return True
+
+            async def send(self, message, level, **kwargs):
+                await asyncio.sleep(0.2)
+                if self.fail:
+                    raise RuntimeError("boom")
+                return True
+
+        manager = NotificationManager(NotificationConfig(), db_path=self.db_path)
+        manager.notifiers["email"] = SlowNotifier()
+        manager.notifiers["discord"] = SlowNotifier()
+        manager.notifiers["telegram"] = SlowNotifier(fail=True)
+        start = time.monotonic()
+        results = asyncio.run(manager.send("hi"))
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(results, {"email": True, "discord": True, "telegram": False})
+        manager.db.close()
+
+    def test_discord_posts_webhook_payload(self):
+        import asyncio
+        from pt_config import NotificationConfig
+        from pt_notifications import (
+            HTTPX_AVAILABLE, DiscordNotifier, NotificationDatabase, NotificationLevel,
+        )
+        if not HTTPX_AVAILABLE:
+            self.skipTest("httpx not installed")
+        import httpx
+        posted = []
+
+        def handler(request):
+            posted.append(json.loads(request.content))
+            return httpx.Response(204)
+
+        db = NotificationDatabase(self.db_path)
+        notifier = DiscordNotifier(NotificationConfig(discord_webhook_url="https://hook.test/x"), db)
+
+        async def run():
+            notifier._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            notifier._client_loop = asyncio.get_running_loop()
+            ok = await notifier.send("filled", NotificationLevel.WARNING)
+            await notifier.close()
+            return ok
+
+        self.assertTrue(asyncio.run(run()))
+        self.assertEqual(posted[0]["content"], "filled")
+        self.assertEqual(posted[0]["embeds"][0]["color"], 0xFFAA00)
+        self.assertTrue(db.get_notifications(platform="discord")[0].success)
+        db.close()
+
+    def test_statistics(self):
+        from datetime import datetime, timedelta
+        from pt_notifications import NotificationDatabase
+        db = NotificationDatabase(self.db_path)
+        self.assertEqual(db.get_statistics()["total"], 0)
+        self.assertEqual(db.get_statistics()["by_level"], {})
+        db.log_notification("info", "email", "a", True)
+        db.log_notification("info", "discord", "b", False, "down")
+        db.log_notification("critical", "discord", "c", True)
+        stats = db.get_statistics()
+        self.assertEqual((stats["total"], stats["successful"], stats["failed"]), (3, 2, 1))
+        self.assertEqual(stats["by_level"]["info"], {"total": 2, "successful": 1})
+        self.assertEqual(stats["by_platform"]["discord"], {"total": 2, "successful": 1})
+        self.assertAlmostEqual(stats["success_rate"], 200 / 3)
+        future = db.get_statistics(start_date=datetime.now() + timedelta(days=1))
+        self.assertEqual(future["total"], 0)
+        db.close()
+
+    def test_metadata_round_trip(self):
+        from pt_notifications import NotificationDatabase
+        db = NotificationDatabase(self.db_path)
+        meta = {"trade_id": "t-1", "pnl": 1.5, "legs": [1, 2], 7: "seven"}
+        db.log_notification("info", "email", "filled", True, metadata=meta)
+        db.log_notification("info", "email", "plain", True)
+        records = {r.message: r for r in db.get_notifications()}
+        self.assertEqual(
+            records["filled"].metadata,
+            {"trade_id": "t-1", "pnl": 1.5, "legs": [1, 2], "7": "seven"},
+        )
+        self.assertIsNone(records["plain"].metadata)
+        db.close()
+
+    def test_destination_queue_keeps_order(self):
+        import asyncio
+        from pt_config import NotificationConfig
+        from pt_notifications import NotificationManager
+        events = []
+
+        class RecordingNotifier:
+            destination = "chat-1"
+
+            def is_available(self):
+                return True
+
+            async def send(self, message, level, **kwargs):
+                events.append(("start", message))
+                await asyncio.sleep(0.05)
+                events.append(("end", message))
+                return True
+
+        manager = NotificationManager(NotificationConfig(), db_path=self.db_path)
+        manager.notifiers["telegram"] = RecordingNotifier()
+
+        async def run():
+            results = await asyncio.gather(
+                manager.send("one", platforms=["telegram"]),
+                manager.send("two", platforms=["telegram"]),
+            )
+            await manager.close()
+            return results
+
+        results = asyncio.run(run())
+        self.assertEqual(results, [{"telegram": True}, {"telegram": True}])
+        self.assertEqual(
+            events, [("start", "one"), ("end", "one"), ("start", "two"), ("end", "two")]
+        )
+
+    def test_http_notifiers_share_one_client(self):
+        import asyncio
+        from unittest import mock
+        from pt_config import NotificationConfig
+        from pt_notifications import HTTPX_AVAILABLE, NotificationManager
+        if not HTTPX_AVAILABLE:
+            self.skipTest("httpx not installed")
+        import httpx
+        hosts, clients = [], []
+
+        def handler(request):
+            hosts.append(request.url.host)
+            return httpx.Response(200)
+
+        def new_client():
+            clients.append(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            return clients[-1]
+
+        config = NotificationConfig(
+            slack_webhook_url="https://slack.test/hook",
+            custom_webhook_url="https://custom.test/hook",
+        )
+        manager = NotificationManager(config, db_path=self.db_path)
+
+        async def run():
+            results = await manager.send("hi", platforms=["slack", "webhook"])
+            await manager.close()
+            return results
+
+        with mock.patch("pt_notifications.new_http_client", new_client):
+            results = asyncio.run(run())
+        self.assertEqual(results, {"slack": True, "webhook": True})
+        self.assertEqual(sorted(hosts), ["custom.test", "slack.test"])
+        self.assertEqual(len(clients), 1)
+        self.assertTrue(clients[0].is_closed)
+
+    def test_level_routing(self):
+        from unittest import mock
+        from pt_config import NotificationConfig
+        from pt_notifications import NotificationManager
+        config = NotificationConfig()
+        config.level_platforms["info"]["email"] = False
+        manager = NotificationManager(config, db_path=self.db_path)
+        self.assertEqual(manager._platforms_by_level["info"], ("discord", "telegram"))
+        self.assertEqual(manager._platforms_by_level["critical"], ("email", "discord", "telegram"))
+        with mock.patch.object(manager, "save_config"):
+            manager.update_config(platforms={**config.platforms, "discord": False})
+        self.assertEqual(manager._platforms_by_level["info"], ("telegram",))
+        manager.db.close()
+
+    def test_notification_filters(self):
+        from datetime import datetime, timedelta
+        from pt_notifications import NotificationDatabase
+        db = NotificationDatabase(self.db_path)
+        db.log_notification("info", "email", "a", True)
+        db.log_notification("error", "email", "b", False)
+        db.log_notification("error", "discord", "c", True)
+        messages = lambda **kw: sorted(r.message for r in db.get_notifications(**kw))
+        self.assertEqual(messages(), ["a", "b", "c"])
+        self.assertEqual(messages(level="error"), ["b", "c"])
+        self.assertEqual(messages(level="error", platform="email"), ["b"])
+        self.assertEqual(messages(success=True), ["a", "c"])
+        self.assertEqual(messages(start_date=datetime.now() + timedelta(hours=1)), [])
+        self.assertEqual(messages(end_date=datetime.now() + timedelta(hours=1)), ["a", "b", "c"])
+        self.assertEqual(len(db.get_notifications(limit=2)), 2)
+        self.assertIsInstance(db.get_notifications()[0].timestamp, datetime)
+        record = db.log_notification("info", "email", "d", True)
+        self.assertIsNotNone(record.id)
+        self.assertFalse(hasattr(record, "__dict__"))
+        db.close()
+
+    def test_print_statistics(self):
+        import contextlib
+        import io
+        from pt_config import NotificationConfig
+        from pt_notifications import NotificationManager
+        manager = NotificationManager(NotificationConfig(), db_path=self.db_path)
+        manager.db.log_notification("warning", "telegram", "x", True)
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            manager.print_statistics()
+        report = buf.getvalue()
+        self.assertIn("Total Notifications:           1", report)
+        self.assertIn("WARNING        1 sent  100.0% success", report)
+        self.assertIn("TELEGRAM       1 sent  100.0% success", report)
+        manager.db.close()
+
+    def test_database_reuses_one_connection(self):
+        import threading
+        from pt_notifications import NotificationDatabase
+        db = NotificationDatabase(self.db_path)
+        conn = db._conn
+        workers = [
+            threading.Thread(
+                target=lambda i=i: db.log_notification("info", "discord", f"m{i}", True)
+            )
+            for i in range(8)
+        ]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        self.assertIs(db._conn, conn)
+        self.assertEqual(len(db.get_notifications(platform="discord")), 8)
+        db.close()
+
+    def test_rate_limiter_window(self):
+        import asyncio
+        from datetime import timedelta
+        from unittest import mock
+        from pt_notifications import RateLimiter
+        clock = [100.0]
+        with mock.patch("pt_notifications.time.monotonic", lambda: clock[0]):
+            limiter = RateLimiter(2, period=timedelta(seconds=10))
+            acquire = lambda: asyncio.run(limiter.acquire())
+            self.assertTrue(acquire())
+            clock[0] = 105.0
+            self.assertTrue(acquire())
+            self.assertFalse(acquire())
+            # the first call leaves the window at 110, the second at 115
+            clock[0] = 110.0
+            self.assertTrue(acquire())
+            self.assertFalse(acquire())
+            clock[0] = 115.0
+            self.assertTrue(acquire())
+            limiter.reset()
+            self.assertTrue(acquire())
+            self.assertFalse(asyncio.run(RateLimiter(0).acquire()))
+
+
+# =============================================================================
+# RISK DASHBOARD TESTS
+# =============================================================================
+
+class TestRiskDashboard(unittest.TestCase):
+    """Tests for pt_risk_dashboard.py helpers and the sizing they drive"""
+
+    def test_matrix_colors(self):
+        import numpy as np
+        from pt_risk_dashboard import MATRIX_COLORS, color_indices, matrix_values
+        coins = ["BTC", "ETH", "SOL"]
+        matrix = {"BTC": {"ETH": 0.9, "SOL": 0.3}, "ETH": {"BTC": 0.9, "SOL": 0.7}}
+        vals = matrix_values(matrix, coins)
+        self.assertEqual(vals.dtype, np.float32)
+        np.testing.assert_allclose(np.diag(vals), 1.0)
+        self.assertEqual(vals[2, 0], 0.0)
+        colors = MATRIX_COLORS[color_indices(vals)]
+        # same thresholds as before: red > 0.7, green < 0.3, yellow otherwise
+        self.assertEqual(colors[0, 1], "#880000")
+        self.assertEqual(colors[0, 2], "#444400")
+        self.assertEqual(colors[1, 2], "#444400")
+        self.assertEqual(colors[2, 0], "#004400")
+        # the dashboard hands over calculate_correlation_array output directly
+        arr = vals.astype(np.float32)
+        np.testing.assert_array_equal(
+            MATRIX_COLORS[color_indices(matrix_values(arr, coins))], colors
+        )
+
+    def test_vectorized_sizing_matches_scalar(self):
+        import numpy as np
+        from pt_position_sizing import PositionSizer
+        sizer = PositionSizer(":memory:")
+        atr_pcts = [0.0, 0.5, 1.5, 3.0, 6.0, 9.0]
+        sizes = sizer.calculate_position_sizes(10000.0, np.array(atr_pcts), risk_pct=0.02)
+        for k, atr_pct in enumerate(atr_pcts):
+            rec = sizer.calculate_position_size(10000.0, atr_pct, 100.0, risk_pct=0.02)
+            self.assertAlmostEqual(sizes["position_size_usd"][k], rec.position_size_usd)
+            self.assertAlmostEqual(sizes["position_size_pct"][k], rec.position_size_pct)
+            self.assertAlmostEqual(sizes["risk_amount"][k], rec.risk_amount)
+            self.assertAlmostEqual(sizes["atr_pct"][k], rec.atr)
+        # the dashboard's Factor column: volatility tier only, no Kelly boost or clip
+        self.assertEqual(sizes["volatility_factor"].tolist(), [1.0, 1.5, 1.25, 1.0, 0.75, 0.75])
+        sizer._close()
+
+    def test_heatmap_ppm(self):
+        import numpy as np
+        from pt_risk_dashboard import heatmap_ppm
+        indices = np.array([[2, 0], [1, 2]], dtype=np.uint8)
+        ppm = heatmap_ppm(indices, 10, 6)
+        header = b"P6\n10 6\n255\n"
+        self.assertTrue(ppm.startswith(header))
+        pixels = np.frombuffer(ppm[len(header):], dtype=np.uint8).reshape(6, 10, 3)
+        # column 0 / row 0 is red, column 1 / row 0 yellow, column 0 / row 1 green
+        self.assertEqual(pixels[1, 1].tolist(), [0x88, 0, 0])
+        self.assertEqual(pixels[1, 6].tolist(), [0x44, 0x44, 0])
+        self.assertEqual(pixels[4, 1].tolist(), [0, 0x44, 0])
+        # cell borders are black
+        self.assertEqual(pixels[0].max(), 0)
+        self.assertEqual(pixels[:, 5].max(), 0)
+
+    def test_volatility_batch_matches_atr(self):
+        import sqlite3
+        import tempfile
+        from datetime import datetime, timedelta
+        from pt_position_sizing import PositionSizer
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "sizing.db")
+            conn = sqlite3.connect(db_path)
+            conn.execute(
+                "CREATE TABLE trade_exits (timestamp TEXT, symbol TEXT, "
+                "close_price REAL, high_price REAL, low_price REAL)"
+            )
+            rng = random.Random(3)
+            now = datetime.now()
+            rows = []
+            for symbol, count in (("BTC", 25), ("ETH", 22), ("SOL", 5)):
+                price = 100.0
+                for k in range(count, 0, -1):
+                    ts = (now - timedelta(hours=k)).strftime("%Y-%m-%d %H:%M:%S")
+                    price *= 1 + rng.uniform(-0.03, 0.03)
+                    rows.append((ts, symbol, price, price * 1.01, price * 0.985))
+            conn.executemany("INSERT INTO trade_exits VALUES (?, ?, ?, ?, ?)", rows)
+            conn.commit()
+            conn.close()
+
+            sizer = PositionSizer(db_path)
+            metrics = sizer.get_volatility_batch(["BTC", "ETH", "SOL", "DOGE"])
+            self.assertEqual(sorted(metrics), ["BTC", "ETH"])
+            for symbol, m in metrics.items():
+                self.assertAlmostEqual(m.atr, sizer.calculate_atr(symbol), places=9)
+                self.assertGreater(m.atr_pct_position, 0)
+            sizer._close()
+
+
+# =============================================================================
+# VOLUME TESTS
+# =============================================================================
+
+class TestVolume(unittest.TestCase):
+    """Tests for pt_volume.py analysis"""
+
+    def test_analyze_series_matches_streaming(self):
+        from pt_volume import CandleVolumeData, VolumeAnalyzer
+        rng = random.Random(5)
+        volumes = [rng.uniform(100, 2000) for _ in range(120)]
+        volumes[60] = 50000.0  # one spike so an anomaly row is covered
+        candles = [
+            CandleVolumeData(1_700_000_000 + 3600 * i, 1.0, 1.0, 1.0, rng.uniform(90, 110), v)
+            for i, v in enumerate(volumes)
+        ]
+        streaming = VolumeAnalyzer()
+        expected = []
+        for c in candles:
+            prev_ema = expected[-1].volume_ema if expected else None
+            expected.append(streaming.analyze_candle(c, prev_ema))
+
+        got = VolumeAnalyzer().analyze_series(candles)
+        self.assertEqual(len(got), len(expected))
+        self.assertTrue(any(m.anomaly for m in got))
+        for g, e in zip(got, expected):
+            self.assertEqual((g.timestamp, g.trend, g.anomaly, g.anomaly_type),
+                             (e.timestamp, e.trend, e.anomaly, e.anomaly_type))
+            for f in ("volume_sma", "volume_ema", "vwap", "volume_ratio", "z_score"):
+                self.assertAlmostEqual(getattr(g, f), getattr(e, f), places=6)
+
+        # a reset analyzer streams a new series exactly like a fresh one
+        streaming.reset()
+        again = []
+        for c in candles:
+            again.append(streaming.analyze_candle(c, again[-1].volume_ema if again else None))
+        self.assertEqual(again, expected)
+
+        tail = VolumeAnalyzer().analyze_series(candles, last=50)
+        self.assertEqual([m.timestamp for m in tail], [m.timestamp for m in expected[-50:]])
+        self.assertEqual(VolumeAnalyzer().analyze_series([]), [])
+
+
+# =============================================================================
+# TRADER TESTS
+# =============================================================================
+
+def _scalar_trailing_step(trader, symbol, base_pm_line, current_sell_price):
+    """The per-coin trailing PM update manage_trades ran before it used arrays."""
+    trail_gap = trader.trailing_gap_pct / 100.0
+    settings_sig = (
+        float(trader.trailing_gap_pct),
+        float(trader.pm_start_pct_no_dca),
+        float(trader.pm_start_pct_with_dca),
+    )
+    if (symbol not in trader._pm_line) or (
+        trader._pm_settings_sig.get(symbol) != settings_sig
+    ):
+        active, line, peak, was_above = False, base_pm_line, 0.0, False
+    else:
+        active = trader._pm_active[symbol]
+        line = trader._pm_line[symbol]
+        peak = trader._pm_peak[symbol]
+        was_above = trader._pm_was_above[symbol]
+        if not active:
+            line = base_pm_line
+        elif line < base_pm_line:
+            line = base_pm_line
+
+    above_now = current_sell_price >= line
+    if (not active) and above_now:
+        active = True
+        peak = current_sell_price
+    hit = False
+    if active:
+        if current_sell_price > peak:
+            peak = current_sell_price
+        new_line = peak * (1.0 - trail_gap)
+        if new_line < base_pm_line:
+            new_line = base_pm_line
+        if new_line > line:
+            line = new_line
+        hit = was_above and (current_sell_price < line)
+    return active, line, peak, above_now, hit, settings_sig
+
+
+def _scalar_cost_basis(orders, quantity):
+    """The per-execution loop calculate_cost_basis ran before it used arrays."""
+    buy_orders = [o for o in orders if o["side"] == "buy" and o["state"] == "filled"]
+    buy_orders.sort(key=lambda x: x["created_at"], reverse=True)
+    remaining_quantity = quantity
+    total_cost = 0.0
+    for order in buy_orders:
+        for execution in order.get("executions", []):
+            qty = float(execution["quantity"])
+            price = float(execution["effective_price"])
+            if remaining_quantity <= 0:
+                break
+            if qty > remaining_quantity:
+                total_cost += remaining_quantity * price
+                remaining_quantity = 0
+            else:
+                total_cost += qty * price
+                remaining_quantity -= qty
+        if remaining_quantity <= 0:
+            break
+    return total_cost / quantity if quantity > 0 else 0.0
+
+
+def _forward_dca_seed(path, cutoff):
+    """Full front-to-back scan the DCA window was seeded with before the tail reader."""
+    buy_ts, last_sell_ts = {}, {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+                ts_f = float(obj.get("ts", None))
+            except Exception:
+                continue
+            base = str(obj.get("symbol", "")).upper().strip().split("-")[0].strip()
+            if not base:
+                continue
+            side = str(obj.get("side", "")).lower()
+            if side == "sell":
+                last_sell_ts[base] = max(ts_f, last_sell_ts.get(base, 0.0))
+            elif side == "buy" and obj.get("tag", None) == "DCA":
+                buy_ts.setdefault(base, []).append(ts_f)
+    for base, ts_list in buy_ts.items():
+        last_sell = last_sell_ts.get(base, 0.0)
+        buy_ts[base] = sorted(t for t in ts_list if t > last_sell and t >= cutoff)
+    return buy_ts, last_sell_ts
+
+
+class TestTrader(unittest.TestCase):
+    """Tests for pt_trader.py bookkeeping (no API calls)"""
+
+    def _trader(self):
+        import threading
+        import pt_trader
+        trader = pt_trader.CryptoAPITrading.__new__(pt_trader.CryptoAPITrading)
+        trader._pm_active, trader._pm_line, trader._pm_peak = {}, {}, {}
+        trader._pm_was_above, trader._pm_settings_sig = {}, {}
+        trader.trailing_gap_pct = 0.5
+        trader.pm_start_pct_no_dca = 5.0
+        trader.pm_start_pct_with_dca = 2.5
+        trader.cost_basis = {}
+        trader._cost_basis_qty = {}
+        trader._cost_basis_dirty = False
+        trader.dca_window_seconds = 24 * 60 * 60
+        trader._dca_buy_ts, trader._dca_last_sell_ts = {}, {}
+        trader._pending_status, trader._pending_lines = None, {}
+        trader._pending_lock = threading.Lock()
+        trader._flush_io_lock = threading.Lock()
+        return trader
+
+    def test_trailing_pm_matches_scalar(self):
+        import numpy as np
+        old, new = self._trader(), self._trader()
+        # (base PM line, sell price) per coin per tick
+        ticks = [
+            # first tick, no state: BTC starts above the line, ETH/SOL below
+            {"BTC": (105.0, 106.0), "ETH": (105.0, 100.0), "SOL": (10.5, 10.0)},
+            # BTC peaks, ETH activates, SOL still below
+            {"BTC": (105.0, 110.0), "ETH": (105.0, 105.0), "SOL": (10.5, 10.2)},
+            # ETH holds above; SOL's cost basis drops after a DCA (lower PM line)
+            {"BTC": (105.0, 109.8), "ETH": (105.0, 107.0), "SOL": (10.25, 10.3)},
+            # BTC crosses from above to below its trailing line; ETH DCA while active
+            {"BTC": (105.0, 109.0), "ETH": (103.0, 106.9), "SOL": (10.25, 10.4)},
+            # BTC sold and cleared, so it starts fresh
+            {"BTC": (105.0, 104.0), "ETH": (103.0, 106.0), "SOL": (10.25, 10.1)},
+            # a settings change resets every coin's state
+            "gap",
+            {"BTC": (105.0, 105.5), "ETH": (103.0, 106.5), "SOL": (10.25, 10.6)},
+            {"BTC": (105.0, 104.9), "ETH": (103.0, 103.1), "SOL": (10.25, 10.3)},
+        ]
+        seen = set()
+        for tick in ticks:
+            if tick == "gap":
+                old.trailing_gap_pct = new.trailing_gap_pct = 1.0
+                continue
+            symbols = list(tick)
+            base_pm = np.array([tick[s][0] for s in symbols])
+            sell = np.array([tick[s][1] for s in symbols])
+            sig = (float(new.trailing_gap_pct), 5.0, 2.5)
+            trail = new._update_trailing_pm(symbols, base_pm, sell, sig)
+            for s in symbols:
+                active, line, peak, above_now, hit, old_sig = _scalar_trailing_step(
+                    old, s, *tick[s]
+                )
+                known, n_active, n_line, n_peak, n_above, n_hit = trail[s]
+                self.assertEqual(
+                    (n_active, n_line, n_peak, n_above, n_hit),
+                    (active, line, peak, above_now, hit),
+                )
+                seen.add(("hit", hit))
+                seen.add(("known", known))
+                # store the result the way manage_trades does (a hit sells and clears)
+                for trader, values in ((old, (active, line, peak, above_now)),
+                                       (new, (n_active, n_line, n_peak, n_above))):
+                    if hit:
+                        trader._clear_trailing_pm(s)
+                        continue
+                    trader._pm_settings_sig[s] = old_sig
+                    (trader._pm_active[s], trader._pm_line[s],
+                     trader._pm_peak[s], trader._pm_was_above[s]) = values
+        self.assertEqual(seen, {("hit", True), ("hit", False), ("known", True), ("known", False)})
+        self.assertEqual(new._update_trailing_pm([], np.array([]), np.array([]), sig), {})
+
+    def _stub_account(self, trader, holdings, orders):
+        """Serve get_holdings / get_orders_many from dicts the test mutates."""
+        trader.get_holdings = lambda: {
+            "results": [
+                {"asset_code": a, "total_quantity": str(q)} for a, q in holdings.items()
+            ]
+        }
+        trader.get_orders_many = lambda symbols: {
+            s: {"results": orders.get(s, [])} for s in symbols
+        }
+
+    def test_iter_lines_reversed(self):
+        import tempfile
+        from pt_trader import _iter_lines_reversed
+        lines = [b'{"ts": %d, "side": "buy"}' % i for i in range(40)] + [b"", b"x" * 50]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "lines.jsonl")
+            for data in (b"\n".join(lines), b"\n".join(lines) + b"\n", b""):
+                with open(path, "wb") as f:
+                    f.write(data)
+                for block_size in (1, 3, 7, 64, 65536):
+                    self.assertEqual(
+                        list(_iter_lines_reversed(path, block_size=block_size)),
+                        data.split(b"\n")[::-1],
+                    )
+
+    def test_dca_seed_matches_forward_scan(self):
+        import tempfile
+        import time
+        from unittest import mock
+        import pt_trader
+        rng = random.Random(11)
+        now = time.time()
+        records = []
+        ts = now - 3 * 86400
+        while ts < now:
+            side = rng.choice(["buy", "buy", "buy", "sell"])
+            rec = {"ts": ts, "side": side, "symbol": rng.choice(["BTC-USD", "ETH-USD", "SOL-USD"])}
+            if side == "buy":
+                rec["tag"] = rng.choice(["DCA", "DCA", None])
+            records.append(json.dumps(rec))
+            ts += rng.uniform(60, 3600)
+        # lines the byte checks and the ts regex must not trip over
+        records[-5:-5] = [
+            "",
+            'not json, but a DCA sell"',
+            '{"side": "sell", "ts": %r, "symbol": "XRP-USD"}' % (now - 10),
+        ]
+        cutoff = now - 86400
+        with tempfile.TemporaryDirectory() as tmp, self._hub_files(tmp):
+            for trailer in ("\n", ""):
+                with open(pt_trader.TRADE_HISTORY_PATH, "w") as f:
+                    f.write("\n".join(records) + trailer)
+                trader = self._trader()
+                read = []
+
+                def reader(path, _iter=pt_trader._iter_lines_reversed):
+                    for line in _iter(path, block_size=97):
+                        read.append(line)
+                        yield line
+
+                with mock.patch.object(pt_trader, "_iter_lines_reversed", reader), \
+                        mock.patch.object(pt_trader.time, "time", return_value=now):
+                    trader._seed_dca_window_from_history()
+                self.assertLess(len(read), len(records) / 2)  # stopped at the window
+                buy_ts, last_sell_ts = _forward_dca_seed(pt_trader.TRADE_HISTORY_PATH, cutoff)
+                self.assertEqual(
+                    {b: v.tolist() for b, v in trader._dca_buy_ts.items()},
+                    buy_ts,
+                )
+                self.assertTrue(any(buy_ts.values()))
+                # Reading stops an hour past the window; an older sell cannot
+                # exclude a buy inside it, so those are the only ones left out
+                stop_before = cutoff - 3600.0
+                self.assertEqual(
+                    trader._dca_last_sell_ts,
+                    {b: t for b, t in last_sell_ts.items() if t >= stop_before},
+                )
+                self.assertIn("XRP", trader._dca_last_sell_ts)
+
+    def test_price_batch_falls_back_per_symbol(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest import mock
+        import pt_trader
+        prices = {"BTC-USD": 40000.0, "ETH-USD": 2000.0, "DOGE-USD": 0.1, "SOL-USD": 100.0}
+        requests_seen = []
+
+        def make_api_request(method, path, body=""):
+            symbols = [q.split("=", 1)[1] for q in path.split("?", 1)[1].split("&")]
+            requests_seen.append(symbols)
+            if any(s not in prices for s in symbols):
+                # an unlisted symbol rejects the whole request
+                return {"type": "validation_error", "errors": [{"detail": "bad symbol"}]}
+            return {"results": [
+                {"symbol": s, "ask_inclusive_of_buy_spread": str(prices[s] * 1.001),
+                 "bid_inclusive_of_sell_spread": str(prices[s] * 0.999)}
+                for s in symbols
+            ]}
+
+        symbols = ["BTC-USD", "BNB-USD", "ETH-USD", "DOGE-USD", "SOL-USD", "USDC-USD"]
+        for batch_size in (20, 2):
+            trader = self._trader()
+            trader.make_api_request = make_api_request
+            trader.quote_ttl_s = 0.0
+            trader._last_good_bid_ask = {}
+            trader._io_pool = ThreadPoolExecutor(max_workers=2)
+            requests_seen.clear()
+            with mock.patch.object(pt_trader, "QUOTE_BATCH_SIZE", batch_size):
+                buy, sell, valid = trader.get_price(symbols)
+            trader._io_pool.shutdown()
+            self.assertEqual(sorted(valid), sorted(prices))
+            self.assertAlmostEqual(buy["BTC-USD"], 40040.0)
+            self.assertAlmostEqual(sell["SOL-USD"], 99.9)
+            self.assertNotIn("BNB-USD", buy)
+            # only the batch holding BNB was retried one symbol at a time
+            self.assertIn(["BNB-USD"], requests_seen)
+            self.assertEqual(["ETH-USD"] in requests_seen, batch_size == 20)
+
+    def _hub_files(self, tmp):
+        """Point the trader's hub files into tmp."""
+        from unittest import mock
+        import pt_trader
+        return mock.patch.multiple(
+            pt_trader,
+            TRADE_HISTORY_PATH=os.path.join(tmp, "trade_history.jsonl"),
+            DCA_STATE_PATH=os.path.join(tmp, "dca_state.json"),
+            TRADER_STATUS_PATH=os.path.join(tmp, "trader_status.json"),
+        )
+
+    def test_dca_state_snapshot(self):
+        import tempfile
+        import time
+        from array import array
+        import pt_trader
+        now = time.time()
+        with tempfile.TemporaryDirectory() as tmp, self._hub_files(tmp):
+            with open(pt_trader.TRADE_HISTORY_PATH, "w") as f:
+                f.write(json.dumps({"ts": now - 60, "side": "buy", "symbol": "BTC-USD"}) + "\n")
+            trader = self._trader()
+            trader._dca_buy_ts = {"BTC": array("d", [now - 7200, now - 3600])}
+            trader._dca_last_sell_ts = {"BTC": now - 10000, "ETH": now - 500}
+            trader._save_dca_state()
+
+            # same trade history size: the snapshot is reused as-is
+            restored = self._trader()
+            self.assertTrue(restored._load_dca_state())
+            self.assertEqual(restored._dca_buy_ts, trader._dca_buy_ts)
+            self.assertEqual(restored._dca_last_sell_ts, trader._dca_last_sell_ts)
+
+            # a trade written since the snapshot means it is stale
+            with open(pt_trader.TRADE_HISTORY_PATH, "a") as f:
+                f.write(json.dumps({"ts": now, "side": "sell", "symbol": "BTC-USD"}) + "\n")
+            self.assertFalse(self._trader()._load_dca_state())
+
+            # so is an unreadable one
+            trader._save_dca_state()
+            self.assertTrue(self._trader()._load_dca_state())
+            with open(pt_trader.DCA_STATE_PATH, "w") as f:
+                f.write('{"trade_history_size": ')
+            self.assertFalse(self._trader()._load_dca_state())
+            os.remove(pt_trader.DCA_STATE_PATH)
+            self.assertFalse(self._trader()._load_dca_state())
+
+            # buys older than the window or before the last sell are pruned on load
+            trader._dca_buy_ts = {
+                "BTC": array("d", [now - 90000, now - 3600]),
+                "ETH": array("d", [now - 1000, now - 100]),
+            }
+            trader._save_dca_state()
+            restored = self._trader()
+            self.assertTrue(restored._load_dca_state())
+            self.assertEqual(restored._dca_buy_ts["BTC"].tolist(), [now - 3600])
+            self.assertEqual(restored._dca_buy_ts["ETH"].tolist(), [now - 100])
+
+    def test_cost_basis_matches_scalar(self):
+        def buy(created_at, *fills, side="buy", state="filled"):
+            return {
+                "side": side, "state": state, "created_at": created_at,
+                "executions": [
+                    {"quantity": str(q), "effective_price": str(p)} for q, p in fills
+                ],
+            }
+
+        history = [
+            buy("2024-01-01T00:00:00Z", (0.5, 100.0)),
+            buy("2024-01-03T00:00:00Z", (0.25, 120.0), (0.125, 118.0)),
+            buy("2024-01-02T00:00:00Z", (1.0, 90.0)),
+            buy("2024-01-04T00:00:00Z", (9.0, 1.0), side="sell"),
+            buy("2024-01-05T00:00:00Z", (9.0, 1.0), state="canceled"),
+        ]
+        holdings = {
+            "EXACT": 0.375,  # newest order's executions cover it exactly
+            "EDGE": 1.375,  # ends exactly on an older order
+            "PART": 0.5,  # only part of the crossing execution counts
+            "MORE": 5.0,  # more than every recorded buy
+            "NONE": 0.0,
+        }
+        trader = self._trader()
+        self._stub_account(
+            trader, holdings, {f"{a}-USD": history for a in holdings}
+        )
+        got = trader.calculate_cost_basis()
+        self.assertEqual(sorted(got), sorted(holdings))
+        for asset, qty in holdings.items():
+            self.assertIs(type(got[asset]), float)
+            self.assertAlmostEqual(got[asset], _scalar_cost_basis(history, qty), places=9)
+
+    def test_incremental_cost_basis_matches_rebuild(self):
+        trader = self._trader()
+        holdings = {"BTC": 0.01, "ETH": 0.5}
+        orders = {
+            "BTC-USD": [
+                {"side": "buy", "state": "filled", "created_at": "2024-01-01T00:00:00Z",
+                 "executions": [{"quantity": "0.01", "effective_price": "40000"}]},
+            ],
+            "ETH-USD": [
+                {"side": "buy", "state": "filled", "created_at": "2024-01-01T00:00:00Z",
+                 "executions": [{"quantity": "0.5", "effective_price": "2000"}]},
+            ],
+        }
+        self._stub_account(trader, holdings, orders)
+        trader.cost_basis = trader.calculate_cost_basis()
+
+        def fill(symbol, side, qty, price, created_at):
+            base = symbol.split("-")[0]
+            holdings[base] = holdings.get(base, 0.0) + (qty if side == "buy" else -qty)
+            if holdings[base] <= 0:
+                del holdings[base]
+            orders.setdefault(symbol, []).append(
+                {"side": side, "state": "filled", "created_at": created_at,
+                 "executions": [{"quantity": str(qty), "effective_price": str(price)}]}
+            )
+            trader._apply_fill_to_cost_basis(symbol, side, qty, price)
+
+        # a buy on top of holdings, and a first buy of a coin not held
+        fill("BTC-USD", "buy", 0.005, 43000.0, "2024-02-01T00:00:00Z")
+        fill("SOL-USD", "buy", 2.0, 100.0, "2024-02-02T00:00:00Z")
+        self.assertTrue(trader._cost_basis_in_sync(trader.get_holdings()))
+        rebuilt = self._trader()
+        self._stub_account(rebuilt, holdings, orders)
+        expected = rebuilt.calculate_cost_basis()
+        self.assertEqual(sorted(trader.cost_basis), sorted(expected))
+        for asset, value in expected.items():
+            self.assertAlmostEqual(trader.cost_basis[asset], value, places=6)
+
+        # a full sell drops the coin and stays in sync
+        fill("ETH-USD", "sell", 0.5, 2100.0, "2024-02-03T00:00:00Z")
+        self.assertNotIn("ETH", trader.cost_basis)
+        self.assertNotIn("ETH", trader._cost_basis_qty)
+        self.assertTrue(trader._cost_basis_in_sync(trader.get_holdings()))
+
+        # a partial sell can't be folded in, so the next check asks for a rebuild
+        fill("BTC-USD", "sell", 0.005, 44000.0, "2024-02-04T00:00:00Z")
+        self.assertTrue(trader._cost_basis_dirty)
+        self.assertFalse(trader._cost_basis_in_sync(trader.get_holdings()))
+
+        # ... and so does a fill we have no price for
+        trader.cost_basis = trader.calculate_cost_basis()
+        self.assertTrue(trader._cost_basis_in_sync(trader.get_holdings()))
+        trader._apply_fill_to_cost_basis("SOL-USD", "buy", 1.0, None)
+        self.assertTrue(trader._cost_basis_dirty)
+        self.assertFalse(trader._cost_basis_in_sync(trader.get_holdings()))
+
+
 # =============================================================================
 # RUNNER
 # =============================================================================